@@ -0,0 +1,111 @@
+"""Benchmark HTML extraction throughput (MB/s): parse-once lxml vs BeautifulSoup.
+
+Usage:
+    python -m scripts.bench_extraction              # pages from HTTP_CACHE_DIR, else synthetic
+    python -m scripts.bench_extraction page1.html dir/ ...
+
+Both paths run link discovery plus ``extract_sections`` on every page, the work
+the scraper does per fetched document.
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from src.app.config import get_settings
+from src.extraction.document import Document
+from src.extraction.extractor import extract_sections
+from src.scraping.discovery import JOB_LINK_PATTERNS, discover_job_links
+
+
+def soup_discover(html: str) -> list[str]:
+    soup = BeautifulSoup(html, "lxml")
+    return [a["href"] for a in soup.find_all("a", href=True) if any(p.search(a["href"]) for p in JOB_LINK_PATTERNS)]
+
+
+def soup_extract(html: str) -> dict:
+    """The BeautifulSoup extract_sections this module replaced."""
+    clean = lambda text: re.sub(r"\s+", " ", text).strip()  # noqa: E731
+    soup = BeautifulSoup(html, "lxml")
+    for tag in soup(["script", "style", "nav", "footer", "header"]):
+        tag.decompose()
+    title = clean(soup.title.string) if soup.title and soup.title.string else None
+    if not title and soup.find("h1"):
+        title = clean(soup.find("h1").get_text())
+    meta = soup.find("meta", attrs={"property": "og:site_name"})
+    company = clean(meta["content"]) if meta and meta.get("content") else None
+    if not company:
+        el = soup.find(class_=re.compile("company|employer", re.I))
+        company = clean(el.get_text()) if el else None
+    el = soup.find(class_=re.compile("location", re.I))
+    location = clean(el.get_text()) if el else None
+    body_text = clean(soup.get_text(" "))
+    main = soup.find("main") or soup.find("article")
+    description = clean(main.get_text(" ")) if main else body_text
+    return {"title": title, "company": company, "location": location, "description": description}
+
+
+def synthetic_page(i: int) -> str:
+    jobs = "".join(
+        f'<li class="job"><a href="/jobs/{i}-{n}">Backend Developer {n}</a>'
+        f'<span class="job-location">Tel Aviv, Israel</span><p>{"Build services in Python. " * 20}</p></li>'
+        for n in range(40)
+    )
+    return (
+        f"<html><head><title>Careers {i}</title><meta property='og:site_name' content='Acme'>"
+        f"<script>{'var x = 1;' * 500}</script><style>{'.a{color:red}' * 200}</style></head>"
+        f"<body><header><nav>{'<a href=/about>About</a>' * 30}</nav></header>"
+        f"<main><h1>Open positions</h1><ul>{jobs}</ul></main><footer>{'Links ' * 100}</footer></body></html>"
+    )
+
+
+def load_pages(paths: list[str]) -> list[str]:
+    files: list[Path] = []
+    for raw in paths or [get_settings().http_cache_dir]:
+        path = Path(raw)
+        files.extend(sorted(path.glob("*.html")) if path.is_dir() else [path] if path.exists() else [])
+    pages = [f.read_text(encoding="utf-8", errors="replace") for f in files]
+    return pages or [synthetic_page(i) for i in range(50)]
+
+
+def bench(name: str, fn, pages: list[str], rounds: int) -> float:
+    size_mb = sum(len(p.encode("utf-8")) for p in pages) / 1e6
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for page in pages:
+            fn(page)
+    elapsed = time.perf_counter() - started
+    rate = size_mb * rounds / elapsed
+    print(f"{name:<14} {rate:8.2f} MB/s  {elapsed / (rounds * len(pages)) * 1000:7.2f} ms/page")
+    return rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="*", help="HTML files or directories of *.html")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = load_pages(args.paths)
+    print(f"{len(pages)} pages, {sum(len(p) for p in pages) / 1e6:.2f} MB")
+
+    def parse_once(html: str):
+        doc = Document(html)
+        discover_job_links(doc, "https://example.com")
+        extract_sections(doc)
+
+    def beautifulsoup(html: str):
+        soup_discover(html)
+        soup_extract(html)
+
+    old = bench("beautifulsoup", beautifulsoup, pages, args.rounds)
+    new = bench("lxml parse-once", parse_once, pages, args.rounds)
+    print(f"speed-up: {new / old:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Benchmark the geo resolver: coverage and throughput on location strings.
+
+Usage:
+    python -m scripts.bench_geo                 # built-in sample corpus
+    python -m scripts.bench_geo locations.txt   # one location per line
+    python -m scripts.bench_geo --db            # distinct Job.location values from the local DB
+
+Compares the indexed resolver against the previous exact-dict lookup.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from src.filtering import geo_il
+
+SAMPLE = [
+    "Tel Aviv, Israel",
+    "Tel Aviv-Yafo, Tel Aviv District, Israel",
+    "Tel-Aviv",
+    "TLV",
+    "Herzliya Pituach",
+    "Herzliya, Israel (Hybrid)",
+    "Petach Tikva",
+    "Petah Tikva | Hybrid",
+    "Ra'anana",
+    "Haifa (MATAM)",
+    "Jerusalem, Israel",
+    "Be'er Sheva",
+    "Rishon LeZion",
+    "Modi'in",
+    "Yokneam Illit",
+    "Remote - Israel",
+    "Israel",
+    "IL",
+    "תל אביב",
+    "תל אביב-יפו",
+    "ת\"א",
+    "הרצליה פיתוח",
+    "פתח תקווה",
+    "בתל אביב",
+    "חיפה",
+    "באר שבע",
+    "ירושלים",
+    "רמת גן, ישראל",
+    "London, UK",
+    "New York, NY",
+    "Berlin, Germany",
+    "Kyiv, Ukraine",
+    "San Francisco, CA",
+    "Chicago, IL",
+    "Springfield, IL, United States",
+    "Indianapolis, IN",
+    "Austin, TX",
+    "",
+]
+
+
+def legacy_resolve(raw: str | None):
+    """The exact-dict resolver this module used before the location index."""
+    loc = (raw or "").strip().lower()
+    if not loc:
+        return False, geo_il.REGION_DEFAULT, None
+    if "remote" in loc:
+        return True, geo_il.CITY_TO_REGION["remote"], "remote"
+    if loc in geo_il.CITY_TO_REGION:
+        return True, geo_il.CITY_TO_REGION[loc], loc
+    simple = loc.replace(",", " ").replace("-", " ").strip()
+    if simple in geo_il.CITY_TO_REGION:
+        return True, geo_il.CITY_TO_REGION[simple], simple
+    return False, geo_il.REGION_DEFAULT, loc
+
+
+def load_corpus(args) -> list[str]:
+    if args.db:
+        from sqlmodel import select
+
+        from src.db.models import Job
+        from src.db.session import session_scope
+
+        with session_scope() as session:
+            return [loc for loc in session.exec(select(Job.location).distinct()) if loc]
+    if args.path:
+        return [line.strip() for line in Path(args.path).read_text(encoding="utf-8").splitlines() if line.strip()]
+    return SAMPLE
+
+
+def bench(name: str, fn, corpus: list[str], rounds: int) -> None:
+    matched = sum(1 for loc in corpus if fn(loc)[0])
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for loc in corpus:
+            fn(loc)
+    elapsed = time.perf_counter() - started
+    calls = rounds * len(corpus)
+    print(
+        f"{name:<14} coverage {matched}/{len(corpus)} ({matched / max(len(corpus), 1):.0%})  "
+        f"{calls / elapsed:,.0f} lookups/s  {elapsed / max(calls, 1) * 1e6:.2f} µs/lookup"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", nargs="?", help="file with one location string per line")
+    parser.add_argument("--db", action="store_true", help="read distinct job locations from the database")
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--show", action="store_true", help="print each resolution")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args)
+    if args.show:
+        for loc in corpus:
+            print(f"{loc!r:<45} legacy={legacy_resolve(loc)}  indexed={geo_il.resolve_region(loc)}")
+
+    bench("legacy", legacy_resolve, corpus, args.rounds)
+    geo_il._resolve_normalized.cache_clear()
+    bench("indexed (cold)", geo_il.resolve_region, corpus, 1)
+    bench("indexed", geo_il.resolve_region, corpus, args.rounds)
+    print(f"cache: {geo_il._resolve_normalized.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Local stand-in for the Base44 endpoints, for trying the outbound dispatcher.
+
+Usage:
+    python -m scripts.stub_base44 --port 8044 --throttle 0.3
+    BASE44_ENDPOINT=http://127.0.0.1:8044/jobs BASE44_BATCH_ENDPOINT=http://127.0.0.1:8044/jobs/batch ...
+
+POST /jobs takes one job, POST /jobs/batch takes ``{"jobs": [...]}`` and answers
+``{"results": [...]}``. A ``--throttle`` share of requests gets ``429`` with
+``Retry-After``. Repeated idempotency keys are acknowledged but not stored again;
+the counts are printed on exit (Ctrl+C).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubState:
+    def __init__(self, throttle: float, retry_after: int):
+        self.throttle = throttle
+        self.retry_after = retry_after
+        self.keys: set[str] = set()
+        self.counts: Counter = Counter()
+        self.lock = threading.Lock()
+
+    def accept(self, key: str | None) -> int:
+        """HTTP status for one job: 201 when new, 200 when the key was seen before."""
+        with self.lock:
+            if key and key in self.keys:
+                self.counts["duplicates"] += 1
+                return 200
+            if key:
+                self.keys.add(key)
+            self.counts["stored"] += 1
+            return 201
+
+
+def handler_for(state: StubState):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+
+        def _reply(self, status: int, body: dict, headers: dict | None = None) -> None:
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_POST(self) -> None:  # noqa: N802 - http.server naming
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+            with state.lock:
+                state.counts["requests"] += 1
+            if random.random() < state.throttle:
+                with state.lock:
+                    state.counts["throttled"] += 1
+                self._reply(429, {"error": "slow down"}, {"Retry-After": str(state.retry_after)})
+                return
+            if self.path.rstrip("/").endswith("/batch"):
+                results = [{"status": state.accept(job.get("idempotency_key"))} for job in body.get("jobs", [])]
+                self._reply(200, {"results": results})
+            else:
+                status = state.accept(self.headers.get("Idempotency-Key"))
+                self._reply(status, {"ok": True, "url": body.get("url")})
+
+        def log_message(self, *args) -> None:
+            pass
+
+    return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8044)
+    parser.add_argument("--throttle", type=float, default=0.0, help="share of requests answered with 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with a 429")
+    args = parser.parse_args()
+
+    state = StubState(args.throttle, args.retry_after)
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), handler_for(state))
+    print(f"stub Base44 on http://127.0.0.1:{args.port}/jobs (batch: /jobs/batch)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(dict(state.counts))
+
+
+if __name__ == "__main__":
+    main()
@@ -13,13 +13,33 @@ class Settings(BaseSettings):
     # Database
     db_path: str = Field("./data/jobs.db", alias="DB_PATH")
     db_echo: bool = Field(False, alias="DB_ECHO")
+    db_pool_size: int = Field(5, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(10, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout_seconds: int = Field(30, alias="DB_POOL_TIMEOUT_SECONDS")
+    db_journal_mode: str = Field("WAL", alias="DB_JOURNAL_MODE")
+    db_synchronous: str = Field("NORMAL", alias="DB_SYNCHRONOUS")
+    db_busy_timeout_ms: int = Field(5000, alias="DB_BUSY_TIMEOUT_MS")
+    db_mmap_size_mb: int = Field(256, alias="DB_MMAP_SIZE_MB")
+    db_cache_size_mb: int = Field(64, alias="DB_CACHE_SIZE_MB")
+    db_batch_max_rows: int = Field(100, alias="DB_BATCH_MAX_ROWS")
+    db_batch_max_delay_ms: int = Field(250, alias="DB_BATCH_MAX_DELAY_MS")
 
     # NLP
     nlp_model: str = Field("distilbert-base-uncased-finetuned-sst-2-english", alias="NLP_MODEL")
     nlp_task: str = Field("text-classification", alias="NLP_TASK")
     nlp_device: str = Field("cpu", alias="NLP_DEVICE")
+    nlp_backend: str = Field("torch", alias="NLP_BACKEND")  # torch|torch-int8|onnx
+    nlp_onnx_dir: str = Field("./data/onnx", alias="NLP_ONNX_DIR")
+    nlp_warmup: bool = Field(True, alias="NLP_WARMUP")
     nlp_max_length: int = Field(512, alias="NLP_MAX_LENGTH")
-    nlp_batch_size: int = Field(4, alias="NLP_BATCH_SIZE")
+    nlp_batch_size: int = Field(16, alias="NLP_BATCH_SIZE")
+    nlp_max_batch_wait_ms: int = Field(20, alias="NLP_MAX_BATCH_WAIT_MS")
+    nlp_inference_workers: int = Field(1, alias="NLP_INFERENCE_WORKERS")
+    nlp_torch_threads: int = Field(0, alias="NLP_TORCH_THREADS")  # 0 = torch default (all cores)
+    nlp_max_backlog: int = Field(4, alias="NLP_MAX_BACKLOG")
+    nlp_cache_enabled: bool = Field(True, alias="NLP_CACHE_ENABLED")
+    nlp_cache_memory_entries: int = Field(10_000, alias="NLP_CACHE_MEMORY_ENTRIES")
+    nlp_cache_max_entries: int = Field(200_000, alias="NLP_CACHE_MAX_ENTRIES")
 
     # Scraping
     playwright_browser: str = Field("chromium", alias="PLAYWRIGHT_BROWSER")
@@ -28,14 +48,63 @@ class Settings(BaseSettings):
     playwright_rate_limit_per_domain: int = Field(1, alias="PLAYWRIGHT_RATE_LIMIT_PER_DOMAIN")
     playwright_delay_ms: int = Field(500, alias="PLAYWRIGHT_DELAY_MS")
     user_agent_override: str = Field("", alias="USER_AGENT_OVERRIDE")
+    playwright_pool_size: int = Field(0, alias="PLAYWRIGHT_POOL_SIZE")  # 0 = match CONCURRENCY_GLOBAL
+    playwright_page_max_uses: int = Field(50, alias="PLAYWRIGHT_PAGE_MAX_USES")
+    playwright_block_resources: str = Field("image,media,font,stylesheet", alias="PLAYWRIGHT_BLOCK_RESOURCES")
+    playwright_block_hosts: str = Field(
+        "google-analytics.com,googletagmanager.com,doubleclick.net,facebook.net,hotjar.com,segment.io,"
+        "mixpanel.com,fullstory.com,intercom.io,ads.linkedin.com,clarity.ms",
+        alias="PLAYWRIGHT_BLOCK_HOSTS",
+    )
+    playwright_allow_hosts: str = Field("", alias="PLAYWRIGHT_ALLOW_HOSTS")
+    playwright_wait_strategy: str = Field("delay", alias="PLAYWRIGHT_WAIT_STRATEGY")  # delay|networkidle|selector
+    playwright_wait_selector: str = Field("a[href*='job'], a[href*='career'], a[href*='position']", alias="PLAYWRIGHT_WAIT_SELECTOR")
+
+    # Tiered fetching (plain HTTP first, browser fallback)
+    fetch_http_first: bool = Field(True, alias="FETCH_HTTP_FIRST")
+    fetch_http_timeout_seconds: int = Field(15, alias="FETCH_HTTP_TIMEOUT_SECONDS")
+    fetch_min_text_chars: int = Field(500, alias="FETCH_MIN_TEXT_CHARS")
+    fetch_tier_ttl_days: int = Field(7, alias="FETCH_TIER_TTL_DAYS")
+
+    # Conditional-GET response cache
+    http_cache_enabled: bool = Field(True, alias="HTTP_CACHE_ENABLED")
+    http_cache_dir: str = Field("./data/http_cache", alias="HTTP_CACHE_DIR")
+    http_cache_max_mb: int = Field(200, alias="HTTP_CACHE_MAX_MB")
+    http_cache_ttl_hours: int = Field(168, alias="HTTP_CACHE_TTL_HOURS")
+    http_cache_fresh_seconds: int = Field(0, alias="HTTP_CACHE_FRESH_SECONDS")  # 0 = always revalidate
+
+    # Incremental runs: skip postings whose content fingerprint is unchanged since an earlier run
+    # (opt-in per run with "incremental": true, or for every run here)
+    incremental_runs: bool = Field(False, alias="INCREMENTAL_RUNS")
 
     # Concurrency / SSE
     concurrency_global: int = Field(4, alias="CONCURRENCY_GLOBAL")
     concurrency_per_domain: int = Field(1, alias="CONCURRENCY_PER_DOMAIN")
     heartbeat_seconds: int = Field(15, alias="HEARTBEAT_SECONDS")
+    # Streaming stages: bounded queue size between stages and workers per stage (fetch uses CONCURRENCY_GLOBAL)
+    pipeline_queue_size: int = Field(8, alias="PIPELINE_QUEUE_SIZE")
+    pipeline_extract_workers: int = Field(2, alias="PIPELINE_EXTRACT_WORKERS")
+    pipeline_classify_workers: int = Field(2, alias="PIPELINE_CLASSIFY_WORKERS")
+    pipeline_filter_workers: int = Field(1, alias="PIPELINE_FILTER_WORKERS")
+    pipeline_store_workers: int = Field(1, alias="PIPELINE_STORE_WORKERS")
+    pipeline_send_workers: int = Field(2, alias="PIPELINE_SEND_WORKERS")
+    # Follow job links on listing pages to their detail pages
+    detail_pages_enabled: bool = Field(True, alias="DETAIL_PAGES_ENABLED")
+    detail_max_per_source: int = Field(50, alias="DETAIL_MAX_PER_SOURCE")
+    detail_max_depth: int = Field(1, alias="DETAIL_MAX_DEPTH")
+    # Durable run queue: a claimed task whose worker went silent this long is claimable again
+    task_lease_seconds: int = Field(900, alias="TASK_LEASE_SECONDS")
+    task_max_attempts: int = Field(3, alias="TASK_MAX_ATTEMPTS")
+    # "inline": the API process runs the whole pipeline; "workers": it only queues runs and
+    # reports progress while `python -m src.worker --role fetch|classify` processes do the work
+    worker_mode: str = Field("inline", alias="WORKER_MODE")
+    worker_batch_size: int = Field(20, alias="WORKER_BATCH_SIZE")
+    worker_poll_seconds: float = Field(2.0, alias="WORKER_POLL_SECONDS")
 
     # Filtering
     filter_min_score: float = Field(0.5, alias="FILTER_MIN_SCORE")
+    # Ordered stages; stages before model_score run first and skip the model on rejection
+    filter_cascade: str = Field("title_exclude,geo,keyword_include,model_score", alias="FILTER_CASCADE")
     filter_include_keywords: str = Field("", alias="FILTER_INCLUDE_KEYWORDS")
     filter_exclude_keywords: str = Field("", alias="FILTER_EXCLUDE_KEYWORDS")
     filter_locations: str = Field("", alias="FILTER_LOCATIONS")
@@ -48,6 +117,14 @@ class Settings(BaseSettings):
     base44_retries: int = Field(3, alias="BASE44_RETRIES")
     base44_mock: bool = Field(True, alias="BASE44_MOCK")
     base44_api_key: str = Field("", alias="BASE44_API_KEY")
+    # Shared pooled client: requests in flight at once, HTTP/2 (needs httpx[http2]) and backoff bounds
+    base44_concurrency: int = Field(8, alias="BASE44_CONCURRENCY")
+    base44_http2: bool = Field(True, alias="BASE44_HTTP2")
+    base44_backoff_base_seconds: float = Field(0.5, alias="BASE44_BACKOFF_BASE_SECONDS")
+    base44_backoff_max_seconds: float = Field(30.0, alias="BASE44_BACKOFF_MAX_SECONDS")
+    # Optional batch mode: POST {"jobs": [...]} here, BASE44_BATCH_SIZE jobs per request
+    base44_batch_endpoint: Optional[AnyUrl] = Field(None, alias="BASE44_BATCH_ENDPOINT")
+    base44_batch_size: int = Field(50, alias="BASE44_BATCH_SIZE")
 
     # Server
     host: str = Field("0.0.0.0", alias="HOST")
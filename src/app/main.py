@@ -1,14 +1,21 @@
+import asyncio
 import json
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy import text
 from sse_starlette.sse import EventSourceResponse
 
-from src.app.routers import runs, jobs, sources
+from src.app.routers import runs, jobs, nlp, sources
 from src.app.config import get_settings
-from src.db.session import init_db
+from src.db.repository import RunRepository
+from src.db.session import dispose_engines, init_db, run_db
 from src.app.logger_stream import log_queue, setup_global_logging
+from src.nlp.batching import get_micro_batcher
+from src.nlp.classifier import model_status
+from src.nlp.executor import get_inference_executor
+from src.outbound.dispatcher import close_dispatchers
 
 settings = get_settings()
 
@@ -24,14 +31,37 @@ app.add_middleware(
 app.include_router(runs.router)
 app.include_router(jobs.router)
 app.include_router(sources.router)
+app.include_router(nlp.router)
 
 app.mount("/ui", StaticFiles(directory="src/ui", html=True), name="ui")
 
 
 @app.on_event("startup")
-def on_startup() -> None:
+async def on_startup() -> None:
     setup_global_logging()
     init_db()
+    if settings.worker_mode == "workers":
+        # Workers keep draining runs across API restarts; only re-attach the progress watchers
+        app.state.watch_tasks = [
+            asyncio.create_task(runs.run_manager.start_run(run.run_id, run.config_json or "{}"))
+            for run in await run_db(lambda s: RunRepository(s).running())
+        ]
+    else:
+        # Runs cut off by a restart keep their task queue; mark them so they can be resumed
+        await run_db(lambda s: RunRepository(s).interrupt_running())
+    if settings.nlp_warmup:
+        # Load the model in the background so the server accepts requests immediately
+        app.state.warmup_task = asyncio.create_task(get_inference_executor().warm_up())
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    if get_micro_batcher.cache_info().currsize:
+        await get_micro_batcher().close()
+    if get_inference_executor.cache_info().currsize:
+        get_inference_executor().shutdown()
+    await close_dispatchers()
+    await dispose_engines()
 
 
 @app.get("/events/stream")
@@ -57,3 +87,17 @@ async def run_events():
 @app.get("/health")
 def health() -> dict:
     return {"status": "ok"}
+
+
+@app.get("/ready")
+async def ready(response: Response) -> dict:
+    """Readiness (vs. /health liveness): DB reachable and, with NLP_WARMUP, the model loaded."""
+    try:
+        await run_db(lambda s: s.execute(text("SELECT 1")))
+        db_ok = True
+    except Exception:  # noqa: BLE001
+        db_ok = False
+    model_ok = model_status.state == "ready" or not settings.nlp_warmup
+    if not (db_ok and model_ok):
+        response.status_code = 503
+    return {"ready": db_ok and model_ok, "db": db_ok, "model": model_status.to_dict()}
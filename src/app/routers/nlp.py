@@ -0,0 +1,14 @@
+from fastapi import APIRouter
+
+from src.nlp.cache import get_classification_cache
+
+router = APIRouter(prefix="/nlp", tags=["nlp"])
+
+
+@router.get("/cache")
+async def cache_stats() -> dict:
+    """Classification cache hit/miss counters for this process."""
+    cache = get_classification_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
@@ -9,8 +9,8 @@ from pydantic import BaseModel, field_validator
 from src.app.config import get_settings
 from src.app.service.run_manager import RunManager
 from src.db.models import Run
-from src.db.repository import RunRepository
-from src.db.session import session_scope
+from src.db.repository import CrawlTaskRepository, RunRepository
+from src.db.session import run_db
 from .events import publisher
 
 router = APIRouter(prefix="/runs", tags=["runs"])
@@ -22,6 +22,7 @@ class StartRunRequest(BaseModel):
     urls: Optional[List[str]] = None
     raw_urls: Optional[str] = None
     use_mock_outbound: Optional[bool] = True
+    incremental: Optional[bool] = None  # None = INCREMENTAL_RUNS default
 
     @field_validator("urls", mode="before")
     @classmethod
@@ -65,13 +66,11 @@ async def start_run(payload: StartRunRequest, background_tasks: BackgroundTasks)
     print(f"DEBUG: Found {len(urls)} valid URLs from input")
     if not urls:
         raise HTTPException(status_code=400, detail="no valid urls provided")
-    with session_scope() as session:
-        repo = RunRepository(session)
-        config = payload.model_dump()
-        config["urls"] = urls
-        repo.create(Run(run_id=run_id, status="running", config_json=json.dumps(config)))
+    config = payload.model_dump()
+    config["urls"] = urls
+    await run_db(lambda s: RunRepository(s).create(Run(run_id=run_id, status="running", config_json=json.dumps(config))))
 
-    background_tasks.add_task(run_manager.start_run, run_id, json.dumps({"urls": urls, "use_mock_outbound": payload.use_mock_outbound}))
+    background_tasks.add_task(run_manager.start_run, run_id, json.dumps({"urls": urls, "use_mock_outbound": payload.use_mock_outbound, "incremental": payload.incremental}))
     return StartRunResponse(run_id=run_id)
 
 
@@ -82,20 +81,48 @@ class StopRunRequest(BaseModel):
 @router.post("/stop")
 async def stop_run(req: StopRunRequest):
     run_manager.request_stop(req.run_id)
-    with session_scope() as session:
+
+    def _stop(session) -> bool:
         repo = RunRepository(session)
-        run = repo.get(req.run_id)
-        if not run:
-            raise HTTPException(status_code=404, detail="run not found")
+        if not repo.get(req.run_id):
+            return False
         repo.update_status(req.run_id, "stopped")
+        return True
+
+    if not await run_db(_stop):
+        raise HTTPException(status_code=404, detail="run not found")
     return {"status": "stopped", "run_id": req.run_id}
 
 
+@router.post("/{run_id}/resume", response_model=StartRunResponse)
+async def resume_run(run_id: str, background_tasks: BackgroundTasks):
+    """Continue a stopped or interrupted run from its task queue checkpoints."""
+    run = await run_db(lambda s: RunRepository(s).get(run_id))
+    if not run:
+        raise HTTPException(status_code=404, detail="run not found")
+    if run.status == "running":
+        raise HTTPException(status_code=409, detail="run is already running")
+    if run_id in run_manager.active:
+        # Stopped, but its pipeline is still draining the tasks it claimed
+        raise HTTPException(status_code=409, detail="run is still stopping")
+    config = json.loads(run.config_json or "{}")
+
+    def _reopen(session) -> None:
+        if settings.worker_mode != "workers":
+            # Only this process works inline runs, so claims left by an earlier one are stale;
+            # worker claims may still be live and are left to expire with their lease
+            CrawlTaskRepository(session).release(run_id)
+        RunRepository(session).update_status(run_id, "running")
+
+    await run_db(_reopen)
+
+    background_tasks.add_task(run_manager.start_run, run_id, json.dumps({"urls": config.get("urls", []), "use_mock_outbound": config.get("use_mock_outbound", True), "incremental": config.get("incremental")}))
+    return StartRunResponse(run_id=run_id)
+
+
 @router.get("/{run_id}")
 async def get_run(run_id: str):
-    with session_scope() as session:
-        repo = RunRepository(session)
-        run = repo.get(run_id)
-        if not run:
-            raise HTTPException(status_code=404, detail="run not found")
-        return run
+    run = await run_db(lambda s: RunRepository(s).get(run_id))
+    if not run:
+        raise HTTPException(status_code=404, detail="run not found")
+    return run
@@ -1,78 +1,663 @@
 import asyncio
-from types import SimpleNamespace
-import asyncio
+import datetime as dt
+import hashlib
+import json
 import logging
-from typing import Any
+import os
+import socket
+import uuid
+from collections import defaultdict, deque
+from contextlib import nullcontext
+from dataclasses import dataclass, field, replace
+from typing import Any, Iterable, Optional
 
-from src.scraping.runner import BrowserManager
+from src.app.config import get_settings
+from src.db.models import CrawlTask
+from src.db.repository import CrawlTaskRepository, FetchProfileRepository, JobIndexRepository, SourceRepository
+from src.db.session import run_db
+from src.filtering.engine import FilterCascade, FilterContext, FilterState
+from src.app.service.stages import StageGraph
+from src.extraction.document import Document
+from src.extraction.extractor import extract_sections
+from src.extraction.structured import VIA_DOM
+from src.filtering.roles import DEV_KEYWORDS, NON_DEV_EXCLUDE, excluded_title_keyword
+from src.nlp.cache import model_id
+from src.nlp.service import classify_texts
+from src.outbound.base import SENT
+from src.scraping.http_cache import HttpCache
+from src.scraping.discovery import discover_job_links, is_job_key, normalize_url
+from src.scraping.runner import DomainLimiter, domain_of
+from src.scraping.tiered import FetchResult, TieredFetcher
 from src.scraping.parser import JobParser
 
 
 logger = logging.getLogger(__name__)
 
+FINGERPRINT_FIELDS = ("title", "company", "location", "description", "summary")
+
+
+# Task states a single-process run works through; workers split them by role
+CLAIMABLE = (
+    CrawlTaskRepository.PENDING,
+    CrawlTaskRepository.FETCHED,
+    CrawlTaskRepository.CLASSIFIED,
+    CrawlTaskRepository.FAILED,
+)
+
+
+def worker_id() -> str:
+    """Claim owner for the durable queue: host, process and a per-call suffix."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+def analysis_key() -> str:
+    """Hash of what classify/filter decisions depend on: model, filter settings and role keywords.
+
+    Stored with the derived results of a page so a settings change re-runs them.
+    """
+    settings = get_settings()
+    config = {
+        "model": model_id(),
+        "max_length": settings.nlp_max_length,
+        "filter": {k: v for k, v in settings.model_dump().items() if k.startswith("filter_")},
+        "roles": [sorted(DEV_KEYWORDS), sorted(NON_DEV_EXCLUDE)],
+    }
+    return hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def job_fingerprint(job_dict: dict) -> str:
+    """Stable hash of the posting content, insensitive to whitespace and case."""
+    parts = [" ".join(str(job_dict.get(f) or "").lower().split()) for f in FINGERPRINT_FIELDS]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
 
 class Pipeline:
     def __init__(self, run_manager=None):
         self.run_manager = run_manager
         self.parser = JobParser()
+        self.cascade = FilterCascade.from_config(get_settings().filter_cascade)
+
+    @staticmethod
+    def _text(job_dict: dict) -> str:
+        return " ".join(p for p in (job_dict.get("title"), job_dict.get("summary"), job_dict.get("description")) if p)
+
+    async def _classify(self, job_dicts: list[dict]) -> list:
+        """Run the cheap cascade stages, then classify only their survivors.
+
+        Returns (job_dict, state, classification) for the survivors; rejected jobs
+        are finalized in place. Survivor texts go through the classification cache
+        together, and misses share model batches with other in-flight pages via the
+        micro-batcher.
+        """
+        context = FilterContext(min_score=get_settings().filter_min_score)
+        pending = []
+        for job_dict in job_dicts:
+            state = FilterState(
+                title=job_dict.get("title"),
+                description=job_dict.get("description"),
+                summary=job_dict.get("summary"),
+                location=job_dict.get("location"),
+            )
+            rejected = self.cascade.prefilter(state, context)
+            if rejected:
+                self._apply(job_dict, {"label": None, "score": 0.0}, rejected)
+            else:
+                pending.append((job_dict, state, self._text(job_dict)))
+
+        to_classify = [text for _, _, text in pending if text] if self.cascade.needs_model else []
+        classified = iter(await classify_texts(to_classify)) if to_classify else iter(())
+        unclassified = {"label": None, "score": 0.0}
+        return [
+            (job_dict, state, next(classified) if text and self.cascade.needs_model else unclassified)
+            for job_dict, state, text in pending
+        ]
+
+    def _filter(self, classified: list) -> None:
+        """Finish the cascade (model score stage) for classified jobs."""
+        context = FilterContext(min_score=get_settings().filter_min_score)
+        for job_dict, state, classification in classified:
+            self._apply(job_dict, classification, self.cascade.complete(state, classification, context))
+
+    async def _analyze(self, job_dicts: list[dict]) -> None:
+        """Classify and filter job dicts in place."""
+        self._filter(await self._classify(job_dicts))
+
+    @staticmethod
+    def _apply(job_dict: dict, classification: dict, result) -> None:
+        job_dict["classification"] = classification
+        job_dict["filter"] = result.to_dict()
+        job_dict["region"] = result.region or job_dict.get("region")
+
+    async def _unchanged(self, job_dicts: list[dict]) -> set[str]:
+        """URLs whose fingerprint matches the cross-run job index."""
+        fingerprints = {job["url"]: job["fingerprint"] for job in job_dicts if job.get("url") and job.get("fingerprint")}
+        known = await run_db(lambda s: JobIndexRepository(s).fingerprints(list(fingerprints)))
+        return {url for url, fingerprint in fingerprints.items() if known.get(url) == fingerprint}
+
+    async def _store_derived(
+        self, run: "RunState", fetched, jobs: list, summary: dict, follow: Optional[list] = None, complete: bool = True
+    ) -> None:
+        """Remember a page's results for reuse while its body stays the same.
+
+        ``complete=False`` marks results missing jobs an incremental run skipped; only
+        incremental runs, which skip those jobs again, may reuse them.
+        """
+        cache = run.fetcher.cache
+        if cache and fetched and fetched.content_hash:
+            derived = {
+                "jobs": jobs,
+                "source": summary,
+                "follow": follow or [],
+                "analysis": run.analysis,
+                "complete": complete,
+            }
+            await asyncio.to_thread(cache.store_derived, fetched.url, fetched.content_hash, derived)
+
+    def _should_stop(self, run_id) -> bool:
+        return bool(self.run_manager and self.run_manager.should_stop(run_id))
+
+    @staticmethod
+    def _job_dict(job) -> dict:
+        url = getattr(job, 'url', None) or getattr(job, 'link', None)
+        job_dict = {
+            "url": normalize_url(url) if url else None,
+            "title": getattr(job, 'title', 'Unknown'),
+            "company": getattr(job, 'company', 'Unknown'),
+            "location": getattr(job, 'location', None),
+            "description": getattr(job, 'description', None),
+            "summary": getattr(job, 'summary', None),
+            "region": getattr(job, 'region', None),
+            "filter": getattr(job, 'filter', {}),
+        }
+        job_dict["fingerprint"] = job_fingerprint(job_dict)
+        return job_dict
+
+    # --- Stages -----------------------------------------------------------
+    # discovery -> fetch -> extract -> classify -> filter -> store -> send
+
+    async def _discover(self, run: "RunState", task: CrawlTask) -> None:
+        """Route a claimed task to the stage after its last checkpoint."""
+        # Stop requests skip everything not yet in flight
+        if self._should_stop(run.run_id):
+            return
+        payload = json.loads(task.payload_json) if task.payload_json else {}
+        page = PageWork(
+            url=task.url,
+            index=task.ordinal,
+            fresh=task.depth == 0 and task.url in run.fresh,
+            depth=task.depth,
+            source=task.source_url,
+            listing_job=payload.get("listing_job"),
+            task_id=task.id,
+        )
+        if task.state == CrawlTaskRepository.FETCHED:
+            page.restore(payload)
+            await run.graph.put("classify", page)
+        elif task.state == CrawlTaskRepository.CLASSIFIED:
+            # Stored before the restart; only the send is left
+            page.restore(payload)
+            await run.graph.put("send", page)
+        else:
+            await run.graph.put("fetch", page)
+
+    async def _checkpoint(
+        self, page: "PageWork", state: str, payload: Optional[dict] = None, error=None, keep_claim: bool = False
+    ) -> None:
+        await run_db(lambda s: CrawlTaskRepository(s).advance(page.task_id, state, payload, error, keep_claim))
+
+    @staticmethod
+    def _guarded(run: "RunState", fn):
+        """Stage function that remembers which task an error came from before re-raising."""
+
+        async def stage(item) -> None:
+            try:
+                await fn(run, item)
+            except Exception as e:
+                task_id = item.id if isinstance(item, CrawlTask) else item.task_id
+                if task_id is not None:
+                    run.errors[task_id] = f"{type(e).__name__}: {e}"
+                raise
+
+        return stage
+
+    async def _hand_off(self, run: "RunState", page: "PageWork") -> None:
+        """Checkpoint an extracted page, then classify it here or leave it to a classify worker."""
+        # A classify worker may claim it once released; without hand-off this worker goes on
+        await self._checkpoint(page, CrawlTaskRepository.FETCHED, page.snapshot(), keep_claim=not run.hand_off)
+        if not run.hand_off:
+            await run.graph.put("classify", page)
+
+    def _parse_listing(self, html, url: str) -> tuple[list, list[str]]:
+        """Jobs and job links from one parse of a listing page (raw HTML or a ``Document``)."""
+        doc = Document.of(html)
+        return self.parser.parse(doc, url), discover_job_links(doc, url)
+
+    async def _follow(
+        self, run: "RunState", page: "PageWork", job_dicts: list[dict], links: list[str], listed: Iterable[str] = ()
+    ) -> list[dict]:
+        """Schedule detail fetches for listing jobs without a description.
+
+        Links are normalized and deduplicated across every source in the run, and
+        capped per source by DETAIL_MAX_PER_SOURCE / DETAIL_MAX_DEPTH. ``listed`` are
+        URLs of listing jobs left out of ``job_dicts`` (e.g. unchanged in an incremental
+        run); their links are not followed either. Returns the jobs that stay with the
+        listing page.
+        """
+        settings = get_settings()
+        if not settings.detail_pages_enabled or page.depth >= settings.detail_max_depth:
+            return job_dicts
 
-    async def run(self, run_request, run_id) -> dict[str, Any]:
+        keep, follow = [], []
+        listed = set(listed)
+        for job_dict in job_dicts:
+            url = job_dict.get("url")
+            target = normalize_url(url) if url else None
+            if target:
+                listed.add(target)
+            if (
+                job_dict.get("description")
+                or not target
+                or target == normalize_url(page.url)
+                or is_job_key(target)  # listed without a page of its own
+                # Cheapest filter first: a non-dev title is not worth a fetch
+                or excluded_title_keyword(job_dict.get("title"))
+            ):
+                keep.append(job_dict)
+            elif target in run.seen:
+                continue  # already listed or fetched from another source in this run
+            elif len(follow) < settings.detail_max_per_source:
+                run.seen.add(target)
+                follow.append((target, job_dict))
+            else:
+                keep.append(job_dict)
+        # Job links the adapter did not turn into jobs
+        extra = [target for target in dict.fromkeys(links) if target not in listed and target not in run.seen]
+        if extra and run.incremental:
+            # Nothing to compare a bare link with before fetching it; any indexed job is skipped
+            indexed = await run_db(lambda s: JobIndexRepository(s).fingerprints(extra))
+            extra = [target for target in extra if target not in indexed]
+        for target in extra[: max(0, settings.detail_max_per_source - len(follow))]:
+            run.seen.add(target)
+            follow.append((target, None))
+
+        tasks = [
+            CrawlTask(
+                run_id=run.run_id,
+                url=target,
+                kind="detail",
+                depth=page.depth + 1,
+                source_url=page.url,
+                ordinal=page.index,
+                payload_json=json.dumps({"listing_job": listing_job}) if listing_job else None,
+            )
+            for target, listing_job in follow
+        ]
+        # Only tasks new to the run are fetched; a resumed run already has the others queued
+        created = await run_db(lambda s: CrawlTaskRepository(s).enqueue(tasks, claimed_by=run.worker))
+        listing_jobs = dict(follow)
+        for task in created:
+            detail = PageWork(
+                url=task.url,
+                index=page.index,
+                depth=task.depth,
+                source=page.url,
+                listing_job=listing_jobs.get(task.url),
+                task_id=task.id,
+            )
+            await run.graph.put("fetch", detail)
+        page.follow = [listing_job or {"url": target} for target, listing_job in follow]
+        if follow:
+            logger.info(f"[DISCOVER] 🔗 Following {len(follow)} detail pages from {page.url}")
+        return keep
+
+    async def _extract_detail(self, run: "RunState", page: "PageWork") -> None:
+        """One job from a detail page, merged with what its listing said about it."""
+        fields = await asyncio.to_thread(extract_sections, page.fetched.document or page.fetched.html)
+        via = fields.pop("via")
+        self.parser.stats.record(page.source, f"detail:{via}", via != VIA_DOM)
+        listing = page.listing_job or {}
+        job_dict = {key: None for key in FINGERPRINT_FIELDS} | {"region": None, "filter": {}} | listing
+        for key, value in fields.items():
+            # Structured data beats the listing; DOM guesses (e.g. <title>) only fill gaps
+            if value and (via != VIA_DOM or not job_dict.get(key) or key in ("description", "summary")):
+                job_dict[key] = value
+        job_dict["url"] = page.url
+        job_dict["title"] = job_dict["title"] or "Unknown"
+        # Keyed by the listing entry when there is one so incremental runs recognise it there
+        job_dict["fingerprint"] = listing.get("fingerprint") or job_fingerprint(job_dict)
+        page.fetched = replace(page.fetched, html=None, document=None)
+        if run.incremental and await self._unchanged([job_dict]):
+            logger.info(f"[SCAN] ⏭️ Unchanged job skipped: {page.url}")
+            await self._checkpoint(page, CrawlTaskRepository.SENT)
+            return
+        page.jobs, page.links, page.via = [job_dict], 1, f"detail:{via}"
+        await self._hand_off(run, page)
+
+    async def _fetch(self, run: "RunState", page: "PageWork") -> None:
+        # The per-domain delay may have elapsed after a stop request
+        if self._should_stop(run.run_id):
+            return
+        domain = domain_of(page.url)
+        if run.limiter.saturated(page.url):
+            # Park it instead of holding one of the global fetch workers while the domain is
+            # busy; the fetch that frees the domain slot queues it again
+            run.deferred[domain].append(page)
+            return
+        logger.info(f"[SCAN] ({page.index + 1}/{run.total}) Processing: {page.url}")
+        try:
+            # Plain HTTP first, browser only when needed
+            page.fetched = await run.limiter.run(page.url, lambda: run.fetcher.fetch(page.url, fresh=page.fresh))
+        finally:
+            if run.deferred[domain]:
+                await run.graph.put("fetch", run.deferred[domain].popleft())
+        if not page.fetched.html:
+            logger.warning(f"⚠️ Failed to fetch HTML for {page.url}")
+            if page.listing_job:
+                # Classify what the listing said rather than losing the job
+                page.jobs, page.links, page.via = [page.listing_job], 1, "listing"
+                await self._hand_off(run, page)
+            else:
+                await self._checkpoint(page, CrawlTaskRepository.FAILED, error=f"fetch failed ({page.fetched.status})")
+            return
+        # Blocks while extraction is behind, which pauses this fetch worker
+        await run.graph.put("extract", page)
+
+    async def _extract(self, run: "RunState", page: "PageWork") -> None:
+        if page.depth > 0:
+            await self._extract_detail(run, page)
+            return
+        url, fetched, cache = page.url, page.fetched, run.fetcher.cache
+
+        # Unchanged page: reuse the parse/classify/filter results from the last run, as long
+        # as they were decided with the current model and filter settings
+        if fetched.not_modified and cache:
+            derived = await asyncio.to_thread(cache.load_derived, url, fetched.content_hash)
+            reusable = derived is not None and derived.get("analysis") == run.analysis
+            if reusable and (run.incremental or derived.get("complete")):
+                jobs = derived["jobs"]
+                if run.incremental:
+                    unchanged = await self._unchanged(jobs)
+                    jobs = [job for job in jobs if job.get("url") not in unchanged]
+                    page.skipped = len(unchanged)
+                logger.info(f"[SCAN] ♻️ Unchanged since last run, reusing {len(jobs)} jobs: {url}")
+                # Followed listing jobs carry their fingerprint; bare links only a URL
+                follow = derived.get("follow") or []
+                listed = [job for job in follow if job.get("fingerprint")]
+                links = [job["url"] for job in follow if not job.get("fingerprint")]
+                unchanged = await self._unchanged(listed) if run.incremental else set()
+                if listed or links:
+                    await self._follow(
+                        run, page, [job for job in listed if job["url"] not in unchanged], links, unchanged
+                    )
+                page.jobs, page.summary = jobs, derived["source"]
+                await run.graph.put("store", page)
+                return
+
+        # The HTTP tier already parsed the page to judge it usable
+        raw_jobs, links = await asyncio.to_thread(self._parse_listing, fetched.document or fetched.html, url)
+        # The body is not needed past extraction; do not keep it queued downstream
+        page.fetched = replace(fetched, html=None, document=None)
+        if not raw_jobs and not links:
+            logger.warning(f"⚠️ No jobs found via selectors on {url}")
+            await self._store_derived(run, page.fetched, [], {"url": url, "passed": 0, "links": 0, "status": "empty"})
+            await self._checkpoint(page, CrawlTaskRepository.SENT)
+            return
+
+        logger.info(f"[EXTRACT] 📥 Found {len(raw_jobs)} raw jobs. Starting Filter...")
+        job_dicts = [self._job_dict(job) for job in raw_jobs]
+        listed = {job_dict["url"] for job_dict in job_dicts if job_dict["url"]}
+        page.links, page.via = len(raw_jobs), raw_jobs[0].source if raw_jobs else VIA_DOM
+
+        # Incremental mode: postings unchanged since an earlier run are skipped entirely
+        unchanged = await self._unchanged(job_dicts) if run.incremental else set()
+        if unchanged:
+            logger.info(f"[SCAN] ⏭️ {len(unchanged)} unchanged jobs skipped on {url}")
+        page.skipped = len(unchanged)
+        job_dicts = [job_dict for job_dict in job_dicts if job_dict["url"] not in unchanged]
+        page.jobs = await self._follow(run, page, job_dicts, links, listed)
+        await self._hand_off(run, page)
+
+    async def _classify_stage(self, run: "RunState", page: "PageWork") -> None:
+        # All jobs of the page at once so they batch together
+        page.classified = await self._classify(page.jobs)
+        await run.graph.put("filter", page)
+
+    async def _filter_stage(self, run: "RunState", page: "PageWork") -> None:
+        self._filter(page.classified)
+        page.classified = []
+        for job_dict in page.jobs:
+            if job_dict["filter"].get("passed"):
+                logger.info(f"[MATCH] ✅ Candidate found: {job_dict['title']} at {job_dict['company']}")
+
+        if page.depth > 0:
+            # Detail pages are not sources of their own; their passes count towards the listing
+            passed = sum(1 for job in page.jobs if job["filter"].get("passed"))
+            page.summary = {"source": page.source, "passed": passed} if passed else {}
+            await run.graph.put("store", page)
+            return
+
+        passed = sum(1 for job in page.jobs if job["filter"].get("passed"))
+        page.summary = {
+            "url": page.url,
+            "passed": passed,
+            "links": page.links,
+            "skipped": page.skipped,
+            "status": "active",
+            "via": page.via,
+            "followed": len(page.follow),
+        }
+        await self._store_derived(run, page.fetched, page.jobs, page.summary, page.follow, complete=not page.skipped)
+        await run.graph.put("store", page)
+
+    async def _store(self, run: "RunState", page: "PageWork") -> None:
+        if page.summary.get("url"):
+            run.sources.append(page.summary)
+        elif page.summary.get("source"):
+            for source in run.sources:
+                if source["url"] == page.summary["source"]:
+                    source["passed"] += page.summary["passed"]
+        if run.sink:
+            await run.sink.store(page.jobs, page.summary)
+        else:
+            run.processed.extend(page.jobs)
+        run.stored += len(page.jobs)
+        page.jobs = [job for job in page.jobs if job.get("filter", {}).get("passed")]
+        if not page.jobs:
+            await self._checkpoint(page, CrawlTaskRepository.SENT)
+            return
+        await self._checkpoint(page, CrawlTaskRepository.CLASSIFIED, page.snapshot(), keep_claim=True)
+        await run.graph.put("send", page)
+
+    async def _send(self, run: "RunState", page: "PageWork") -> None:
+        results = await run.sink.send(page.jobs) if run.sink else []
+        unsent = sum(1 for result in results if result.status != SENT)
+        if unsent and page.task_id is not None:
+            # Stays "classified" and counts an attempt; a resume re-sends only the unsent jobs
+            run.errors[page.task_id] = f"outbound: {unsent} of {len(results)} jobs not sent"
+            return
+        await self._checkpoint(page, CrawlTaskRepository.SENT)
+
+    async def run(self, run_request, run_id, sink=None) -> dict[str, Any]:
+        """Stream the run through the stage graph.
+
+        With a ``sink`` (``store(jobs, summary)`` / ``send(jobs)`` coroutines) every
+        page is persisted and sent as soon as it is filtered and ``jobs`` comes back
+        empty; without one, jobs are collected and returned as before.
+        """
         urls = run_request.urls
-        logger.info(f"🚀 PIPELINE STARTED: Processing {len(urls)} URLs")
-
-        processed: list[Any] = []
-        sources: list[Any] = []
-
-        # 1. Pipeline Input: The Browser Context
-        async with BrowserManager() as browser:
-            for i, url in enumerate(urls):
-                try:
-                    # 2. Rate Limiting (Crucial for stability)
-                    await asyncio.sleep(2.0)
-
-                    # 3. Step: SCAN
-                    logger.info(f"[SCAN] ({i+1}/{len(urls)}) Processing: {url}")
-                    
-                    # 4. Step: FETCH
-                    html = await browser.fetch_html(url)
-                    
-                    if not html:
-                        logger.warning(f"⚠️ Failed to fetch HTML for {url}")
-                        continue
-
-                    # 5. Step: PARSE
-                    raw_jobs = self.parser.parse(html, url)
-                    
-                    if not raw_jobs:
-                        logger.warning(f"⚠️ No jobs found via selectors on {url}")
-                        continue
-                    
-                    logger.info(f"[EXTRACT] 📥 Found {len(raw_jobs)} raw jobs. Starting Filter...")
-
-                    # 6. Step: FILTER & SAVE
-                    for job in raw_jobs:
-                        title = getattr(job, 'title', 'Unknown')
-                        company = getattr(job, 'company', 'Unknown')
-                        job_dict = {
-                            "url": getattr(job, 'url', None) or getattr(job, 'link', None),
-                            "title": title,
-                            "company": company,
-                            "location": getattr(job, 'location', None),
-                            "summary": getattr(job, 'summary', None),
-                            "region": getattr(job, 'region', None),
-                            "filter": getattr(job, 'filter', {}),
-                        }
-                        logger.info(f"[MATCH] ✅ Candidate found: {title} at {company}")
-                        # TODO: Add DB save logic here
-                        processed.append(job_dict)
-
-                    sources.append({"url": url, "passed": len(raw_jobs), "links": len(raw_jobs), "status": "active"})
-
-                except Exception as e:
-                    logger.error(f"❌ Error processing {url}: {e}")
-
-        logger.info("🏁 PIPELINE FINISHED: All URLs processed.")
-        return {"jobs": processed, "sources": sources}
-
-        await self._publish(run_id, "completed", strings.pipeline_completed())
-        return {"jobs": processed, "sources": sources}
+        settings = get_settings()
+        logger.info(
+            f"🚀 PIPELINE STARTED: Processing {len(urls)} URLs "
+            f"(global={settings.concurrency_global}, per-domain={settings.concurrency_per_domain})"
+        )
+        known = await self.enqueue(run_id, urls)
+        run = await self.work(
+            run_id,
+            worker_id(),
+            CLAIMABLE,
+            sink=sink,
+            incremental=getattr(run_request, "incremental", None),
+            total=len(urls),
+            known=known,
+        )
+        logger.info(f"🏁 PIPELINE FINISHED: All URLs processed ({run.stored} jobs stored).")
+        return {"jobs": run.processed, "sources": run.sources}
+
+    @staticmethod
+    async def enqueue(run_id: str, urls: list[str]) -> list[str]:
+        """Queue the run's sources (once per run); returns every URL queued for the run so far."""
+        unique = list({normalize_url(url): url for url in reversed(urls)}.values())[::-1]
+        seeds = [CrawlTask(run_id=run_id, url=url, ordinal=i) for i, url in enumerate(unique)]
+        await run_db(lambda s: CrawlTaskRepository(s).enqueue(seeds))
+        return await run_db(lambda s: CrawlTaskRepository(s).urls(run_id))
+
+    async def work(
+        self,
+        run_id: str,
+        worker: str,
+        states: tuple[str, ...],
+        sink=None,
+        incremental: Optional[bool] = None,
+        limit: Optional[int] = None,
+        hand_off: bool = False,
+        total: Optional[int] = None,
+        known: Optional[list[str]] = None,
+        fetcher: Optional[TieredFetcher] = None,
+    ) -> "RunState":
+        """Claim the run's tasks in ``states`` and stream them through the stages.
+
+        A resumed run only finds what is not sent yet, and each task continues from
+        its last checkpoint. With ``hand_off`` pages stop at the ``fetched``
+        checkpoint and are left to a classify worker (see ``src.worker``). A long-lived
+        caller passes its own entered ``fetcher``; otherwise one is opened for the call.
+        """
+        settings = get_settings()
+        incremental = settings.incremental_runs if incremental is None else incremental
+        self.cascade = FilterCascade.from_config(settings.filter_cascade)
+        self.parser.stats.clear()
+
+        tasks = await run_db(
+            lambda s: CrawlTaskRepository(s).claim(
+                run_id, worker, states, limit=limit, lease_seconds=settings.task_lease_seconds,
+                max_attempts=settings.task_max_attempts,
+            )
+        )
+        if known is None:
+            known = await run_db(lambda s: CrawlTaskRepository(s).urls(run_id))
+        logger.info(f"📋 Run queue: {len(tasks)} of {len(known)} tasks claimed by {worker} for {run_id}")
+
+        urls = [task.url for task in tasks if task.depth == 0]
+        preferred = await run_db(lambda s: FetchProfileRepository(s).preferred_tiers(settings.fetch_tier_ttl_days))
+        last_scraped = await run_db(lambda s: SourceRepository(s).last_scraped(urls))
+
+        # Sources scraped within HTTP_CACHE_FRESH_SECONDS are served from the cache as-is
+        fresh_cutoff = dt.datetime.utcnow() - dt.timedelta(seconds=settings.http_cache_fresh_seconds)
+        fresh = {url for url, at in last_scraped.items() if settings.http_cache_fresh_seconds > 0 and at >= fresh_cutoff}
+
+        graph = StageGraph(settings.pipeline_queue_size)
+        if fetcher is not None:
+            fetcher.preferred.update(preferred)
+        # Chromium starts lazily on the first browser fallback
+        opened = nullcontext(fetcher) if fetcher is not None else TieredFetcher(preferred, cache=HttpCache.from_settings())
+        async with opened as fetcher:
+            run = RunState(
+                run_id=run_id,
+                graph=graph,
+                fetcher=fetcher,
+                limiter=DomainLimiter.from_settings(),
+                sink=sink,
+                total=total or len(urls),
+                fresh=fresh,
+                incremental=incremental,
+                analysis=analysis_key(),
+                worker=worker,
+                hand_off=hand_off,
+                seen={normalize_url(url) for url in known},
+            )
+            stages = (
+                ("discovery", self._discover, 1, False),
+                ("fetch", self._fetch, settings.concurrency_global, False),
+                ("extract", self._extract, settings.pipeline_extract_workers, True),
+                ("classify", self._classify_stage, settings.pipeline_classify_workers, True),
+                ("filter", self._filter_stage, settings.pipeline_filter_workers, True),
+                ("store", self._store, settings.pipeline_store_workers, True),
+                ("send", self._send, settings.pipeline_send_workers, True),
+            )
+            for name, fn, workers, bounded in stages:
+                graph.stage(name, self._guarded(run, fn), workers, bounded=bounded)
+            try:
+                await graph.run("discovery", tasks)
+            finally:
+                # Tasks that raised count an attempt; the rest (skipped by a stop request)
+                # go back to the queue as they were for a later resume
+                await run_db(
+                    lambda s: CrawlTaskRepository(s).release(
+                        run_id, worker, errors=run.errors, max_attempts=settings.task_max_attempts
+                    )
+                )
+
+        await run_db(lambda s: FetchProfileRepository(s).record_tiers(fetcher.learned))
+        fetcher.learned.clear()
+
+        logger.info("🧩 Extraction by source: %s", self.parser.stats.report())
+        logger.info("🧮 Filter cascade: %s", self.cascade.report())
+        logger.info("🔀 Stages: %s", graph.report())
+        return run
+
+
+@dataclass
+class PageWork:
+    """One source page moving through the stages."""
+
+    url: str
+    index: int
+    fresh: bool = False
+    fetched: Optional[FetchResult] = None
+    jobs: list = field(default_factory=list)
+    classified: list = field(default_factory=list)
+    summary: dict = field(default_factory=dict)
+    links: int = 0
+    skipped: int = 0
+    via: Optional[str] = None
+    # Detail pages: depth below the listing, the listing URL and the listing's job entry
+    depth: int = 0
+    source: Optional[str] = None
+    listing_job: Optional[dict] = None
+    follow: list = field(default_factory=list)
+    task_id: Optional[int] = None
+
+    # Fields checkpointed with the task so a resumed run can pick the page up again
+    CHECKPOINT_FIELDS = ("jobs", "summary", "links", "skipped", "via", "follow", "listing_job")
+
+    def snapshot(self) -> dict:
+        return {name: getattr(self, name) for name in self.CHECKPOINT_FIELDS}
+
+    def restore(self, payload: dict) -> None:
+        for name in self.CHECKPOINT_FIELDS:
+            if name in payload:
+                setattr(self, name, payload[name])
+
+
+@dataclass
+class RunState:
+    run_id: Any
+    graph: StageGraph
+    fetcher: TieredFetcher
+    limiter: DomainLimiter
+    sink: Any = None
+    total: int = 0
+    fresh: set = field(default_factory=set)
+    incremental: bool = False
+    # analysis_key() of this run; derived results stored under another key are not reused
+    analysis: str = ""
+    stored: int = 0
+    worker: str = ""
+    hand_off: bool = False
+    # domain -> pages waiting for that domain's fetch slot
+    deferred: dict = field(default_factory=lambda: defaultdict(deque))
+    # task id -> error of tasks a stage raised on
+    errors: dict = field(default_factory=dict)
+    # Normalized URLs already scheduled in this run, across all sources
+    seen: set = field(default_factory=set)
+    processed: list = field(default_factory=list)
+    sources: list = field(default_factory=list)
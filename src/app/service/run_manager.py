@@ -1,21 +1,39 @@
 import asyncio
 import json
+import logging
 from types import SimpleNamespace
 from typing import Any, Dict
 
+from src.app.config import get_settings
 from src.app.service.pipeline import Pipeline
 from src.db.models import Job, OutboundAttempt, ProgressEvent, Run
-from src.db.repository import JobRepository, OutboundRepository, ProgressRepository, RunRepository, SourceRepository
-from src.db.session import session_scope
+from src.db.repository import (
+    CrawlTaskRepository,
+    JobIndexRepository,
+    JobRepository,
+    OutboundRepository,
+    RunRepository,
+    SourceRepository,
+)
+from src.db.batching import WriteBatcher
+from src.db.session import run_db
 from src.events.publisher import EventPublisher
 from src.events.schema import EventType, ProgressEventModel
 from src.localization import strings
+from src.outbound.base import SENT, SendResult
+from src.outbound.dispatcher import get_dispatcher
+
+logger = logging.getLogger(__name__)
 
 
 class RunManager:
     def __init__(self, publisher: EventPublisher):
         self.publisher = publisher
         self.stop_flags: dict[str, bool] = {}
+        # Runs whose pipeline (or worker-mode watcher) is still going in this process
+        self.active: set[str] = set()
+        # Progress rows are written in batches; SSE publishing stays immediate
+        self.event_writer = WriteBatcher()
 
     def should_stop(self, run_id: str) -> bool:
         return self.stop_flags.get(run_id, False)
@@ -24,24 +42,143 @@ class RunManager:
         self.stop_flags[run_id] = True
 
     async def _save_event(self, run_id: str, event_type: EventType, message: str, payload: Dict[str, Any] | None = None):
-        with session_scope() as session:
-            progress_repo = ProgressRepository(session)
-            progress_repo.add(
-                ProgressEvent(
-                    run_id=run_id,
-                    event_type=event_type.value,
-                    message=message,
-                    data_json=json.dumps(payload) if payload else None,
-                )
-            )
+        event = ProgressEvent(
+            run_id=run_id,
+            event_type=event_type.value,
+            message=message,
+            data_json=json.dumps(payload) if payload else None,
+        )
+        await self.event_writer.add(event)
 
         await self.publisher.publish(
             ProgressEventModel(run_id=run_id, event_type=event_type, message=message, data=payload)
         )
 
+    def _store_page(self, session, run_id: str, jobs: list, summary: dict) -> None:
+        """Store one page's jobs, index entries and source stats in a single transaction."""
+        JobRepository(session).bulk_upsert(
+            [
+                Job(
+                    run_id=run_id,
+                    url=record.get("url"),
+                    title=record.get("title"),
+                    company=record.get("company"),
+                    location=record.get("location"),
+                    region=record.get("region"),
+                    description=record.get("description"),
+                    summary=record.get("summary"),
+                    classification_label=record.get("classification", {}).get("label"),
+                    classification_score=record.get("classification", {}).get("score"),
+                    score=record.get("filter", {}).get("score"),
+                    passed_filter=record.get("filter", {}).get("passed", False),
+                )
+                for record in jobs
+            ],
+            commit=False,
+        )
+
+        # Index only after the jobs are stored so a crash never hides an unsaved posting;
+        # passed jobs are indexed once they are sent (see _send_jobs), so a failed send
+        # is retried by the next incremental run
+        JobIndexRepository(session).record(
+            run_id,
+            {
+                r["url"]: r["fingerprint"]
+                for r in jobs
+                if r.get("url") and r.get("fingerprint") and not r.get("filter", {}).get("passed")
+            },
+            commit=False,
+        )
+
+        if summary.get("url"):
+            SourceRepository(session).record_result(
+                url=summary.get("url"),
+                jobs_found=summary.get("passed", 0),
+                status=summary.get("status", "active"),
+                commit=False,
+            )
+        elif summary.get("source"):
+            # Jobs that passed on a listing's detail pages
+            SourceRepository(session).add_yield(summary["source"], summary.get("passed", 0), commit=False)
+        session.commit()
+
+    async def _send_jobs(self, run_id: str, config: dict, jobs: list) -> list[SendResult]:
+        """Deliver the jobs not yet sent for this run; returns their results."""
+        # Attempts and idempotency keys are per job URL; a job without one cannot be tracked
+        jobs = [record for record in jobs if record.get("url")]
+        # A resumed run may replay a page whose jobs were partly sent before the restart
+        sent = await run_db(lambda s: OutboundRepository(s).sent_urls(run_id, [r["url"] for r in jobs]))
+        jobs = [record for record in jobs if record["url"] not in sent]
+        if not jobs:
+            return []
+        saved = await run_db(
+            lambda s: OutboundRepository(s).bulk_add(
+                [OutboundAttempt(run_id=run_id, job_url=record.get("url"), status="pending") for record in jobs]
+            )
+        )
+        attempt_ids = [attempt_id for _, attempt_id in saved]
+
+        dispatcher = get_dispatcher(mock=config.get("use_mock_outbound", True))
+        results = await dispatcher.send(run_id, jobs)
+
+        def _record(session) -> None:
+            repo = OutboundRepository(session)
+            for attempt_id, result in zip(attempt_ids, results):
+                repo.update_status(attempt_id, result.status, result.response_status, result.response_body)
+            JobIndexRepository(session).record(
+                run_id,
+                {
+                    record["url"]: record["fingerprint"]
+                    for record, result in zip(jobs, results)
+                    if result.status == SENT and record.get("fingerprint")
+                },
+            )
+
+        await run_db(_record)
+
+        # publish outbound saved events so the UI can update outbound status
+        for record, attempt_id, result in zip(jobs, attempt_ids, results):
+            job_url = record["url"]
+            if result.status != SENT:
+                logger.warning(f"⚠️ Outbound send failed ({result.response_status}) for {job_url}")
+                continue
+            try:
+                await self._save_event(
+                    run_id,
+                    EventType.PROGRESS,
+                    strings.outbound_saved(job_url),
+                    {"job_url": job_url, "attempt_id": attempt_id, "event": "outbound_saved"},
+                )
+            except Exception:
+                # do not fail the whole run for event publish issues
+                pass
+        return results
+
+    async def _watch_run(self, run_id: str, urls: list) -> None:
+        """Worker mode: queue the run's sources and report progress until the workers drain it."""
+        settings = get_settings()
+        await Pipeline.enqueue(run_id, urls)
+        last = None
+        while not self.should_stop(run_id):
+            counts = await run_db(lambda s: CrawlTaskRepository(s).counts(run_id))
+            if counts != last:
+                done = counts.get(CrawlTaskRepository.SENT, 0) + counts.get(CrawlTaskRepository.FAILED, 0)
+                total = sum(counts.values())
+                await self._save_event(
+                    run_id,
+                    EventType.PROGRESS,
+                    strings.run_queue_progress(done, total),
+                    {"tasks": counts, "event": "run_queue"},
+                )
+                last = counts
+            if not await run_db(lambda s: CrawlTaskRepository(s).remaining(run_id, settings.task_max_attempts)):
+                return
+            await asyncio.sleep(settings.worker_poll_seconds)
+
     async def start_run(self, run_id: str, config_json: str) -> None:
         print(f"DEBUG: RunManager.start_run called for {run_id}")
         self.stop_flags[run_id] = False
+        self.active.add(run_id)
         pipeline = Pipeline(self)
 
         config = json.loads(config_json)
@@ -53,64 +190,14 @@ class RunManager:
 
         try:
             print(f"DEBUG: Starting pipeline for {len(config.get('urls', []))} URLs")
-            run_request = SimpleNamespace(urls=config.get("urls", []))
-            result = await pipeline.run(run_request, run_id)
-            result = result or {"jobs": [], "sources": []}
-            jobs_processed = result.get("jobs", [])
-            sources_summary = result.get("sources", [])
-
-            with session_scope() as session:
-                job_repo = JobRepository(session)
-                outbound_repo = OutboundRepository(session)
-                run_repo = RunRepository(session)
-                source_repo = SourceRepository(session)
-
-                for record in jobs_processed:
-                    job = Job(
-                        run_id=run_id,
-                        url=record.get("url"),
-                        title=record.get("title"),
-                        company=record.get("company"),
-                        location=record.get("location"),
-                        region=record.get("region"),
-                        description=record.get("description"),
-                        summary=record.get("summary"),
-                        classification_label=record.get("classification", {}).get("label"),
-                        classification_score=record.get("classification", {}).get("score"),
-                        score=record.get("filter", {}).get("score"),
-                        passed_filter=record.get("filter", {}).get("passed", False),
-                    )
-                    job_repo.upsert(job)
-
-                    if record.get("filter", {}).get("passed"):
-                        attempt = outbound_repo.add(
-                            OutboundAttempt(
-                                run_id=run_id,
-                                job_url=record.get("url"),
-                                status="sent",
-                                response_body="mock" if config.get("use_mock_outbound", True) else "sent",
-                            )
-                        )
-                        # publish outbound saved event so the UI can update outbound status
-                        try:
-                            await self._save_event(
-                                run_id,
-                                EventType.PROGRESS,
-                                strings.outbound_saved(record.get("url", "")),
-                                {"job_url": record.get("url"), "attempt_id": attempt.id, "event": "outbound_saved"},
-                            )
-                        except Exception:
-                            # do not fail the whole run for event publish issues
-                            pass
-
-                for summary in sources_summary:
-                    source_repo.record_result(
-                        url=summary.get("url"),
-                        jobs_found=summary.get("passed", 0),
-                        status=summary.get("status", "active"),
-                    )
-
-                run_repo.update_status(run_id, "stopped" if self.should_stop(run_id) else "completed")
+            if get_settings().worker_mode == "workers":
+                await self._watch_run(run_id, config.get("urls", []))
+            else:
+                run_request = SimpleNamespace(urls=config.get("urls", []), incremental=config.get("incremental"))
+                # Jobs are stored and sent page by page while the run streams
+                await pipeline.run(run_request, run_id, sink=RunSink(self, run_id, config))
+            status = "stopped" if self.should_stop(run_id) else "completed"
+            await run_db(lambda s: RunRepository(s).update_status(run_id, status))
 
             if self.should_stop(run_id):
                 await self._save_event(run_id, EventType.STOP, strings.pipeline_stopped())
@@ -118,12 +205,28 @@ class RunManager:
                 await self._save_event(run_id, EventType.DONE, strings.pipeline_completed())
 
         except asyncio.CancelledError:
-            with session_scope() as session:
-                run_repo = RunRepository(session)
-                run_repo.update_status(run_id, "cancelled")
+            if get_settings().worker_mode == "workers":
+                raise  # only the watcher stopped; workers keep draining the run
+            await run_db(lambda s: RunRepository(s).update_status(run_id, "cancelled"))
             await self._save_event(run_id, EventType.STOP, "run cancelled")
         except Exception as exc:  # noqa: BLE001
-            with session_scope() as session:
-                run_repo = RunRepository(session)
-                run_repo.update_status(run_id, "failed")
+            await run_db(lambda s: RunRepository(s).update_status(run_id, "failed"))
             await self._save_event(run_id, EventType.ERROR, f"run failed: {exc}")
+        finally:
+            self.active.discard(run_id)
+            await self.event_writer.flush()
+
+
+class RunSink:
+    """Where the streaming pipeline hands each filtered page and its passed jobs."""
+
+    def __init__(self, manager: RunManager, run_id: str, config: dict):
+        self.manager = manager
+        self.run_id = run_id
+        self.config = config
+
+    async def store(self, jobs: list, summary: dict) -> None:
+        await run_db(lambda s: self.manager._store_page(s, self.run_id, jobs, summary))
+
+    async def send(self, jobs: list) -> list[SendResult]:
+        return await self.manager._send_jobs(self.run_id, self.config, jobs)
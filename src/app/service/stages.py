@@ -0,0 +1,100 @@
+"""Streaming stage graph: named stages connected by bounded asyncio queues.
+
+Each stage runs ``workers`` coroutines that take items from its queue and hand
+results to other stages with ``StageGraph.put``. A full downstream queue blocks
+``put``, so upstream stages (fetch) pause on their own when later stages fall
+behind. The graph is finished when no item is queued or in flight anywhere.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Stage:
+    name: str
+    fn: Callable[[Any], Awaitable[None]]
+    workers: int = 1
+    queue: asyncio.Queue = field(default_factory=asyncio.Queue)
+    processed: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    tasks: List[asyncio.Task] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        return {
+            "workers": self.workers,
+            "processed": self.processed,
+            "errors": self.errors,
+            "queued": self.queue.qsize(),
+            "ms": round(self.seconds * 1000, 1),
+        }
+
+
+class StageGraph:
+    def __init__(self, queue_size: int = 8):
+        self.queue_size = max(1, queue_size)
+        self.stages: Dict[str, Stage] = {}
+        self._pending = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def stage(self, name: str, fn: Callable[[Any], Awaitable[None]], workers: int = 1, bounded: bool = True) -> None:
+        """Register a stage. Unbounded queues suit entry stages fed back into by later ones."""
+        queue = asyncio.Queue(maxsize=self.queue_size if bounded else 0)
+        self.stages[name] = Stage(name, fn, max(1, workers), queue)
+
+    async def put(self, name: str, item: Any) -> None:
+        """Queue ``item`` for stage ``name``; waits while that stage's queue is full."""
+        self._pending += 1
+        self._idle.clear()
+        try:
+            await self.stages[name].queue.put(item)
+        except BaseException:
+            self._finished_one()
+            raise
+
+    def _finished_one(self) -> None:
+        self._pending -= 1
+        if self._pending == 0:
+            self._idle.set()
+
+    async def _worker(self, stage: Stage) -> None:
+        while True:
+            item = await stage.queue.get()
+            started = time.perf_counter()
+            try:
+                await stage.fn(item)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # noqa: BLE001 - one bad item must not stop the run
+                stage.errors += 1
+                logger.error(f"❌ Stage {stage.name} failed: {e}")
+            finally:
+                stage.seconds += time.perf_counter() - started
+                stage.processed += 1
+                stage.queue.task_done()
+                self._finished_one()
+
+    async def run(self, entry: str, items: Iterable[Any]) -> None:
+        """Feed ``items`` to stage ``entry`` and return once the whole graph has drained."""
+        for stage in self.stages.values():
+            stage.tasks = [asyncio.create_task(self._worker(stage)) for _ in range(stage.workers)]
+        try:
+            for item in items:
+                await self.put(entry, item)
+            await self._idle.wait()
+        finally:
+            tasks = [t for stage in self.stages.values() for t in stage.tasks]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def report(self, name: Optional[str] = None) -> Dict:
+        if name:
+            return self.stages[name].to_dict()
+        return {stage.name: stage.to_dict() for stage in self.stages.values()}
@@ -0,0 +1,60 @@
+import asyncio
+import logging
+from typing import Any, List, Optional
+
+from src.app.config import get_settings
+from src.db.session import run_db
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBatcher:
+    """Buffers ORM rows and inserts them in one transaction per batch.
+
+    A batch is written when it reaches ``max_rows`` or ``max_delay_ms`` after the
+    first buffered row, whichever comes first. Call ``flush()`` at the end of a run
+    (or ``close()`` on shutdown) to write whatever is left.
+    """
+
+    def __init__(self, max_rows: Optional[int] = None, max_delay_ms: Optional[int] = None):
+        settings = get_settings()
+        self.max_rows = max(1, max_rows or settings.db_batch_max_rows)
+        self.max_delay = (max_delay_ms if max_delay_ms is not None else settings.db_batch_max_delay_ms) / 1000
+        self._pending: List[Any] = []
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+        self.batches = 0
+        self.rows = 0
+
+    async def add(self, row: Any) -> None:
+        self._pending.append(row)
+        if len(self._pending) >= self.max_rows:
+            await self.flush()
+        elif self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.max_delay)
+        try:
+            await self.flush()
+        except Exception as exc:  # noqa: BLE001
+            logger.error(f"❌ Batched write failed: {exc}")
+
+    async def flush(self) -> None:
+        async with self._lock:
+            rows, self._pending = self._pending, []
+            if not rows:
+                return
+            await run_db(lambda s: self._write(s, rows))
+            self.batches += 1
+            self.rows += len(rows)
+
+    @staticmethod
+    def _write(session, rows: List[Any]) -> None:
+        session.add_all(rows)
+        session.commit()
+
+    async def close(self) -> None:
+        if self._timer and not self._timer.done() and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        await self.flush()
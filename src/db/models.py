@@ -1,6 +1,7 @@
 import datetime as dt
 from typing import Optional
 
+from sqlalchemy import UniqueConstraint
 from sqlmodel import Field, SQLModel
 
 
@@ -14,6 +15,8 @@ class Run(SQLModel, table=True):
 
 
 class Job(SQLModel, table=True):
+    __table_args__ = (UniqueConstraint("run_id", "url", name="uq_job_run_url"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     run_id: str = Field(index=True)
     url: str = Field(index=True)
@@ -60,3 +63,60 @@ class JobSource(SQLModel, table=True):
     last_run_yield: int = Field(default=0)
     last_error: Optional[str] = None
     created_at: dt.datetime = Field(default_factory=lambda: dt.datetime.utcnow())
+
+
+class DomainFetchProfile(SQLModel, table=True):
+    """Remembers which fetch tier (http|browser) last produced usable HTML for a domain."""
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    domain: str = Field(index=True, unique=True)
+    tier: str = Field(default="http")
+    updated_at: dt.datetime = Field(default_factory=lambda: dt.datetime.utcnow())
+
+
+class JobIndex(SQLModel, table=True):
+    """Cross-run index of every job posting seen, keyed by URL with a content fingerprint."""
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    url: str = Field(index=True, unique=True)
+    fingerprint: str
+    last_run_id: Optional[str] = None
+    first_seen_at: dt.datetime = Field(default_factory=lambda: dt.datetime.utcnow())
+    last_seen_at: dt.datetime = Field(default_factory=lambda: dt.datetime.utcnow())
+
+
+class ClassificationCacheEntry(SQLModel, table=True):
+    """Persisted classifier output keyed by hash(model, max_length, normalized text)."""
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    key: str = Field(index=True, unique=True)
+    model: str = Field(index=True)
+    label: Optional[str] = None
+    score: float = 0.0
+    last_used_at: dt.datetime = Field(default_factory=lambda: dt.datetime.utcnow(), index=True)
+
+
+class CrawlTask(SQLModel, table=True):
+    """Durable per-URL work item of a run: pending -> fetched -> classified -> sent.
+
+    ``payload_json`` carries what the next state needs (the listing entry for a
+    detail page, extracted or filtered jobs), so a restarted run continues from
+    the last checkpoint instead of fetching and classifying again.
+    """
+
+    __table_args__ = (UniqueConstraint("run_id", "url", name="uq_crawltask_run_url"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    run_id: str = Field(index=True)
+    url: str
+    kind: str = Field(default="source")  # source|detail
+    depth: int = Field(default=0)
+    source_url: Optional[str] = None
+    ordinal: int = Field(default=0)  # position of the source in the run request
+    state: str = Field(default="pending", index=True)  # pending|fetched|classified|sent|failed
+    payload_json: Optional[str] = None
+    attempts: int = Field(default=0)
+    last_error: Optional[str] = None
+    claimed_by: Optional[str] = None
+    claimed_at: Optional[dt.datetime] = None
+    updated_at: dt.datetime = Field(default_factory=lambda: dt.datetime.utcnow())
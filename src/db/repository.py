@@ -1,9 +1,35 @@
 import datetime as dt
 from typing import Iterable, Optional
 
+import json
+
+from sqlalchemy import case, delete, func, insert, or_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import Session, select
 
-from src.db.models import Job, OutboundAttempt, ProgressEvent, Run, JobSource
+from src.db.models import (
+    ClassificationCacheEntry,
+    CrawlTask,
+    DomainFetchProfile,
+    Job,
+    JobIndex,
+    JobSource,
+    OutboundAttempt,
+    ProgressEvent,
+    Run,
+)
+
+
+BULK_CHUNK_SIZE = 500
+
+
+def _chunks(rows: list, size: int = BULK_CHUNK_SIZE):
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _row(model, exclude: set[str]) -> dict:
+    return {k: v for k, v in model.dict().items() if k not in exclude}
 
 
 class RunRepository:
@@ -26,26 +52,51 @@ class RunRepository:
     def get(self, run_id: str) -> Optional[Run]:
         return self.session.exec(select(Run).where(Run.run_id == run_id)).first()
 
+    def running(self) -> list[Run]:
+        return list(self.session.exec(select(Run).where(Run.status == "running")))
+
+    def interrupt_running(self) -> int:
+        """Mark runs left "running" by a dead process as "interrupted" (resumable)."""
+        result = self.session.exec(update(Run).where(Run.status == "running").values(status="interrupted"))
+        self.session.commit()
+        return result.rowcount
+
 
 class JobRepository:
     def __init__(self, session: Session):
         self.session = session
 
-    def upsert(self, job: Job) -> Job:
+    def upsert(self, job: Job, commit: bool = True) -> Job:
+        """Insert or update by (run_id, url); ``commit=False`` leaves the caller to commit once per batch."""
         existing = self.session.exec(
             select(Job).where(Job.run_id == job.run_id, Job.url == job.url)
         ).first()
+        target = existing or job
         if existing:
             for field, value in job.dict(exclude_unset=True).items():
                 setattr(existing, field, value)
-            self.session.add(existing)
+        self.session.add(target)
+        if commit:
             self.session.commit()
-            self.session.refresh(existing)
-            return existing
-        self.session.add(job)
-        self.session.commit()
-        self.session.refresh(job)
-        return job
+            self.session.refresh(target)
+        return target
+
+    def bulk_upsert(self, jobs: list[Job], commit: bool = True) -> int:
+        """Upsert many jobs with INSERT ... ON CONFLICT(run_id, url) DO UPDATE, in chunks."""
+        rows = [_row(job, {"id"}) for job in jobs if job.url]
+        if not rows:
+            return 0
+        updatable = [c for c in rows[0] if c not in ("run_id", "url", "created_at")]
+        for chunk in _chunks(rows):
+            stmt = sqlite_insert(Job).values(chunk)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["run_id", "url"],
+                set_={column: stmt.excluded[column] for column in updatable},
+            )
+            self.session.execute(stmt)
+        if commit:
+            self.session.commit()
+        return len(rows)
 
     def list_passed(self, run_id: str) -> Iterable[Job]:
         return self.session.exec(select(Job).where(Job.run_id == run_id, Job.passed_filter == True))  # noqa: E712
@@ -69,12 +120,38 @@ class OutboundRepository:
     def __init__(self, session: Session):
         self.session = session
 
-    def add(self, attempt: OutboundAttempt) -> OutboundAttempt:
+    def add(self, attempt: OutboundAttempt, commit: bool = True) -> OutboundAttempt:
         self.session.add(attempt)
-        self.session.commit()
-        self.session.refresh(attempt)
+        if commit:
+            self.session.commit()
+            self.session.refresh(attempt)
+        else:
+            self.session.flush()  # assigns the id without ending the transaction
         return attempt
 
+    def bulk_add(self, attempts: list[OutboundAttempt], commit: bool = True) -> list[tuple[str, int]]:
+        """Insert many attempts; returns (job_url, attempt_id) pairs in input order."""
+        rows = [_row(attempt, {"id"}) for attempt in attempts]
+        saved: list[tuple[str, int]] = []
+        for chunk in _chunks(rows):
+            stmt = insert(OutboundAttempt).returning(
+                OutboundAttempt.job_url, OutboundAttempt.id, sort_by_parameter_order=True
+            )
+            result = self.session.execute(stmt, chunk)
+            saved.extend((job_url, attempt_id) for job_url, attempt_id in result)
+        if commit:
+            self.session.commit()
+        return saved
+
+    def sent_urls(self, run_id: str, urls: list[str]) -> set[str]:
+        """Job URLs of the run that already have a successful attempt (resume-safe sends)."""
+        if not urls:
+            return set()
+        stmt = select(OutboundAttempt.job_url).where(
+            OutboundAttempt.run_id == run_id, OutboundAttempt.job_url.in_(urls), OutboundAttempt.status == "sent"
+        )
+        return set(self.session.exec(stmt))
+
     def update_status(self, attempt_id: int, status: str, response_status: Optional[int] = None, response_body: Optional[str] = None) -> None:
         attempt = self.session.get(OutboundAttempt, attempt_id)
         if not attempt:
@@ -92,7 +169,9 @@ class SourceRepository:
     def __init__(self, session: Session):
         self.session = session
 
-    def record_result(self, url: str, jobs_found: int, last_error: str | None = None, status: str | None = None) -> JobSource:
+    def record_result(
+        self, url: str, jobs_found: int, last_error: str | None = None, status: str | None = None, commit: bool = True
+    ) -> JobSource:
         source = self.session.exec(select(JobSource).where(JobSource.url == url)).first()
         if not source:
             source = JobSource(url=url)
@@ -105,8 +184,24 @@ class SourceRepository:
         else:
             source.status = "active" if jobs_found > 0 else (source.status or "empty")
         self.session.add(source)
-        self.session.commit()
-        self.session.refresh(source)
+        if commit:
+            self.session.commit()
+            self.session.refresh(source)
+        return source
+
+    def add_yield(self, url: str, jobs_found: int, commit: bool = True) -> JobSource:
+        """Add jobs found after ``record_result`` (e.g. on the source's detail pages) to its last run."""
+        source = self.session.exec(select(JobSource).where(JobSource.url == url)).first()
+        if not source:
+            source = JobSource(url=url, last_scraped_at=dt.datetime.utcnow())
+        source.last_run_yield = (source.last_run_yield or 0) + max(jobs_found, 0)
+        source.total_jobs_found = (source.total_jobs_found or 0) + max(jobs_found, 0)
+        if jobs_found > 0:
+            source.status = "active"
+        self.session.add(source)
+        if commit:
+            self.session.commit()
+            self.session.refresh(source)
         return source
 
     def mark_failure(self, url: str, error: str) -> JobSource:
@@ -121,6 +216,10 @@ class SourceRepository:
         self.session.refresh(source)
         return source
 
+    def last_scraped(self, urls: list[str]) -> dict[str, dt.datetime]:
+        rows = self.session.exec(select(JobSource).where(JobSource.url.in_(urls)))
+        return {row.url: row.last_scraped_at for row in rows if row.last_scraped_at}
+
     def list_successful(self, limit: int = 50) -> list[JobSource]:
         return list(
             self.session.exec(
@@ -130,3 +229,278 @@ class SourceRepository:
                 .limit(limit)
             )
         )
+
+
+class FetchProfileRepository:
+    """Per-domain fetch tier hints so later runs skip straight to the tier that worked."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def preferred_tiers(self, max_age_days: int) -> dict[str, str]:
+        cutoff = dt.datetime.utcnow() - dt.timedelta(days=max_age_days)
+        rows = self.session.exec(select(DomainFetchProfile).where(DomainFetchProfile.updated_at >= cutoff))
+        return {row.domain: row.tier for row in rows}
+
+    def record_tiers(self, tiers: dict[str, str]) -> None:
+        if not tiers:
+            return
+        existing = {
+            row.domain: row
+            for row in self.session.exec(select(DomainFetchProfile).where(DomainFetchProfile.domain.in_(list(tiers))))
+        }
+        now = dt.datetime.utcnow()
+        for domain, tier in tiers.items():
+            row = existing.get(domain) or DomainFetchProfile(domain=domain)
+            row.tier = tier
+            row.updated_at = now
+            self.session.add(row)
+        self.session.commit()
+
+
+class CrawlTaskRepository:
+    """Durable run queue: tasks are enqueued once per (run_id, url) and claimed with a lease."""
+
+    PENDING = "pending"
+    FETCHED = "fetched"
+    CLASSIFIED = "classified"
+    SENT = "sent"
+    FAILED = "failed"
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def enqueue(self, tasks: list[CrawlTask], claimed_by: Optional[str] = None) -> list[CrawlTask]:
+        """Insert tasks not yet known for their run; returns only the newly inserted ones.
+
+        ``claimed_by`` hands the new tasks straight to the caller (e.g. detail pages
+        found by a worker that will fetch them itself).
+        """
+        now = dt.datetime.utcnow()
+        rows = []
+        for task in tasks:
+            row = _row(task, {"id"})
+            if claimed_by:
+                row.update(claimed_by=claimed_by, claimed_at=now)
+            rows.append(row)
+        created = []
+        for chunk in _chunks(rows):
+            stmt = sqlite_insert(CrawlTask).values(chunk).on_conflict_do_nothing(index_elements=["run_id", "url"])
+            created.extend(self.session.exec(stmt.returning(CrawlTask)).scalars().all())
+        self.session.commit()
+        return created
+
+    @staticmethod
+    def _claimable(states: Iterable[str], lease_seconds: int, max_attempts: int) -> tuple:
+        stale = dt.datetime.utcnow() - dt.timedelta(seconds=lease_seconds)
+        return (
+            CrawlTask.state.in_(list(states)),
+            CrawlTask.attempts < max_attempts,
+            or_(CrawlTask.claimed_by.is_(None), CrawlTask.claimed_at < stale),
+        )
+
+    def claimable_runs(self, states: Iterable[str], lease_seconds: int = 300, max_attempts: int = 3) -> list[str]:
+        """Running runs with tasks in ``states`` that a worker could claim now, oldest first."""
+        rows = self.session.exec(
+            select(CrawlTask.run_id)
+            .join(Run, Run.run_id == CrawlTask.run_id)
+            .where(Run.status == "running", *self._claimable(states, lease_seconds, max_attempts))
+            .group_by(CrawlTask.run_id)
+            .order_by(func.min(CrawlTask.id))
+        )
+        return list(rows)
+
+    def claim(
+        self,
+        run_id: str,
+        worker: str,
+        states: Iterable[str],
+        limit: Optional[int] = 100,
+        lease_seconds: int = 300,
+        max_attempts: int = 3,
+    ) -> list[CrawlTask]:
+        """Atomically take up to ``limit`` (``None``: all) unclaimed or lease-expired tasks in ``states``."""
+        now = dt.datetime.utcnow()
+        candidates = (
+            select(CrawlTask.id)
+            .where(CrawlTask.run_id == run_id, *self._claimable(states, lease_seconds, max_attempts))
+            .order_by(CrawlTask.depth, CrawlTask.ordinal, CrawlTask.id)
+        )
+        if limit is not None:
+            candidates = candidates.limit(limit)
+        stmt = (
+            update(CrawlTask)
+            .where(CrawlTask.id.in_(candidates.scalar_subquery()))
+            .values(claimed_by=worker, claimed_at=now)
+            .returning(CrawlTask)
+        )
+        claimed = list(self.session.exec(stmt).scalars().all())
+        self.session.commit()
+        return sorted(claimed, key=lambda t: (t.depth, t.ordinal, t.id))
+
+    def advance(
+        self,
+        task_id: int,
+        state: str,
+        payload: Optional[dict] = None,
+        error: Optional[str] = None,
+        keep_claim: bool = False,
+    ) -> None:
+        """Checkpoint a task; ``sent``/``failed`` drop the payload.
+
+        The claim is released so another worker can take the task from here, unless
+        ``keep_claim`` (the claiming worker carries on with it), which renews the lease.
+        """
+        now = dt.datetime.utcnow()
+        values = {"state": state, "updated_at": now}
+        if keep_claim:
+            values["claimed_at"] = now
+        else:
+            values.update(claimed_by=None, claimed_at=None)
+        if state in (self.SENT, self.FAILED):
+            values["payload_json"] = None
+        elif payload is not None:
+            values["payload_json"] = json.dumps(payload)
+        if state == self.FAILED:
+            values.update(attempts=CrawlTask.attempts + 1, last_error=error)
+        self.session.exec(update(CrawlTask).where(CrawlTask.id == task_id).values(**values))
+        self.session.commit()
+
+    def release(
+        self,
+        run_id: str,
+        worker: Optional[str] = None,
+        errors: Optional[dict[int, str]] = None,
+        max_attempts: int = 3,
+    ) -> None:
+        """Return tasks claimed by ``worker`` (default: anyone) to the queue, e.g. after a stop request.
+
+        Tasks in ``errors`` (task id -> message) count an attempt; once they reach
+        ``max_attempts`` they are left ``failed`` for good instead of being retried.
+        """
+        now = dt.datetime.utcnow()
+        for task_id, error in (errors or {}).items():
+            self.session.exec(
+                update(CrawlTask)
+                .where(CrawlTask.id == task_id)
+                .values(
+                    attempts=CrawlTask.attempts + 1,
+                    last_error=error,
+                    state=case((CrawlTask.attempts + 1 >= max_attempts, self.FAILED), else_=CrawlTask.state),
+                    claimed_by=None,
+                    claimed_at=None,
+                    updated_at=now,
+                )
+            )
+        stmt = update(CrawlTask).where(CrawlTask.run_id == run_id, CrawlTask.claimed_by.is_not(None))
+        if worker:
+            stmt = stmt.where(CrawlTask.claimed_by == worker)
+        self.session.exec(stmt.values(claimed_by=None, claimed_at=None))
+        self.session.commit()
+
+    def urls(self, run_id: str) -> list[str]:
+        return list(self.session.exec(select(CrawlTask.url).where(CrawlTask.run_id == run_id)))
+
+    def remaining(self, run_id: str, max_attempts: int = 3) -> int:
+        """Tasks the run still has to finish: not sent, and not out of attempts (in any state)."""
+        return self.session.exec(
+            select(func.count()).where(
+                CrawlTask.run_id == run_id,
+                CrawlTask.state != self.SENT,
+                CrawlTask.attempts < max_attempts,
+            )
+        ).one()
+
+    def counts(self, run_id: str) -> dict[str, int]:
+        rows = self.session.exec(
+            select(CrawlTask.state, func.count()).where(CrawlTask.run_id == run_id).group_by(CrawlTask.state)
+        )
+        return {state: count for state, count in rows}
+
+
+class JobIndexRepository:
+    """Cross-run job index used by incremental runs to skip unchanged postings."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def fingerprints(self, urls: list[str]) -> dict[str, str]:
+        if not urls:
+            return {}
+        rows = self.session.exec(select(JobIndex).where(JobIndex.url.in_(urls)))
+        return {row.url: row.fingerprint for row in rows}
+
+    def record(self, run_id: str, fingerprints: dict[str, str], commit: bool = True) -> None:
+        if not fingerprints:
+            return
+        existing = {
+            row.url: row for row in self.session.exec(select(JobIndex).where(JobIndex.url.in_(list(fingerprints))))
+        }
+        now = dt.datetime.utcnow()
+        for url, fingerprint in fingerprints.items():
+            row = existing.get(url) or JobIndex(url=url, fingerprint=fingerprint, first_seen_at=now)
+            row.fingerprint = fingerprint
+            row.last_run_id = run_id
+            row.last_seen_at = now
+            self.session.add(row)
+        if commit:
+            self.session.commit()
+
+
+class ClassificationCacheRepository:
+    """Storage for the classification cache (see ``src.nlp.cache``)."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def lookup(self, keys: list[str]) -> dict[str, ClassificationCacheEntry]:
+        """Fetch entries by key and bump their last_used_at for LRU eviction."""
+        if not keys:
+            return {}
+        rows = {
+            row.key: row
+            for row in self.session.exec(select(ClassificationCacheEntry).where(ClassificationCacheEntry.key.in_(keys)))
+        }
+        if rows:
+            self.session.execute(
+                update(ClassificationCacheEntry)
+                .where(ClassificationCacheEntry.key.in_(list(rows)))
+                .values(last_used_at=dt.datetime.utcnow())
+            )
+            self.session.commit()
+        return rows
+
+    def store(self, model: str, results: dict[str, dict]) -> None:
+        now = dt.datetime.utcnow()
+        rows = [
+            {"key": key, "model": model, "label": r.get("label"), "score": float(r.get("score") or 0.0), "last_used_at": now}
+            for key, r in results.items()
+        ]
+        for chunk in _chunks(rows):
+            stmt = sqlite_insert(ClassificationCacheEntry).values(chunk)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["key"],
+                set_={"label": stmt.excluded.label, "score": stmt.excluded.score, "last_used_at": now},
+            )
+            self.session.execute(stmt)
+        self.session.commit()
+
+    def count(self) -> int:
+        return self.session.exec(select(func.count()).select_from(ClassificationCacheEntry)).one()
+
+    def evict(self, max_entries: int) -> int:
+        """Delete least-recently-used entries beyond ``max_entries``."""
+        excess = self.count() - max_entries
+        if excess <= 0:
+            return 0
+        oldest = (
+            select(ClassificationCacheEntry.id).order_by(ClassificationCacheEntry.last_used_at).limit(excess)
+        )
+        self.session.execute(delete(ClassificationCacheEntry).where(ClassificationCacheEntry.id.in_(oldest)))
+        self.session.commit()
+        return excess
+
+    def purge_other_models(self, model: str) -> int:
+        result = self.session.execute(delete(ClassificationCacheEntry).where(ClassificationCacheEntry.model != model))
+        self.session.commit()
+        return result.rowcount or 0
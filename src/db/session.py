@@ -1,23 +1,89 @@
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterator
-from contextlib import contextmanager
+from typing import AsyncIterator, Callable, Iterator, TypeVar
+from contextlib import asynccontextmanager, contextmanager
 
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.app.config import get_settings
 
+T = TypeVar("T")
 
-def _engine_url(db_path: str) -> str:
+
+def _engine_url(db_path: str, driver: str = "sqlite") -> str:
     path = Path(db_path)
     if not path.parent.exists():
         path.parent.mkdir(parents=True, exist_ok=True)
-    return f"sqlite:///{path}"
+    return f"{driver}:///{path}"
+
+
+def _sqlite_pragmas() -> list[str]:
+    settings = get_settings()
+    return [
+        f"PRAGMA journal_mode={settings.db_journal_mode}",
+        f"PRAGMA synchronous={settings.db_synchronous}",
+        f"PRAGMA busy_timeout={int(settings.db_busy_timeout_ms)}",
+        f"PRAGMA mmap_size={int(settings.db_mmap_size_mb) * 1024 * 1024}",
+        # negative cache_size is in KiB rather than pages
+        f"PRAGMA cache_size=-{int(settings.db_cache_size_mb) * 1024}",
+        "PRAGMA temp_store=MEMORY",
+    ]
+
+
+def _apply_sqlite_profile(sync_engine) -> None:
+    """Apply the tuned SQLite profile (WAL, relaxed fsync, mmap, cache) to every new connection."""
+    pragmas = _sqlite_pragmas()
 
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection, _record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
 
+
+@lru_cache(maxsize=1)
 def get_engine():
+    """Process-wide sync engine; connections are pooled instead of rebuilt per session."""
     settings = get_settings()
     url = _engine_url(settings.db_path)
-    return create_engine(url, echo=settings.db_echo, connect_args={"check_same_thread": False})
+    engine = create_engine(
+        url,
+        echo=settings.db_echo,
+        connect_args={"check_same_thread": False},
+        poolclass=QueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_pre_ping=True,
+    )
+    _apply_sqlite_profile(engine)
+    return engine
+
+
+@lru_cache(maxsize=1)
+def get_async_engine():
+    """Process-wide aiosqlite engine for code running on the event loop."""
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    settings = get_settings()
+    url = _engine_url(settings.db_path, driver="sqlite+aiosqlite")
+    engine = create_async_engine(
+        url,
+        echo=settings.db_echo,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_pre_ping=True,
+    )
+    _apply_sqlite_profile(engine.sync_engine)
+    return engine
 
 
 def init_db(engine=None) -> None:
@@ -26,17 +92,42 @@ def init_db(engine=None) -> None:
     _run_light_migrations(engine)
 
 
+async def dispose_engines() -> None:
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+    if get_engine.cache_info().currsize:
+        get_engine().dispose()
+
+
 def _column_exists(engine, table: str, column: str) -> bool:
     with engine.connect() as conn:
         res = conn.exec_driver_sql(f"PRAGMA table_info({table})").fetchall()
         return any(row[1] == column for row in res)
 
 
+def _has_unique_index(conn, table: str, name: str, columns: tuple[str, ...]) -> bool:
+    """The named index, or the autoindex SQLite creates for a UNIQUE constraint on ``columns``."""
+    for index_name, unique in conn.exec_driver_sql(f"SELECT name, \"unique\" FROM pragma_index_list('{table}')"):
+        if index_name == name:
+            return True
+        indexed = conn.exec_driver_sql(f"SELECT name FROM pragma_index_info('{index_name}') ORDER BY seqno")
+        if unique and tuple(row[0] for row in indexed) == columns:
+            return True
+    return False
+
+
 def _run_light_migrations(engine) -> None:
     """Minimal, additive migrations for SQLite (safe no-ops if already applied)."""
     with engine.connect() as conn:
         if not _column_exists(engine, "job", "region"):
             conn.exec_driver_sql("ALTER TABLE job ADD COLUMN region VARCHAR")
+        # (run_id, url) uniqueness backs JobRepository.bulk_upsert's ON CONFLICT target
+        if not _has_unique_index(conn, "job", "uq_job_run_url", ("run_id", "url")):
+            conn.exec_driver_sql(
+                "DELETE FROM job WHERE id NOT IN (SELECT MAX(id) FROM job GROUP BY run_id, url)"
+            )
+            conn.exec_driver_sql("CREATE UNIQUE INDEX IF NOT EXISTS uq_job_run_url ON job (run_id, url)")
+        conn.commit()
 
 
 @contextmanager
@@ -44,3 +135,19 @@ def session_scope(engine=None) -> Iterator[Session]:
     engine = engine or get_engine()
     with Session(engine) as session:
         yield session
+
+
+@asynccontextmanager
+async def async_session_scope(engine=None) -> AsyncIterator[AsyncSession]:
+    engine = engine or get_async_engine()
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+
+
+async def run_db(fn: Callable[[Session], T], engine=None) -> T:
+    """Run a sync repository callable over aiosqlite without blocking the event loop.
+
+    Example: ``run = await run_db(lambda s: RunRepository(s).get(run_id))``
+    """
+    async with async_session_scope(engine) as session:
+        return await session.run_sync(fn)
@@ -0,0 +1,175 @@
+"""Parse-once HTML documents on lxml.
+
+A ``Document`` parses the HTML a single time and answers every lookup the
+scraper needs (links, title, company, location, main text, embedded scripts)
+from that one tree, instead of each helper building its own BeautifulSoup.
+"""
+import html as html_lib
+import re
+from typing import Dict, List, Optional
+
+import lxml.html
+from lxml import etree
+
+# Removed from the tree before any lookup
+EXCLUDED_TAGS = ("script", "style", "noscript", "template")
+# Page chrome: kept in the tree the adapters query (job cards may carry a <header>),
+# left out of text lookups like the BeautifulSoup extractor did
+CHROME_TAGS = ("nav", "footer", "header")
+# A <header>/<footer> inside one of these belongs to that content, not to the page
+SECTIONING_TAGS = ("article", "section", "aside", "main")
+HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+
+_COMPANY_CLASS = re.compile("company|employer", re.I)
+_LOCATION_CLASS = re.compile("location", re.I)
+_SPACES = re.compile(r"\s+")
+
+
+def clean_text(text: str) -> str:
+    return _SPACES.sub(" ", text).strip()
+
+
+def html_text(fragment: Optional[str]) -> str:
+    """Visible text of an HTML fragment (descriptions in JSON payloads are HTML)."""
+    if not fragment:
+        return ""
+    if "&lt;" in fragment:
+        # Some feeds entity-escape the markup itself
+        fragment = html_lib.unescape(fragment)
+    try:
+        return clean_text(" ".join(lxml.html.fragment_fromstring(fragment, create_parent="div").itertext()))
+    except Exception:
+        return clean_text(fragment)
+
+
+def summarize(description: Optional[str]) -> Optional[str]:
+    """First 400 chars of the description."""
+    return description[:400] + "…" if description and len(description) > 400 else description
+
+
+def _parse(html: str):
+    if not html or not html.strip():
+        return lxml.html.fromstring("<html></html>")
+    # Encode first: lxml rejects str input that carries an XML encoding declaration
+    parser = lxml.html.HTMLParser(encoding="utf-8")
+    try:
+        return lxml.html.document_fromstring(html.encode("utf-8", "replace"), parser=parser)
+    except etree.ParserError:
+        return lxml.html.fromstring("<html></html>")
+
+
+class Document:
+    """One parsed HTML page with the lookups computed in a single pass."""
+
+    def __init__(self, html: str):
+        self.html = html or ""
+        self.root = _parse(self.html)
+
+        # Links and scripts are read before the non-content tags are dropped
+        self.hrefs: List[str] = [a.get("href") for a in self.root.iter("a") if a.get("href")]
+        self.scripts: List[Dict[str, Optional[str]]] = [
+            {"type": (s.get("type") or "").lower(), "id": s.get("id"), "text": s.text}
+            for s in self.root.iter("script")
+            if s.text
+        ]
+        for el in list(self.root.iter(*EXCLUDED_TAGS)):
+            if el.getparent() is not None:
+                el.drop_tree()
+        self._chrome = set()
+        for el in self.root.iter(*CHROME_TAGS):
+            if el.tag == "nav" or next(el.iterancestors(*SECTIONING_TAGS), None) is None:
+                self._chrome.update(el.iter())
+
+        self.title_el = None
+        self.h1 = None
+        self.main = None
+        self.article = None
+        self.site_name: Optional[str] = None
+        self.company_el = None
+        self.location_el = None
+        self.headings = []
+        for el in self.root.iter():
+            tag = el.tag
+            if not isinstance(tag, str) or el in self._chrome:
+                continue  # comments / processing instructions, page chrome
+            if tag in HEADING_TAGS:
+                self.headings.append(el)
+                if tag == "h1" and self.h1 is None:
+                    self.h1 = el
+            elif tag == "title" and self.title_el is None:
+                self.title_el = el
+            elif tag == "main" and self.main is None:
+                self.main = el
+            elif tag == "article" and self.article is None:
+                self.article = el
+            elif tag == "meta" and self.site_name is None and el.get("property") == "og:site_name":
+                self.site_name = el.get("content")
+            classes = el.get("class")
+            if classes:
+                if self.company_el is None and _COMPANY_CLASS.search(classes):
+                    self.company_el = el
+                if self.location_el is None and _LOCATION_CLASS.search(classes):
+                    self.location_el = el
+
+    @classmethod
+    def of(cls, html_or_doc) -> "Document":
+        """Accept either raw HTML or an already parsed Document."""
+        return html_or_doc if isinstance(html_or_doc, Document) else cls(html_or_doc)
+
+    def in_chrome(self, el) -> bool:
+        """True for elements inside the page's nav, header or footer."""
+        return el in self._chrome
+
+    def _itertext(self, el):
+        """``el.itertext()`` without the text of page chrome inside it."""
+        if not self._chrome:
+            yield from el.itertext()
+            return
+        stack = [el]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                yield node
+                continue
+            if node in self._chrome:
+                continue
+            if isinstance(node.tag, str) and node.text:
+                yield node.text
+            for child in reversed(node):
+                if child.tail:
+                    stack.append(child.tail)
+                stack.append(child)
+
+    def text_of(self, el) -> str:
+        return clean_text(" ".join(self._itertext(el))) if el is not None else ""
+
+    @property
+    def title(self) -> Optional[str]:
+        # Like soup.title.string: only a title made of a single text node counts
+        if self.title_el is not None and len(self.title_el) == 0 and self.title_el.text:
+            return clean_text(self.title_el.text) or None
+        return None
+
+    def text(self) -> str:
+        return self.text_of(self.root)
+
+    def main_text(self) -> str:
+        """Text of <main>/<article> when present, otherwise of the whole page."""
+        content = self.main if self.main is not None else self.article
+        return self.text_of(content) if content is not None else self.text()
+
+    def sections(self, names) -> Dict[str, Optional[str]]:
+        """Text following each heading whose label contains one of ``names``."""
+        sections: Dict[str, Optional[str]] = {}
+        for heading in self.headings:
+            key = self.text_of(heading).lower()
+            if not any(name in key for name in names):
+                continue
+            parts = []
+            sib = heading.getnext()
+            while sib is not None and sib.tag not in HEADING_TAGS:
+                if isinstance(sib.tag, str):
+                    parts.append(" ".join(self._itertext(sib)))
+                sib = sib.getnext()
+            sections[key] = clean_text(" ".join(parts)) if parts else None
+        return sections
@@ -1,7 +1,7 @@
-import re
 from typing import Dict, Optional
 
-from bs4 import BeautifulSoup
+from src.extraction.document import Document, clean_text, summarize
+from src.extraction.structured import VIA_DOM, structured_jobs
 
 
 SECTION_HEADINGS = [
@@ -13,73 +13,43 @@ SECTION_HEADINGS = [
 ]
 
 
-def clean_text(text: str) -> str:
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
-
-
-def extract(html: str) -> Dict[str, Optional[str]]:
+def extract(html) -> Dict[str, Optional[str]]:
     """Legacy extractor returning title/text/sections."""
-    soup = BeautifulSoup(html, "lxml")
-    for tag in soup(["script", "style", "nav", "footer", "header"]):
-        tag.decompose()
-    title = soup.title.string.strip() if soup.title and soup.title.string else None
-    body_text = clean_text(soup.get_text(" "))
-
-    sections: Dict[str, Optional[str]] = {}
-    for heading in soup.find_all(re.compile("^h[1-6]$")):
-        key = heading.get_text().strip().lower()
-        if any(h in key for h in SECTION_HEADINGS):
-            content_parts = []
-            sib = heading.find_next_sibling()
-            while sib and sib.name not in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-                content_parts.append(sib.get_text(" "))
-                sib = sib.find_next_sibling()
-            sections[key] = clean_text(" ".join(content_parts)) if content_parts else None
+    doc = Document.of(html)
+    return {"title": doc.title, "text": doc.text(), "sections": doc.sections(SECTION_HEADINGS)}
 
-    return {"title": title, "text": body_text, "sections": sections}
 
+def extract_sections(html) -> Dict[str, Optional[str]]:
+    """Structured extraction used by the pipeline.
 
-def extract_sections(html: str) -> Dict[str, Optional[str]]:
-    """Structured extraction used by the pipeline."""
-    soup = BeautifulSoup(html, "lxml")
-    for tag in soup(["script", "style", "nav", "footer", "header"]):
-        tag.decompose()
+    Accepts raw HTML or a parsed ``Document`` so callers that already parsed the
+    page (link discovery, parsers) do not parse it again. JSON-LD / hydration data
+    is used when present; ``via`` tells which path produced the result.
+    """
+    doc = Document.of(html)
 
-    title = None
-    if soup.title and soup.title.string:
-        title = clean_text(soup.title.string)
-    if not title:
-        h1 = soup.find("h1")
-        if h1 and h1.get_text():
-            title = clean_text(h1.get_text())
+    jobs, via = structured_jobs(doc)
+    if jobs:
+        job = jobs[0]
+        job["company"] = job["company"] or (clean_text(doc.site_name) if doc.site_name else None)
+        job.pop("url", None)
+        job.pop("key", None)
+        return {**job, "via": via}
 
-    company = None
-    company_meta = soup.find("meta", attrs={"property": "og:site_name"})
-    if company_meta and company_meta.get("content"):
-        company = clean_text(company_meta["content"])
-    if not company:
-        company_el = soup.find(class_=re.compile("company|employer", re.I))
-        if company_el:
-            company = clean_text(company_el.get_text())
+    title = doc.title
+    if not title and doc.h1 is not None:
+        title = doc.text_of(doc.h1) or None
 
-    location = None
-    location_el = soup.find(class_=re.compile("location", re.I))
-    if location_el and location_el.get_text():
-        location = clean_text(location_el.get_text())
+    company = clean_text(doc.site_name) if doc.site_name else None
+    if not company and doc.company_el is not None:
+        company = doc.text_of(doc.company_el)
 
-    body_text = clean_text(soup.get_text(" "))
+    location = doc.text_of(doc.location_el) or None
 
     # Description: prefer a main content area
-    description = None
-    main = soup.find("main") or soup.find("article")
-    if main:
-        description = clean_text(main.get_text(" "))
-    else:
-        description = body_text
+    description = doc.main_text()
 
-    # Summary: first 400 chars of description
-    summary = description[:400] + "…" if description and len(description) > 400 else description
+    summary = summarize(description)
 
     return {
         "title": title,
@@ -87,4 +57,5 @@ def extract_sections(html: str) -> Dict[str, Optional[str]]:
         "location": location,
         "description": description,
         "summary": summary,
+        "via": VIA_DOM,
     }
@@ -0,0 +1,238 @@
+"""Fast path: jobs from structured data embedded in the page.
+
+Career sites often ship the job itself as data: schema.org ``JobPosting`` in
+``application/ld+json`` scripts, or framework hydration state (``__NEXT_DATA__``,
+``__NUXT__``, ``window.__INITIAL_STATE__``). Reading those skips the DOM walk and
+gives cleaner fields, notably ``location`` for the geo filter.
+"""
+import json
+import re
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.extraction.document import Document, clean_text, html_text, summarize
+
+VIA_JSONLD = "jsonld"
+VIA_EMBEDDED = "embedded"
+VIA_DOM = "dom"
+
+# Script ids / global assignments that carry framework hydration state
+HYDRATION_IDS = ("__NEXT_DATA__", "__NUXT_DATA__", "__APOLLO_STATE__")
+_HYDRATION_ASSIGNMENT = re.compile(
+    r"\bwindow\.(__NUXT__|__INITIAL_STATE__|__PRELOADED_STATE__|__APOLLO_STATE__|__remixContext)\s*=\s*"
+)
+
+_TITLE_KEYS = ("title", "jobTitle", "positionName", "position_name")
+_LOCATION_KEYS = ("location", "locations", "jobLocation", "locationName", "city", "office", "offices")
+_DESCRIPTION_KEYS = ("description", "jobDescription", "descriptionHtml", "descriptionPlain")
+_URL_KEYS = ("url", "absolute_url", "hostedUrl", "applyUrl", "jobUrl", "externalUrl", "url_comeet_hosted_page")
+_COMPANY_KEYS = ("company", "companyName", "hiringOrganization", "organization")
+# Tell apart postings that share the page URL (no URL of their own)
+_ID_KEYS = ("id", "jobId", "uid", "requisitionId", "shortcode", "slug", "identifier")
+# A title + description alone is too weak (page SEO metadata has both); need one of these too
+_JOB_HINT_KEYS = ("department", "employmentType", "jobId", "requisitionId", "team", "commitment", "datePosted")
+# Stop walking pathological payloads
+MAX_NODES = 50_000
+
+
+def _name(value: Any) -> Optional[str]:
+    if isinstance(value, dict):
+        value = value.get("name") or value.get("title")
+    return clean_text(value) if isinstance(value, str) and value.strip() else None
+
+
+def _place(value: Any) -> Optional[str]:
+    """Location text from a string, a place/address object or a list of them."""
+    if isinstance(value, list):
+        return "; ".join(dict.fromkeys(p for p in (_place(v) for v in value) if p)) or None
+    if isinstance(value, dict):
+        address = value.get("address", value)
+        if isinstance(address, str):
+            return clean_text(address) or None
+        keys = ("addressLocality", "addressRegion", "addressCountry", "city", "region", "country")
+        parts = [_name(address.get(k)) for k in keys]
+        return ", ".join(dict.fromkeys(p for p in parts if p)) or _name(address)
+    return _name(value)
+
+
+def _ident(value: Any) -> Optional[str]:
+    """Posting id from a scalar or a schema.org ``PropertyValue``."""
+    if isinstance(value, dict):
+        value = value.get("value") or value.get("@id") or value.get("name")
+    if isinstance(value, (str, int)) and not isinstance(value, bool) and str(value).strip():
+        return str(value).strip()
+    return None
+
+
+def _job(fields: Dict[str, Optional[str]]) -> Dict[str, Optional[str]]:
+    description = html_text(fields.get("description")) or None
+    return {
+        "url": fields.get("url"),
+        "key": fields.get("key"),
+        "title": clean_text(fields["title"]),
+        "company": fields.get("company"),
+        "location": fields.get("location"),
+        "description": description,
+        "summary": summarize(description),
+    }
+
+
+# --- JSON-LD ---------------------------------------------------------------
+
+
+def _postings(node: Any) -> Iterator[dict]:
+    if isinstance(node, list):
+        for item in node:
+            yield from _postings(item)
+    elif isinstance(node, dict):
+        kind = node.get("@type")
+        if kind == "JobPosting" or (isinstance(kind, list) and "JobPosting" in kind):
+            yield node
+        for key in ("@graph", "itemListElement", "item"):
+            if key in node:
+                yield from _postings(node[key])
+
+
+def has_jsonld_posting(doc: Document) -> bool:
+    return any(s["type"] == "application/ld+json" and "JobPosting" in (s["text"] or "") for s in doc.scripts)
+
+
+def jsonld_jobs(doc: Document) -> List[Dict[str, Optional[str]]]:
+    jobs = []
+    for script in doc.scripts:
+        if script["type"] != "application/ld+json" or "JobPosting" not in (script["text"] or ""):
+            continue
+        try:
+            data = json.loads(script["text"], strict=False)
+        except ValueError:
+            continue
+        for posting in _postings(data):
+            title = _name(posting.get("title"))
+            if not title:
+                continue
+            location = _place(posting.get("jobLocation"))
+            if not location and posting.get("jobLocationType") == "TELECOMMUTE":
+                location = "Remote"
+            url = posting.get("url")
+            jobs.append(
+                _job(
+                    {
+                        "url": url if isinstance(url, str) else None,
+                        "key": _ident(posting.get("identifier")),
+                        "title": title,
+                        "company": _name(posting.get("hiringOrganization")),
+                        "location": location,
+                        "description": posting.get("description"),
+                    }
+                )
+            )
+    return jobs
+
+
+# --- Hydration state --------------------------------------------------------
+
+
+def hydration_payloads(doc: Document) -> Iterator[Any]:
+    decoder = json.JSONDecoder(strict=False)
+    for script in doc.scripts:
+        source = script["text"] or ""
+        try:
+            if script["id"] in HYDRATION_IDS:
+                yield json.loads(source, strict=False)
+                continue
+            match = _HYDRATION_ASSIGNMENT.search(source)
+            if match:
+                yield decoder.raw_decode(source, match.end())[0]
+        except ValueError:
+            continue
+
+
+def has_hydration(doc: Document) -> bool:
+    return any(s["id"] in HYDRATION_IDS or _HYDRATION_ASSIGNMENT.search(s["text"] or "") for s in doc.scripts)
+
+
+def _first_value(node: dict, keys) -> Any:
+    for key in keys:
+        value = node.get(key)
+        if value:
+            return value
+    return None
+
+
+def _looks_like_job(node: dict) -> bool:
+    title = _first_value(node, _TITLE_KEYS)
+    if not isinstance(title, str):
+        return False
+    if any(node.get(k) for k in _LOCATION_KEYS):
+        return True
+    return isinstance(_first_value(node, _DESCRIPTION_KEYS), str) and any(k in node for k in _JOB_HINT_KEYS)
+
+
+def _job_nodes(payload: Any) -> Iterator[dict]:
+    stack, seen = [payload], 0
+    while stack and seen < MAX_NODES:
+        node = stack.pop()
+        seen += 1
+        if isinstance(node, dict):
+            if _looks_like_job(node):
+                yield node
+                continue
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def embedded_jobs(doc: Document) -> List[Dict[str, Optional[str]]]:
+    jobs = []
+    for payload in hydration_payloads(doc):
+        for node in _job_nodes(payload):
+            url = _first_value(node, _URL_KEYS)
+            description = _first_value(node, _DESCRIPTION_KEYS)
+            jobs.append(
+                _job(
+                    {
+                        "url": url if isinstance(url, str) else None,
+                        "key": _ident(_first_value(node, _ID_KEYS)),
+                        "title": _first_value(node, _TITLE_KEYS),
+                        "company": _name(_first_value(node, _COMPANY_KEYS)),
+                        "location": _place(_first_value(node, _LOCATION_KEYS)),
+                        "description": description if isinstance(description, str) else None,
+                    }
+                )
+            )
+    return jobs
+
+
+def structured_jobs(doc: Document) -> Tuple[List[Dict[str, Optional[str]]], str]:
+    """(jobs, via) from JSON-LD, else hydration state; ``([], VIA_DOM)`` if neither."""
+    if has_jsonld_posting(doc):
+        jobs = jsonld_jobs(doc)
+        if jobs:
+            return jobs, VIA_JSONLD
+    if has_hydration(doc):
+        jobs = embedded_jobs(doc)
+        if jobs:
+            return jobs, VIA_EMBEDDED
+    return [], VIA_DOM
+
+
+class ExtractionStats:
+    """Per-source counts of how pages were extracted, and the structured hit rate."""
+
+    def __init__(self):
+        self.by_source: Dict[str, Counter] = defaultdict(Counter)
+
+    def record(self, source: str, via: str, structured: bool) -> None:
+        counts = self.by_source[source]
+        counts[via] += 1
+        counts["total"] += 1
+        counts["structured"] += int(structured)
+
+    def clear(self) -> None:
+        self.by_source.clear()
+
+    def report(self) -> Dict[str, dict]:
+        return {
+            source: {**counts, "hit_rate": round(counts["structured"] / counts["total"], 2)}
+            for source, counts in self.by_source.items()
+        }
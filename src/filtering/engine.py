@@ -1,9 +1,15 @@
-"""Strict filtering ("Iron Dome") enforcing R&D in Israel only."""
-from dataclasses import asdict, dataclass
-from typing import Dict, Optional
+"""Strict filtering ("Iron Dome") enforcing R&D in Israel only.
+
+Filtering runs as a cascade: cheap deterministic stages (title exclusion, geo,
+keyword include) run first and short-circuit, and the model score is consulted
+only for jobs that survive them. Each stage keeps counts and latency.
+"""
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional
 
 from src.filtering.geo_il import resolve_region
-from src.filtering.roles import is_dev_role
+from src.filtering.roles import excluded_title_keyword, has_dev_keyword
 
 
 @dataclass
@@ -25,6 +31,128 @@ class FilterContext:
     min_score: float = 0.5
 
 
+@dataclass
+class FilterState:
+    """A job moving through the cascade; stages may annotate it (e.g. region)."""
+
+    title: Optional[str] = None
+    description: Optional[str] = None
+    summary: Optional[str] = None
+    location: Optional[str] = None
+    region: Optional[str] = None
+    city: Optional[str] = None
+    score: float = 0.0
+
+
+# A stage returns a rejection reason, or None to let the job continue
+StageFn = Callable[[FilterState, FilterContext], Optional[str]]
+
+
+def _title_exclude(state: FilterState, context: FilterContext) -> Optional[str]:
+    bad = excluded_title_keyword(state.title)
+    return f"לא פיתוח ({bad})" if bad else None
+
+
+def _geo(state: FilterState, context: FilterContext) -> Optional[str]:
+    is_israel, state.region, state.city = resolve_region(state.location)
+    return None if is_israel else "משרה שאינה בישראל"
+
+
+def _keyword_include(state: FilterState, context: FilterContext) -> Optional[str]:
+    if has_dev_keyword(state.title, state.description, state.summary):
+        return None
+    return "לא זוהה כתבפקיד פיתוח"
+
+
+def _model_score(state: FilterState, context: FilterContext) -> Optional[str]:
+    if state.score < context.min_score:
+        return f"ציון מודל נמוך ({state.score:.2f}<{context.min_score})"
+    return None
+
+
+STAGES: Dict[str, StageFn] = {
+    "title_exclude": _title_exclude,
+    "geo": _geo,
+    "keyword_include": _keyword_include,
+    "model_score": _model_score,
+}
+MODEL_STAGES = {"model_score"}
+DEFAULT_CASCADE = ("title_exclude", "geo", "keyword_include", "model_score")
+
+
+@dataclass
+class StageStats:
+    evaluated: int = 0
+    rejected: int = 0
+    seconds: float = 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "evaluated": self.evaluated,
+            "rejected": self.rejected,
+            "passed": self.evaluated - self.rejected,
+            "ms": round(self.seconds * 1000, 2),
+        }
+
+
+@dataclass
+class FilterCascade:
+    """Ordered filter stages; everything before the first model stage is "cheap".
+
+    Usage: ``prefilter`` each job, classify only those it returned ``None`` for, then
+    ``complete`` them with the classification.
+    """
+
+    stages: List[str] = field(default_factory=lambda: list(DEFAULT_CASCADE))
+    stats: Dict[str, StageStats] = field(default_factory=dict)
+
+    def __post_init__(self):
+        unknown = [name for name in self.stages if name not in STAGES]
+        if unknown:
+            raise ValueError(f"unknown filter stage(s): {', '.join(unknown)}")
+        split = next((i for i, name in enumerate(self.stages) if name in MODEL_STAGES), len(self.stages))
+        self._cheap = self.stages[:split]
+        self._rest = self.stages[split:]
+        for name in self.stages:
+            self.stats.setdefault(name, StageStats())
+
+    @classmethod
+    def from_config(cls, spec: str) -> "FilterCascade":
+        names = [part.strip() for part in (spec or "").split(",") if part.strip()]
+        return cls(names or list(DEFAULT_CASCADE))
+
+    @property
+    def needs_model(self) -> bool:
+        return bool(self._rest)
+
+    def _run(self, names: List[str], state: FilterState, context: FilterContext) -> Optional[FilterResult]:
+        for name in names:
+            stats = self.stats[name]
+            started = time.perf_counter()
+            reason = STAGES[name](state, context)
+            stats.seconds += time.perf_counter() - started
+            stats.evaluated += 1
+            if reason:
+                stats.rejected += 1
+                return FilterResult(False, reason, state.score, region=state.region, city=state.city)
+        return None
+
+    def prefilter(self, state: FilterState, context: FilterContext) -> Optional[FilterResult]:
+        """Run the cheap stages; a result means the job was rejected without the model."""
+        return self._run(self._cheap, state, context)
+
+    def complete(self, state: FilterState, classification: dict, context: FilterContext) -> FilterResult:
+        state.score = float(classification.get("score", 0) or 0)
+        rejected = self._run(self._rest, state, context)
+        return rejected or FilterResult(True, "עבר סינון", state.score, region=state.region, city=state.city)
+
+    def report(self) -> Dict:
+        report = {name: self.stats[name].to_dict() for name in self.stages}
+        if self._rest:
+            report["model_calls_avoided"] = sum(self.stats[name].rejected for name in self._cheap)
+        return report
+
+
 def evaluate(
     *,
     text: str,
@@ -34,18 +162,9 @@ def evaluate(
     summary: str | None,
     location: str | None,
     context: FilterContext,
+    cascade: FilterCascade | None = None,
 ) -> FilterResult:
-    score = float(classification.get("score", 0) or 0)
-
-    if score < context.min_score:
-        return FilterResult(False, f"ציון מודל נמוך ({score:.2f}<{context.min_score})", score)
-
-    is_dev, reason = is_dev_role(title, description, summary)
-    if not is_dev:
-        return FilterResult(False, reason, score)
-
-    is_israel, region, city = resolve_region(location)
-    if not is_israel:
-        return FilterResult(False, "משרה שאינה בישראל", score, region=region, city=city)
-
-    return FilterResult(True, "עבר סינון", score, region=region, city=city)
+    """One-shot evaluation with an already computed classification."""
+    cascade = cascade or FilterCascade()
+    state = FilterState(title=title, description=description, summary=summary, location=location)
+    return cascade.prefilter(state, context) or cascade.complete(state, classification, context)
@@ -1,7 +1,9 @@
 """Geographic utilities for Israeli region mapping."""
 from __future__ import annotations
 
-from typing import Optional, Tuple
+import re
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 # Basic city/region mapping. Extend as needed.
 CITY_TO_REGION = {
@@ -59,39 +61,153 @@ CITY_TO_REGION = {
     "israel": "מרכז",
 }
 
+# Alternative spellings, Hebrew names and common suffixes -> canonical CITY_TO_REGION key
+CITY_ALIASES = {
+    "tel aviv": ["tel aviv yafo", "tel aviv jaffa", "tlv", "telaviv", "jaffa", "yafo", "תל אביב", "תל אביב יפו", "יפו"],
+    "ramat gan": ["ramat-gan", "ramatgan", "רמת גן", "בורסה"],
+    "givatayim": ["givataim", "גבעתיים"],
+    "bnei brak": ["bnei berak", "bney brak", "בני ברק"],
+    "petah tikva": ["petach tikva", "petah tiqva", "petach tikvah", "petah tikvah", "פתח תקווה", "פתח תקוה"],
+    "kfar saba": ["kfar sava", "כפר סבא"],
+    "netanya": ["natanya", "נתניה"],
+    "herzliya": ["herzliya pituach", "herzlia", "herzelia", "hertzliya", "herzliyya", "הרצליה", "הרצליה פיתוח"],
+    "hod hasharon": ["hod ha sharon", "hod-hasharon", "הוד השרון"],
+    "rehovot": ["rehovoth", "rechovot", "רחובות"],
+    "rishon lezion": ["rishon le zion", "rishon letsiyon", "rishon lezyon", "ראשון לציון", "ראשלצ"],
+    "holon": ["חולון"],
+    "bat yam": ["בת ים"],
+    "jerusalem": ["yerushalayim", "ירושלים"],
+    "modiin": ["modi'in", "modiin maccabim reut", "מודיעין", "מודיעין מכבים רעות"],
+    "haifa": ["heifa", "חיפה", "מתם", "matam"],
+    "kiryat ata": ["קרית אתא"],
+    "kiryat motzkin": ["קרית מוצקין"],
+    "kiryat yam": ["קרית ים"],
+    "nahariya": ["nahariyya", "נהריה"],
+    "zichron yaakov": ["zikhron yaakov", "zichron ya'akov", "זכרון יעקב"],
+    "hadera": ["חדרה"],
+    "ashdod": ["אשדוד"],
+    "ashkelon": ["אשקלון"],
+    "beer sheva": ["be'er sheva", "beer-sheva", "באר שבע"],
+    "eilat": ["אילת"],
+    "yokneam": ["yokneam illit", "yoqneam", "יקנעם", "יקנעם עילית"],
+    "raanana": ["רעננה"],
+    "nazareth": ["נצרת"],
+    "afula": ["עפולה"],
+    "tiberias": ["טבריה"],
+    "metula": ["מטולה"],
+    "karmiel": ["carmiel", "כרמיאל"],
+    "sderot": ["שדרות"],
+    "ofakim": ["אופקים"],
+    "kiryat gat": ["קרית גת"],
+    "kiryat malachi": ["קרית מלאכי"],
+    "ariel": ["אריאל"],
+    "lod": ["לוד"],
+    "ramla": ["ramle", "רמלה"],
+    "yavne": ["yavneh", "יבנה"],
+    "shoam": ["shoham", "שוהם"],
+    "airport city": ["איירפורט סיטי"],
+    "remote": ["work from home", "wfh", "hybrid remote", "מרחוק", "עבודה מהבית"],
+    "israel": ["ישראל"],
+}
+
+# Short aliases that collide with other places ("Chicago, IL") or words; they only
+# count when they are the whole location string
+EXACT_ALIASES = {
+    "tel aviv": ["תא"],
+    "petah tikva": ["פת"],
+    "beer sheva": ["בש"],
+    "israel": ["il", "isr"],
+}
+
+# Matches on these only count when no concrete city is found
+GENERIC_PLACES = {"remote", "israel"}
+
+# Hebrew single-letter prefixes ("in", "and", "from", "to", "the") glued to a place name
+HEBREW_PREFIXES = "בוהמל"
+
 REGION_DEFAULT = "אחר"
 
+_QUOTES = re.compile(r"['\"`\u05f3\u05f4\u2019]")
+_SEPARATORS = re.compile(r"[^\w]+")
+
 
 def normalize_location(raw: str | None) -> str:
+    """Lowercase, drop quotes/geresh and collapse punctuation to single spaces."""
     if not raw:
         return ""
-    return raw.strip().lower()
+    return " ".join(_SEPARATORS.sub(" ", _QUOTES.sub("", raw.lower())).split())
+
+
+def _build_index() -> Tuple[Dict[str, Tuple[str, str]], int]:
+    index: Dict[str, Tuple[str, str]] = {}
+    for city, region in CITY_TO_REGION.items():
+        index.setdefault(normalize_location(city), (city, region))
+    for city, aliases in CITY_ALIASES.items():
+        region = CITY_TO_REGION[city]
+        for alias in aliases:
+            index.setdefault(normalize_location(alias), (city, region))
+    return index, max(len(key.split()) for key in index)
+
+
+# phrase -> (canonical city, region); phrases are normalized and up to _MAX_NGRAM tokens long
+_INDEX, _MAX_NGRAM = _build_index()
+_EXACT = {
+    normalize_location(alias): (city, CITY_TO_REGION[city])
+    for city, aliases in EXACT_ALIASES.items()
+    for alias in aliases
+}
+
+
+def _lookup(phrase: str) -> Optional[Tuple[str, str]]:
+    hit = _INDEX.get(phrase)
+    if hit is None and len(phrase) > 2 and phrase[0] in HEBREW_PREFIXES:
+        hit = _INDEX.get(phrase[1:])
+    return hit
+
+
+def match_location(loc: str) -> Optional[Tuple[str, str]]:
+    """Find (city, region) in a normalized location via longest n-gram lookups.
+
+    Each token position is probed with at most _MAX_NGRAM phrases, so cost is
+    linear in the number of tokens. Concrete cities win over generic places.
+    """
+    tokens = loc.split()
+    generic = None
+    i = 0
+    while i < len(tokens):
+        for n in range(min(_MAX_NGRAM, len(tokens) - i), 0, -1):
+            hit = _lookup(" ".join(tokens[i : i + n]))
+            if hit is None:
+                continue
+            if hit[0] not in GENERIC_PLACES:
+                return hit
+            generic = generic or hit
+            i += n - 1
+            break
+        i += 1
+    return generic
+
+
+@lru_cache(maxsize=4096)
+def _resolve_normalized(loc: str) -> Tuple[bool, str, Optional[str]]:
+    hit = _EXACT.get(loc) or match_location(loc)
+    if hit is None:
+        # no match -> treat as not-Israel (strict)
+        return False, REGION_DEFAULT, loc
+    city, region = hit
+    return True, region, city
 
 
 def resolve_region(raw_location: str | None) -> Tuple[bool, str, Optional[str]]:
     """
     Resolve a raw location string to (is_in_israel, region, normalized_city).
 
-    - Accepts English city names; Hebrew could be added later by extending CITY_TO_REGION
-      or pre-processing with transliteration.
+    - Accepts English and Hebrew city names, common transliterations and
+      free-form strings such as "Tel Aviv, Israel" or "Herzliya Pituach".
     - If the location is empty, returns (False, REGION_DEFAULT, None).
-    - Remote roles default to region CENTER unless indicated otherwise.
+    - Remote roles default to region CENTER unless a city is given.
     """
     loc = normalize_location(raw_location)
     if not loc:
         return False, REGION_DEFAULT, None
-
-    if "remote" in loc:
-        return True, CITY_TO_REGION.get("remote", REGION_DEFAULT), "remote"
-
-    # direct mapping
-    if loc in CITY_TO_REGION:
-        return True, CITY_TO_REGION[loc], loc
-
-    # heuristic: remove punctuation
-    loc_simple = loc.replace(",", " ").replace("-", " ").strip()
-    if loc_simple in CITY_TO_REGION:
-        return True, CITY_TO_REGION[loc_simple], loc_simple
-
-    # no match -> treat as not-Israel (strict)
-    return False, REGION_DEFAULT, loc
+    return _resolve_normalized(loc)
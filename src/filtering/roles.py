@@ -1,7 +1,11 @@
 """Role filtering heuristics for Development/R&D positions."""
 from __future__ import annotations
 
-from typing import Tuple
+import re
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple
+
+from src.app.config import get_settings
 
 DEV_KEYWORDS = {
     "developer",
@@ -43,21 +47,75 @@ NON_DEV_EXCLUDE = {
 }
 
 
-def is_dev_role(title: str | None, description: str | None = None, summary: str | None = None) -> Tuple[bool, str]:
-    """Return (is_dev, reason). Applies permissive include + strict exclude."""
+class KeywordMatcher:
+    """All keywords compiled into one case-insensitive alternation.
+
+    Keywords must start at a word boundary, so "ui" does not fire inside "guide"
+    and "hr" not inside "three". With ``prefix`` a keyword may begin a longer word
+    ("software engineer" in "Software Engineering Manager"); without it the keyword
+    must end the word too, apart from a plural "s". Longer keywords are tried
+    first at each position.
+    """
+
+    def __init__(self, keywords: Iterable[str], prefix: bool = False):
+        self.keywords = sorted({k.strip().lower() for k in keywords if k and k.strip()}, key=len, reverse=True)
+        alternation = "|".join(re.escape(k) for k in self.keywords)
+        ending = "" if prefix else r"s?(?!\w)"
+        self._pattern = re.compile(rf"(?<!\w)({alternation}){ending}", re.IGNORECASE) if self.keywords else None
+
+    def find(self, *texts: str | None) -> Optional[str]:
+        """Return the first keyword found in any of the texts, in a single scan of each."""
+        if self._pattern is None:
+            return None
+        for text in texts:
+            if text:
+                match = self._pattern.search(text)
+                if match:
+                    return match.group(1).lower()
+        return None
+
+
+def _split(raw: str) -> list[str]:
+    return [part for part in (raw or "").split(",") if part.strip()]
+
+
+@lru_cache(maxsize=8)
+def _matchers(include: str, exclude: str) -> Tuple[KeywordMatcher, KeywordMatcher]:
+    # Include keywords match word prefixes like the old substring check did; excludes stay
+    # strict so short ones ("hr", "ui") cannot reject unrelated titles
+    return (
+        KeywordMatcher([*DEV_KEYWORDS, *_split(include)], prefix=True),
+        KeywordMatcher([*NON_DEV_EXCLUDE, *_split(exclude)]),
+    )
+
+
+def get_matchers() -> Tuple[KeywordMatcher, KeywordMatcher]:
+    """(include, exclude) matchers: the built-in sets plus FILTER_INCLUDE/EXCLUDE_KEYWORDS."""
+    settings = get_settings()
+    return _matchers(settings.filter_include_keywords, settings.filter_exclude_keywords)
+
+
+def excluded_title_keyword(title: str | None) -> Optional[str]:
+    """Return the non-dev keyword found in the title, if any."""
     # Only check exclusions in the title to avoid rejecting "Dev working with Marketing"
-    title_lower = (title or "").lower()
-    
-    for bad in NON_DEV_EXCLUDE:
-        if bad in title_lower:
-            return False, f"לא פיתוח ({bad})"
+    return get_matchers()[1].find(title)
+
 
-    # Check keywords in the full blob
-    text_parts = [part.lower() for part in [title or "", summary or "", description or ""] if part]
-    blob = "\n".join(text_parts)
+def dev_keyword(title: str | None, description: str | None = None, summary: str | None = None) -> Optional[str]:
+    """Return the dev keyword found in the title, summary or description, if any."""
+    return get_matchers()[0].find(title, summary, description)
 
-    for good in DEV_KEYWORDS:
-        if good in blob:
-            return True, "תפקיד פיתוח"
 
+def has_dev_keyword(title: str | None, description: str | None = None, summary: str | None = None) -> bool:
+    return dev_keyword(title, description, summary) is not None
+
+
+def is_dev_role(title: str | None, description: str | None = None, summary: str | None = None) -> Tuple[bool, str]:
+    """Return (is_dev, reason). Applies permissive include + strict exclude."""
+    bad = excluded_title_keyword(title)
+    if bad:
+        return False, f"לא פיתוח ({bad})"
+    good = dev_keyword(title, description, summary)
+    if good:
+        return True, f"תפקיד פיתוח ({good})"
     return False, "לא זוהה כתבפקיד פיתוח"
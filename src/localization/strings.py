@@ -50,3 +50,7 @@ def pipeline_stopped() -> str:
 
 def pipeline_start_run_id(run_id: str) -> str:
     return f"התחלת ריצה {run_id}"
+
+
+def run_queue_progress(done: int, total: int) -> str:
+    return f"הושלמו {done} מתוך {total} משימות"
@@ -0,0 +1,64 @@
+"""Inference backends for ``Classifier``; all return an HF-style text-classification pipeline.
+
+- ``torch``: full-precision transformers pipeline (default).
+- ``torch-int8``: the same model with dynamic int8 quantization of its Linear layers.
+- ``onnx``: ONNX Runtime via ``optimum`` (optional dependency); the export is cached
+  under ``NLP_ONNX_DIR`` so only the first start pays for it.
+
+The quantized backends are CPU-only.
+"""
+from pathlib import Path
+
+from src.app.config import Settings
+
+BACKENDS = ("torch", "torch-int8", "onnx")
+
+
+def _pipeline_kwargs(settings: Settings) -> dict:
+    return {"task": settings.nlp_task, "truncation": True, "max_length": settings.nlp_max_length}
+
+
+def _torch(settings: Settings):
+    from transformers import pipeline
+
+    return pipeline(model=settings.nlp_model, device=settings.nlp_device, **_pipeline_kwargs(settings))
+
+
+def _torch_int8(settings: Settings):
+    import torch
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
+
+    model = AutoModelForSequenceClassification.from_pretrained(settings.nlp_model)
+    model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    tokenizer = AutoTokenizer.from_pretrained(settings.nlp_model)
+    return pipeline(model=model, tokenizer=tokenizer, device="cpu", **_pipeline_kwargs(settings))
+
+
+def _onnx(settings: Settings):
+    try:
+        from optimum.onnxruntime import ORTModelForSequenceClassification
+        from optimum.pipelines import pipeline
+    except ImportError as exc:
+        raise RuntimeError("NLP_BACKEND=onnx requires `pip install optimum[onnxruntime]`") from exc
+    from transformers import AutoTokenizer
+
+    export_dir = Path(settings.nlp_onnx_dir) / settings.nlp_model.replace("/", "__")
+    if (export_dir / "model.onnx").exists():
+        model = ORTModelForSequenceClassification.from_pretrained(export_dir)
+        tokenizer = AutoTokenizer.from_pretrained(export_dir)
+    else:
+        model = ORTModelForSequenceClassification.from_pretrained(settings.nlp_model, export=True)
+        tokenizer = AutoTokenizer.from_pretrained(settings.nlp_model)
+        model.save_pretrained(export_dir)
+        tokenizer.save_pretrained(export_dir)
+    return pipeline(model=model, tokenizer=tokenizer, accelerator="ort", **_pipeline_kwargs(settings))
+
+
+_BUILDERS = {"torch": _torch, "torch-int8": _torch_int8, "onnx": _onnx}
+
+
+def build_pipeline(settings: Settings):
+    backend = settings.nlp_backend.lower()
+    if backend not in _BUILDERS:
+        raise ValueError(f"unknown NLP_BACKEND {settings.nlp_backend!r}; expected one of {', '.join(BACKENDS)}")
+    return _BUILDERS[backend](settings)
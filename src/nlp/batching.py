@@ -0,0 +1,108 @@
+"""Async micro-batching in front of ``Classifier.classify_batch``."""
+import asyncio
+import logging
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from src.app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+BatchRunner = Callable[[List[str]], Awaitable[List[Dict[str, float | str]]]]
+
+
+async def _default_runner(texts: List[str]) -> List[Dict[str, float | str]]:
+    from src.nlp.executor import classify_async
+
+    return await classify_async(texts)
+
+
+class MicroBatcher:
+    """Collects texts from concurrent callers and classifies them together.
+
+    A batch is flushed as soon as ``max_batch`` texts are queued, or ``max_wait_ms``
+    after the first text of a batch arrived, whichever comes first. Up to
+    ``max_in_flight`` batches run at once; beyond that the queue fills and
+    ``submit`` blocks, so producers slow down to the model's pace.
+    """
+
+    def __init__(
+        self,
+        runner: Optional[BatchRunner] = None,
+        max_batch: Optional[int] = None,
+        max_wait_ms: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self.runner = runner or _default_runner
+        self.max_batch = max(1, max_batch or settings.nlp_batch_size)
+        self.max_wait = (max_wait_ms if max_wait_ms is not None else settings.nlp_max_batch_wait_ms) / 1000
+        self.max_in_flight = max(1, max_in_flight or settings.nlp_inference_workers)
+        self._queue: Optional[asyncio.Queue[Tuple[str, asyncio.Future]]] = None
+        self._in_flight: Optional[asyncio.Semaphore] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._dispatches: Set[asyncio.Task] = set()
+        self.batches = 0
+        self.items = 0
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue(maxsize=self.max_batch * (self.max_in_flight + 1))
+            self._in_flight = asyncio.Semaphore(self.max_in_flight)
+            self._worker = asyncio.create_task(self._run())
+
+    async def submit(self, text: str) -> Dict[str, float | str]:
+        self._ensure_worker()
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[str, asyncio.Future]]:
+        batch = [await self._queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.max_wait
+        while len(batch) < self.max_batch:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            live = [(text, future) for text, future in batch if not future.cancelled()]
+            if not live:
+                continue
+            await self._in_flight.acquire()
+            task = asyncio.create_task(self._dispatch(live))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, live: List[Tuple[str, asyncio.Future]]) -> None:
+        try:
+            results = await self.runner([text for text, _ in live])
+        except Exception as exc:  # noqa: BLE001
+            logger.error(f"❌ Classification batch of {len(live)} failed: {exc}")
+            for _, future in live:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        finally:
+            self._in_flight.release()
+        self.batches += 1
+        self.items += len(live)
+        for (_, future), result in zip(live, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def close(self) -> None:
+        if self._worker and not self._worker.done():
+            self._worker.cancel()
+
+
+@lru_cache(maxsize=1)
+def get_micro_batcher() -> MicroBatcher:
+    return MicroBatcher()
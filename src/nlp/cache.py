@@ -0,0 +1,125 @@
+"""Classification result cache: in-memory LRU in front of a SQLite table.
+
+Keys are sha256(model id, max_length, whitespace-normalized text), so a hit skips
+tokenization and inference entirely. Entries written by any other model id are
+purged the first time the cache is used, which invalidates everything on an
+``NLP_MODEL`` or ``NLP_BACKEND`` change.
+"""
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from src.app.config import get_settings
+from src.db.repository import ClassificationCacheRepository
+from src.db.session import run_db
+
+logger = logging.getLogger(__name__)
+
+Result = Dict[str, float | str]
+
+
+def model_id() -> str:
+    """Model name plus backend, since quantized backends score slightly differently."""
+    settings = get_settings()
+    backend = settings.nlp_backend.lower()
+    return settings.nlp_model if backend == "torch" else f"{settings.nlp_model}@{backend}"
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+def cache_key(model: str, max_length: int, text: str) -> str:
+    payload = f"{model}\x1f{max_length}\x1f{normalize_text(text)}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ClassificationCache:
+    def __init__(self, model: str, max_length: int, memory_entries: int, max_entries: int):
+        self.model = model
+        self.max_length = max_length
+        self.memory_entries = max(0, memory_entries)
+        self.max_entries = max(1, max_entries)
+        self._memory: "OrderedDict[str, Result]" = OrderedDict()
+        self._ready = False
+        self._lock = asyncio.Lock()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_settings(cls) -> "ClassificationCache":
+        settings = get_settings()
+        return cls(model_id(), settings.nlp_max_length, settings.nlp_cache_memory_entries, settings.nlp_cache_max_entries)
+
+    def key(self, text: str) -> str:
+        return cache_key(self.model, self.max_length, text)
+
+    def _remember(self, key: str, result: Result) -> None:
+        if not self.memory_entries:
+            return
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    async def _ensure_ready(self) -> None:
+        async with self._lock:
+            if self._ready:
+                return
+            purged = await run_db(lambda s: ClassificationCacheRepository(s).purge_other_models(self.model))
+            if purged:
+                logger.info(f"Classification cache: dropped {purged} entries from other models")
+            self._ready = True
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Result]:
+        await self._ensure_ready()
+        found: Dict[str, Result] = {}
+        missing: List[str] = []
+        for key in dict.fromkeys(keys):
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                found[key] = self._memory[key]
+                self.memory_hits += 1
+            else:
+                missing.append(key)
+        if missing:
+            rows = await run_db(lambda s: ClassificationCacheRepository(s).lookup(missing))
+            for key, row in rows.items():
+                result = {"label": row.label, "score": row.score}
+                found[key] = result
+                self._remember(key, result)
+            self.db_hits += len(rows)
+            self.misses += len(missing) - len(rows)
+        return found
+
+    async def put_many(self, results: Dict[str, Result]) -> None:
+        if not results:
+            return
+        for key, result in results.items():
+            self._remember(key, result)
+        await run_db(lambda s: ClassificationCacheRepository(s).store(self.model, results))
+        await run_db(lambda s: ClassificationCacheRepository(s).evict(self.max_entries))
+
+    def stats(self) -> dict:
+        hits = self.memory_hits + self.db_hits
+        lookups = hits + self.misses
+        return {
+            "model": self.model,
+            "max_length": self.max_length,
+            "memory_entries": len(self._memory),
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_classification_cache() -> Optional[ClassificationCache]:
+    if not get_settings().nlp_cache_enabled:
+        return None
+    return ClassificationCache.from_settings()
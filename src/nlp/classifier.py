@@ -1,9 +1,12 @@
-from functools import lru_cache
-from typing import Dict
-
-from transformers import pipeline
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
 
 from src.app.config import get_settings
+from src.nlp.backends import build_pipeline
+
+logger = logging.getLogger(__name__)
 
 
 class Classifier:
@@ -13,16 +16,11 @@ class Classifier:
         self.model = settings.nlp_model
         self.max_length = settings.nlp_max_length
         self.batch_size = settings.nlp_batch_size
-        self.pipe = pipeline(
-            task=self.task,
-            model=self.model,
-            device=settings.nlp_device,
-            truncation=True,
-            max_length=self.max_length,
-        )
+        self.backend = settings.nlp_backend
+        self.pipe = build_pipeline(settings)
 
-    def classify(self, text: str) -> Dict[str, float | str]:
-        result = self.pipe(text, batch_size=self.batch_size, truncation=True, max_length=self.max_length)
+    @staticmethod
+    def _to_result(result) -> Dict[str, float | str]:
         # pipeline can return list or dict
         if isinstance(result, list):
             result = result[0]
@@ -30,7 +28,60 @@ class Classifier:
         score = float(result.get("score")) if result.get("score") is not None else 0.0
         return {"label": label, "score": score}
 
+    def classify(self, text: str) -> Dict[str, float | str]:
+        result = self.pipe(text, batch_size=self.batch_size, truncation=True, max_length=self.max_length)
+        return self._to_result(result)
+
+    def classify_batch(self, texts: List[str]) -> List[Dict[str, float | str]]:
+        """Classify many texts in real model batches; results keep input order.
+
+        Texts are sorted by length first so each batch pads to similar lengths.
+        """
+        if not texts:
+            return []
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        outputs = self.pipe(
+            [texts[i] for i in order], batch_size=self.batch_size, truncation=True, max_length=self.max_length
+        )
+        results: List[Dict[str, float | str]] = [{}] * len(texts)
+        for position, output in zip(order, outputs):
+            results[position] = self._to_result(output)
+        return results
+
+
+class ModelStatus:
+    """Load state of the shared classifier, reported by the readiness endpoint."""
+
+    def __init__(self):
+        self.state = "cold"  # cold|loading|ready|failed
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        return {"state": self.state, "error": self.error, "load_seconds": self.load_seconds}
+
+
+model_status = ModelStatus()
+_classifier: Optional[Classifier] = None
+_load_lock = threading.Lock()
+
 
-@lru_cache(maxsize=1)
 def get_classifier() -> Classifier:
-    return Classifier()
+    """Load the model once per process; concurrent first callers wait for the same load."""
+    global _classifier
+    if _classifier is None:
+        with _load_lock:
+            if _classifier is None:
+                model_status.state = "loading"
+                started = time.perf_counter()
+                try:
+                    _classifier = Classifier()
+                except Exception as exc:
+                    model_status.state = "failed"
+                    model_status.error = str(exc)
+                    raise
+                model_status.load_seconds = round(time.perf_counter() - started, 2)
+                model_status.state = "ready"
+                model_status.error = None
+                logger.info(f"NLP model {_classifier.model} ({_classifier.backend}) loaded in {model_status.load_seconds}s")
+    return _classifier
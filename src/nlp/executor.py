@@ -0,0 +1,89 @@
+"""Dedicated inference threads so torch never runs on the event loop."""
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List
+
+from src.app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def _init_inference_thread(torch_threads: int) -> None:
+    if torch_threads <= 0:
+        return
+    try:
+        import torch
+
+        torch.set_num_threads(torch_threads)
+    except ImportError:
+        pass
+
+
+def _classify_batch(texts: List[str]) -> List[Dict[str, float | str]]:
+    # Imported here so model loading also happens on the inference thread
+    from src.nlp.classifier import get_classifier
+
+    return get_classifier().classify_batch(texts)
+
+
+def _warm_up() -> None:
+    # One tiny batch also initializes the tokenizer and backend kernels
+    _classify_batch(["software engineer"])
+
+
+class InferenceExecutor:
+    """Thread pool for classifier batches with a bounded backlog.
+
+    torch releases the GIL inside its kernels, so a thread pool keeps the web server
+    responsive while inference uses ``NLP_TORCH_THREADS`` intra-op threads. At most
+    ``max_backlog`` batches may be queued or running; further callers wait, which
+    pushes back on whoever produces the texts.
+    """
+
+    def __init__(self, workers: int, torch_threads: int, max_backlog: int):
+        self.workers = max(1, workers)
+        self.max_backlog = max(self.workers, max_backlog)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.workers,
+            thread_name_prefix="inference",
+            initializer=_init_inference_thread,
+            initargs=(torch_threads,),
+        )
+        self._backlog = asyncio.Semaphore(self.max_backlog)
+        self.pending = 0
+
+    @classmethod
+    def from_settings(cls) -> "InferenceExecutor":
+        settings = get_settings()
+        return cls(settings.nlp_inference_workers, settings.nlp_torch_threads, settings.nlp_max_backlog)
+
+    async def classify_async(self, texts: List[str]) -> List[Dict[str, float | str]]:
+        async with self._backlog:
+            self.pending += 1
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._pool, _classify_batch, texts)
+            finally:
+                self.pending -= 1
+
+    async def warm_up(self) -> None:
+        """Load the model on an inference thread; failures are logged, not raised."""
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._pool, _warm_up)
+        except Exception as exc:  # noqa: BLE001
+            logger.error(f"❌ NLP warm-up failed: {exc}")
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+@lru_cache(maxsize=1)
+def get_inference_executor() -> InferenceExecutor:
+    return InferenceExecutor.from_settings()
+
+
+async def classify_async(texts: List[str]) -> List[Dict[str, float | str]]:
+    return await get_inference_executor().classify_async(texts)
@@ -0,0 +1,25 @@
+"""Async classification entry point: cache lookup, then micro-batched inference for misses."""
+import asyncio
+from typing import Dict, List
+
+from src.nlp.batching import get_micro_batcher
+from src.nlp.cache import get_classification_cache
+
+Result = Dict[str, float | str]
+
+
+async def classify_texts(texts: List[str]) -> List[Result]:
+    cache = get_classification_cache()
+    batcher = get_micro_batcher()
+    if cache is None:
+        return list(await asyncio.gather(*(batcher.submit(text) for text in texts)))
+
+    keys = [cache.key(text) for text in texts]
+    found = await cache.get_many(keys)
+    pending = {key: text for key, text in zip(keys, texts) if key not in found}
+    if pending:
+        fresh = await asyncio.gather(*(batcher.submit(text) for text in pending.values()))
+        computed = dict(zip(pending.keys(), fresh))
+        await cache.put_many(computed)
+        found.update(computed)
+    return [found[key] for key in keys]
@@ -1,8 +1,28 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+SENT = "sent"
+FAILED = "failed"
+
+
+@dataclass
+class SendResult:
+    """Outcome of delivering one job, as recorded on its OutboundAttempt."""
+
+    status: str  # sent|failed
+    response_status: Optional[int] = None
+    response_body: Optional[str] = None
 
 
 class Base44Client(ABC):
     @abstractmethod
-    async def send_job(self, payload: Dict[str, Any]) -> None:
+    async def send_job(self, payload: Dict[str, Any], idempotency_key: Optional[str] = None) -> SendResult:
         ...
+
+    async def send_batch(self, payloads: List[Dict[str, Any]], idempotency_keys: List[str]) -> List[SendResult]:
+        """Results in input order; clients without a batch endpoint send one by one."""
+        return [await self.send_job(payload, key) for payload, key in zip(payloads, idempotency_keys)]
+
+    async def close(self) -> None:
+        pass
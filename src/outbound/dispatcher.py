@@ -0,0 +1,82 @@
+"""Outbound dispatcher: delivers a run's passed jobs to Base44 concurrently.
+
+One dispatcher (and so one pooled HTTP client) is shared by every run in the
+process. Jobs go out one request each, BASE44_CONCURRENCY at a time, or in
+batches of BASE44_BATCH_SIZE when BASE44_BATCH_ENDPOINT is set.
+"""
+import asyncio
+import hashlib
+from typing import Any, Dict, List, Optional
+
+from src.app.config import get_settings
+from src.outbound.base import Base44Client, SendResult
+from src.outbound.http_client import HttpBase44Client
+from src.outbound.mock_client import MockBase44Client
+
+_dispatchers: Dict[bool, "OutboundDispatcher"] = {}
+
+
+def idempotency_key(run_id: str, job_url: str) -> str:
+    """Same key for every send of a job within a run, so the receiver can drop repeats."""
+    return hashlib.sha256(f"{run_id}\x1f{job_url}".encode("utf-8")).hexdigest()
+
+
+def job_payload(run_id: str, record: dict) -> Dict[str, Any]:
+    return {
+        "run_id": run_id,
+        "url": record.get("url"),
+        "title": record.get("title"),
+        "company": record.get("company"),
+        "location": record.get("location"),
+        "region": record.get("region"),
+        "summary": record.get("summary"),
+        "description": record.get("description"),
+        "label": record.get("classification", {}).get("label"),
+        "score": record.get("filter", {}).get("score"),
+    }
+
+
+class OutboundDispatcher:
+    def __init__(self, client: Base44Client, concurrency: int = 8, batch_size: Optional[int] = None):
+        self.client = client
+        self.batch_size = batch_size
+        self._slots = asyncio.Semaphore(max(1, concurrency))
+
+    async def _send_one(self, payload: Dict[str, Any], key: str) -> SendResult:
+        async with self._slots:
+            return await self.client.send_job(payload, key)
+
+    async def _send_batch(self, payloads: List[Dict[str, Any]], keys: List[str]) -> List[SendResult]:
+        async with self._slots:
+            return await self.client.send_batch(payloads, keys)
+
+    async def send(self, run_id: str, jobs: List[dict]) -> List[SendResult]:
+        """Deliver ``jobs`` (each with a ``url``); one result per job, in order."""
+        payloads = [job_payload(run_id, record) for record in jobs]
+        keys = [idempotency_key(run_id, record["url"]) for record in jobs]
+        if not self.batch_size:
+            return list(await asyncio.gather(*(self._send_one(p, k) for p, k in zip(payloads, keys))))
+        size = self.batch_size
+        batches = await asyncio.gather(
+            *(self._send_batch(payloads[i:i + size], keys[i:i + size]) for i in range(0, len(payloads), size))
+        )
+        return [result for batch in batches for result in batch]
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+def get_dispatcher(mock: bool = False) -> OutboundDispatcher:
+    """The process-wide dispatcher for real (or mock) delivery."""
+    if mock not in _dispatchers:
+        settings = get_settings()
+        client = MockBase44Client() if mock else HttpBase44Client(settings)
+        batch_size = settings.base44_batch_size if settings.base44_batch_endpoint and not mock else None
+        _dispatchers[mock] = OutboundDispatcher(client, settings.base44_concurrency, batch_size)
+    return _dispatchers[mock]
+
+
+async def close_dispatchers() -> None:
+    while _dispatchers:
+        _, dispatcher = _dispatchers.popitem()
+        await dispatcher.close()
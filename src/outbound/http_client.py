@@ -1,25 +1,129 @@
 import asyncio
-from typing import Any, Dict
+import email.utils
+import hashlib
+import importlib.util
+import json
+import logging
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
-from src.app.config import get_settings
-from src.outbound.base import Base44Client
+from src.app.config import Settings, get_settings
+from src.outbound.base import FAILED, SENT, Base44Client, SendResult
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+# Throttling and transient server errors; anything else is final
+RETRY_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+# Response bodies are kept on the attempt row for debugging, not in full
+MAX_BODY_CHARS = 2000
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Retry-After as delay-seconds or an HTTP date; ``None`` when absent or unreadable."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def _body(resp: httpx.Response) -> str:
+    return resp.text[:MAX_BODY_CHARS]
 
 
 class HttpBase44Client(Base44Client):
-    def __init__(self):
-        self.settings = get_settings()
-        self.client = httpx.AsyncClient(timeout=self.settings.base44_timeout_seconds)
+    """Base44 over one shared keep-alive client (HTTP/2 when ``h2`` is installed).
+
+    Every request carries an ``Idempotency-Key`` so retries, and re-sends after a
+    resumed run, are safe. Throttled/transient failures back off with full jitter,
+    or for as long as the server's ``Retry-After`` asks (capped at
+    BASE44_BACKOFF_MAX_SECONDS).
+    """
 
-    async def send_job(self, payload: Dict[str, Any]) -> None:
-        retries = self.settings.base44_retries
+    def __init__(self, settings: Optional[Settings] = None):
+        self.settings = settings or get_settings()
+        http2 = self.settings.base44_http2 and importlib.util.find_spec("h2") is not None
+        if self.settings.base44_http2 and not http2:
+            logger.warning("BASE44_HTTP2 needs `pip install httpx[http2]`; using HTTP/1.1 keep-alive")
+        limit = max(1, self.settings.base44_concurrency)
+        headers = {"Authorization": f"Bearer {self.settings.base44_api_key}"} if self.settings.base44_api_key else {}
+        self.client = httpx.AsyncClient(
+            http2=http2,
+            timeout=self.settings.base44_timeout_seconds,
+            limits=httpx.Limits(max_connections=limit, max_keepalive_connections=limit),
+            headers=headers,
+        )
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> float:
+        cap = self.settings.base44_backoff_max_seconds
+        if retry_after is not None:
+            return min(retry_after, cap)
+        return random.uniform(0, min(cap, self.settings.base44_backoff_base_seconds * 2 ** attempt))
+
+    async def _post(
+        self, url: Optional[str], body: Any, idempotency_key: Optional[str]
+    ) -> Tuple[SendResult, Optional[httpx.Response]]:
+        """POST with retries; the result and the last response (``None`` if none arrived)."""
+        if not url:
+            return SendResult(FAILED, response_body="BASE44_ENDPOINT is not set"), None
+        headers = {IDEMPOTENCY_HEADER: idempotency_key} if idempotency_key else {}
+        retries = max(1, self.settings.base44_retries)
+        resp = None
         for attempt in range(retries):
+            retry_after = None
             try:
-                resp = await self.client.post(str(self.settings.base44_endpoint), json=payload)
-                resp.raise_for_status()
-                return
-            except Exception:
-                if attempt == retries - 1:
-                    raise
-                await asyncio.sleep(2 ** attempt)
+                resp = await self.client.post(url, json=body, headers=headers)
+            except httpx.TransportError as exc:
+                resp = None
+                result = SendResult(FAILED, response_body=f"{type(exc).__name__}: {exc}"[:MAX_BODY_CHARS])
+            else:
+                result = SendResult(SENT if resp.is_success else FAILED, resp.status_code, _body(resp))
+                if resp.is_success or resp.status_code not in RETRY_STATUSES:
+                    return result, resp
+                retry_after = retry_after_seconds(resp.headers.get("Retry-After"))
+            if attempt < retries - 1:
+                await asyncio.sleep(self._backoff(attempt, retry_after))
+        return result, resp
+
+    async def send_job(self, payload: Dict[str, Any], idempotency_key: Optional[str] = None) -> SendResult:
+        endpoint = self.settings.base44_endpoint
+        result, _ = await self._post(str(endpoint) if endpoint else None, payload, idempotency_key)
+        return result
+
+    async def send_batch(self, payloads: List[Dict[str, Any]], idempotency_keys: List[str]) -> List[SendResult]:
+        """POST ``{"jobs": [...]}`` to BASE44_BATCH_ENDPOINT, or fall back to one request per job.
+
+        A response ``{"results": [{"status": <http status>, ...}, ...]}`` with one entry
+        per job gives per-job outcomes; otherwise the batch outcome applies to all.
+        """
+        endpoint = self.settings.base44_batch_endpoint
+        if not endpoint:
+            return await super().send_batch(payloads, idempotency_keys)
+        jobs = [{**payload, "idempotency_key": key} for payload, key in zip(payloads, idempotency_keys)]
+        batch_key = hashlib.sha256("\n".join(idempotency_keys).encode("utf-8")).hexdigest()
+        result, resp = await self._post(str(endpoint), {"jobs": jobs}, batch_key)
+        try:
+            items = resp.json().get("results") if resp is not None else None
+        except (ValueError, AttributeError):
+            items = None
+        if result.status != SENT or not isinstance(items, list) or len(items) != len(jobs):
+            return [result] * len(jobs)
+        results = []
+        for item in items:
+            code = item.get("status") if isinstance(item, dict) else None
+            ok = isinstance(code, int) and 200 <= code < 300
+            body = json.dumps(item)[:MAX_BODY_CHARS]
+            results.append(SendResult(SENT if ok else FAILED, code if isinstance(code, int) else None, body))
+        return results
+
+    async def close(self) -> None:
+        await self.client.aclose()
@@ -1,11 +1,12 @@
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from src.outbound.base import Base44Client
+from src.outbound.base import SENT, Base44Client, SendResult
 
 logger = logging.getLogger(__name__)
 
 
 class MockBase44Client(Base44Client):
-    async def send_job(self, payload: Dict[str, Any]) -> None:
+    async def send_job(self, payload: Dict[str, Any], idempotency_key: Optional[str] = None) -> SendResult:
         logger.info("Mock send to Base44: %s", payload)
+        return SendResult(SENT, response_body="mock")
@@ -0,0 +1,33 @@
+"""Per-ATS page adapters used by ``JobParser``."""
+from src.scraping.adapters.base import Adapter, ParsedJob
+from src.scraping.adapters.comeet import ComeetAdapter
+from src.scraping.adapters.embedded import EmbeddedJsonAdapter
+from src.scraping.adapters.greenhouse import GreenhouseAdapter
+from src.scraping.adapters.jsonld import JsonLdAdapter
+from src.scraping.adapters.lever import LeverAdapter
+from src.scraping.adapters.links import JobLinksAdapter
+from src.scraping.adapters.workday import WorkdayAdapter
+
+# Structured data first (no DOM walk), then hosted ATS layouts, then the link fallback
+DEFAULT_ADAPTERS = [
+    JsonLdAdapter(),
+    EmbeddedJsonAdapter(),
+    ComeetAdapter(),
+    GreenhouseAdapter(),
+    LeverAdapter(),
+    WorkdayAdapter(),
+    JobLinksAdapter(),
+]
+
+__all__ = [
+    "Adapter",
+    "ParsedJob",
+    "ComeetAdapter",
+    "EmbeddedJsonAdapter",
+    "GreenhouseAdapter",
+    "JsonLdAdapter",
+    "LeverAdapter",
+    "JobLinksAdapter",
+    "WorkdayAdapter",
+    "DEFAULT_ADAPTERS",
+]
@@ -0,0 +1,95 @@
+"""Shared types and helpers for ATS page adapters."""
+from dataclasses import asdict, dataclass
+from typing import List, Optional
+from urllib.parse import urljoin, urlparse
+
+from src.extraction.document import Document, clean_text, html_text, summarize  # noqa: F401
+from src.scraping.discovery import job_key_url
+
+
+@dataclass
+class ParsedJob:
+    url: Optional[str]
+    title: str
+    company: Optional[str] = None
+    location: Optional[str] = None
+    description: Optional[str] = None
+    summary: Optional[str] = None
+    source: Optional[str] = None  # adapter that produced the job
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class Adapter:
+    """Turns one already fetched page into jobs.
+
+    ``detect`` must be cheap (URL host/path, a marker in the parsed tree); ``parse``
+    runs only when it returned True.
+    """
+
+    name = "base"
+    hosts: tuple = ()
+    # True when jobs come from embedded data rather than the DOM
+    structured = False
+
+    def host_matches(self, url: str) -> bool:
+        host = urlparse(url).netloc.lower()
+        return any(host == h or host.endswith("." + h) for h in self.hosts)
+
+    def detect(self, url: str, doc: Document) -> bool:
+        return self.host_matches(url)
+
+    def parse(self, url: str, doc: Document) -> List[ParsedJob]:
+        raise NotImplementedError
+
+
+def text(el) -> str:
+    return clean_text(" ".join(el.itertext())) if el is not None else ""
+
+
+def first(*candidates):
+    """First element of the first non-empty result list.
+
+    Avoids ``a or b`` on lxml elements, whose truthiness is their child count.
+    """
+    for elements in candidates:
+        if elements:
+            return elements[0]
+    return None
+
+
+def absolute(base: str, href: Optional[str]) -> Optional[str]:
+    return urljoin(base, href) if href else None
+
+
+def structured_job(page_url: str, job: dict, source: str) -> ParsedJob:
+    """ParsedJob from a structured-data dict; one without a URL gets ``<page>#job=<id or title>``.
+
+    Keeps postings that share the page URL apart through dedupe and the (run_id, url) key.
+    """
+    key = job.pop("key", None) or " ".join(p for p in (job["title"], job.get("location")) if p)
+    job["url"] = absolute(page_url, job.get("url")) or job_key_url(page_url, key)
+    return ParsedJob(**job, source=source)
+
+
+def has_class(name: str) -> str:
+    """XPath predicate matching one whitespace-separated class token."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def path_company(url: str) -> Optional[str]:
+    """First path segment, which is the company slug on hosted ATS boards."""
+    segment = urlparse(url).path.strip("/").split("/")[0]
+    return segment.replace("-", " ").title() if segment else None
+
+
+def dedupe(jobs: List[ParsedJob]) -> List[ParsedJob]:
+    seen = set()
+    unique = []
+    for job in jobs:
+        key = job.url or job.title
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(job)
+    return unique
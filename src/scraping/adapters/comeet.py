@@ -0,0 +1,69 @@
+"""Comeet careers pages, which embed their positions as JavaScript data."""
+import json
+import re
+from typing import Any, List, Optional
+
+from src.extraction.document import Document, clean_text
+from src.scraping.adapters.base import Adapter, ParsedJob, dedupe, html_text, summarize
+from src.scraping.discovery import job_key_url
+
+_ASSIGNMENT = r"\b{name}\s*=\s*"
+
+
+def js_value(doc: Document, name: str) -> Optional[Any]:
+    """Decode the JSON literal assigned to ``name`` in an inline script."""
+    pattern = re.compile(_ASSIGNMENT.format(name=re.escape(name)))
+    decoder = json.JSONDecoder(strict=False)
+    for script in doc.scripts:
+        match = pattern.search(script["text"] or "")
+        if match:
+            try:
+                return decoder.raw_decode(script["text"], match.end())[0]
+            except ValueError:
+                continue
+    return None
+
+
+def _location(position: dict) -> Optional[str]:
+    location = position.get("location") or {}
+    if isinstance(location, str):
+        return location
+    parts = [location.get("city"), location.get("country")]
+    return location.get("name") or ", ".join(p for p in parts if p) or None
+
+
+class ComeetAdapter(Adapter):
+    name = "comeet"
+    structured = True
+    hosts = ("comeet.com", "comeet.co")
+
+    def detect(self, url: str, doc: Document) -> bool:
+        return self.host_matches(url) or any("COMPANY_POSITIONS_DATA" in (s["text"] or "") for s in doc.scripts)
+
+    def parse(self, url: str, doc: Document) -> List[ParsedJob]:
+        positions = js_value(doc, "COMPANY_POSITIONS_DATA")
+        if positions is None:
+            single = js_value(doc, "POSITION_DATA")
+            positions = [single] if isinstance(single, dict) else []
+        company_data = js_value(doc, "COMPANY_DATA")
+        company = (company_data or {}).get("name") if isinstance(company_data, dict) else None
+        jobs = []
+        for position in positions:
+            if not isinstance(position, dict) or not position.get("name"):
+                continue
+            details = " ".join(html_text(d.get("value")) for d in position.get("details") or [] if isinstance(d, dict))
+            description = clean_text(details) or None
+            # Positions without a page of their own stay apart by their uid
+            key = position.get("uid") or f"{position['name']} {_location(position) or ''}"
+            jobs.append(
+                ParsedJob(
+                    url=position.get("url_comeet_hosted_page") or position.get("url_active_page") or job_key_url(url, key),
+                    title=clean_text(position["name"]),
+                    company=company or doc.site_name,
+                    location=_location(position),
+                    description=description,
+                    summary=summarize(description),
+                    source=self.name,
+                )
+            )
+        return dedupe(jobs)
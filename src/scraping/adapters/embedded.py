@@ -0,0 +1,20 @@
+"""Jobs in framework hydration state (``__NEXT_DATA__``, ``window.__NUXT__``, …)."""
+from typing import List
+
+from src.extraction.document import Document
+from src.extraction.structured import embedded_jobs, has_hydration
+from src.scraping.adapters.base import Adapter, ParsedJob, dedupe, structured_job
+
+
+class EmbeddedJsonAdapter(Adapter):
+    name = "embedded"
+    structured = True
+
+    def detect(self, url: str, doc: Document) -> bool:
+        return has_hydration(doc)
+
+    def parse(self, url: str, doc: Document) -> List[ParsedJob]:
+        jobs = [structured_job(url, job, self.name) for job in embedded_jobs(doc)]
+        for job in jobs:
+            job.company = job.company or doc.site_name
+        return dedupe(jobs)
@@ -0,0 +1,51 @@
+"""Greenhouse hosted boards (boards.greenhouse.io / job-boards.greenhouse.io)."""
+from typing import List
+
+from src.extraction.document import Document
+from src.scraping.adapters.base import Adapter, ParsedJob, absolute, dedupe, first, has_class, path_company, text
+
+
+class GreenhouseAdapter(Adapter):
+    name = "greenhouse"
+    hosts = ("greenhouse.io",)
+
+    def detect(self, url: str, doc: Document) -> bool:
+        markers = f"//div[{has_class('opening')}]/a | //tr[{has_class('job-post')}]//a"
+        return self.host_matches(url) or bool(doc.root.xpath(markers))
+
+    def parse(self, url: str, doc: Document) -> List[ParsedJob]:
+        company = doc.site_name or path_company(url)
+        jobs = []
+        # Classic board: <div class="opening"><a>Title</a><span class="location">…</span></div>
+        for opening in doc.root.xpath(f"//div[{has_class('opening')}]"):
+            link = first(opening.xpath("./a[@href]"))
+            if link is None:
+                continue
+            location = first(opening.xpath(f".//*[{has_class('location')}]"))
+            jobs.append(
+                ParsedJob(
+                    url=absolute(url, link.get("href")),
+                    title=text(link),
+                    company=company,
+                    location=text(location) or None,
+                    source=self.name,
+                )
+            )
+        # Current board: <tr class="job-post"><a><p class="body--medium">Title</p>
+        # <p class="body__secondary">Location</p></a></tr>
+        for row in doc.root.xpath(f"//tr[{has_class('job-post')}]"):
+            link = first(row.xpath(".//a[@href]"))
+            if link is None:
+                continue
+            title = first(link.xpath(f".//p[{has_class('body--medium')}]"))
+            location = first(link.xpath(f".//p[{has_class('body__secondary')}]"))
+            jobs.append(
+                ParsedJob(
+                    url=absolute(url, link.get("href")),
+                    title=text(title) or text(link),
+                    company=company,
+                    location=text(location) or None,
+                    source=self.name,
+                )
+            )
+        return dedupe(jobs)
@@ -0,0 +1,20 @@
+"""schema.org ``JobPosting`` objects in ``application/ld+json`` scripts."""
+from typing import List
+
+from src.extraction.document import Document
+from src.extraction.structured import has_jsonld_posting, jsonld_jobs
+from src.scraping.adapters.base import Adapter, ParsedJob, dedupe, structured_job
+
+
+class JsonLdAdapter(Adapter):
+    name = "jsonld"
+    structured = True
+
+    def detect(self, url: str, doc: Document) -> bool:
+        return has_jsonld_posting(doc)
+
+    def parse(self, url: str, doc: Document) -> List[ParsedJob]:
+        jobs = [structured_job(url, job, self.name) for job in jsonld_jobs(doc)]
+        for job in jobs:
+            job.company = job.company or doc.site_name
+        return dedupe(jobs)
@@ -0,0 +1,34 @@
+"""Lever hosted boards (jobs.lever.co)."""
+from typing import List
+
+from src.extraction.document import Document
+from src.scraping.adapters.base import Adapter, ParsedJob, absolute, dedupe, first, has_class, path_company, text
+
+
+class LeverAdapter(Adapter):
+    name = "lever"
+    hosts = ("lever.co",)
+
+    def detect(self, url: str, doc: Document) -> bool:
+        marker = f"//div[{has_class('posting')}]//a[{has_class('posting-title')}]"
+        return self.host_matches(url) or bool(doc.root.xpath(marker))
+
+    def parse(self, url: str, doc: Document) -> List[ParsedJob]:
+        company = doc.site_name or path_company(url)
+        jobs = []
+        for posting in doc.root.xpath(f"//div[{has_class('posting')}]"):
+            link = first(posting.xpath(f".//a[{has_class('posting-title')}][@href]"), posting.xpath(".//a[@href]"))
+            if link is None:
+                continue
+            title = first(posting.xpath(".//*[@data-qa='posting-name']"), link.xpath(".//h5"))
+            location = first(posting.xpath(f".//*[{has_class('sort-by-location')} or {has_class('location')}]"))
+            jobs.append(
+                ParsedJob(
+                    url=absolute(url, link.get("href")),
+                    title=text(title) or text(link),
+                    company=company,
+                    location=text(location) or None,
+                    source=self.name,
+                )
+            )
+        return dedupe(jobs)
@@ -0,0 +1,24 @@
+"""Fallback: job-looking links on any listing page."""
+from typing import List
+
+from src.extraction.document import Document
+from src.scraping.adapters.base import Adapter, ParsedJob, absolute, dedupe, text
+from src.scraping.discovery import JOB_LINK_PATTERNS
+
+
+class JobLinksAdapter(Adapter):
+    name = "links"
+
+    def detect(self, url: str, doc: Document) -> bool:
+        return any(p.search(href) for href in doc.hrefs for p in JOB_LINK_PATTERNS)
+
+    def parse(self, url: str, doc: Document) -> List[ParsedJob]:
+        jobs = []
+        for link in doc.root.xpath("//a[@href]"):
+            if doc.in_chrome(link):
+                continue  # "Jobs" menu entries and footer links are not postings
+            href = link.get("href")
+            title = text(link)
+            if title and any(p.search(href) for p in JOB_LINK_PATTERNS):
+                jobs.append(ParsedJob(absolute(url, href), title, doc.site_name, source=self.name))
+        return dedupe(jobs)
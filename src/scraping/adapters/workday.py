@@ -0,0 +1,39 @@
+"""Workday job lists (*.myworkdayjobs.com), as rendered by the browser tier."""
+from typing import List, Optional
+from urllib.parse import urlparse
+
+from src.extraction.document import Document
+from src.scraping.adapters.base import Adapter, ParsedJob, absolute, dedupe, first, text
+
+
+def tenant(url: str) -> Optional[str]:
+    """Company slug from ``<tenant>.wd<N>.myworkdayjobs.com``."""
+    host = urlparse(url).netloc.lower()
+    return host.split(".")[0].replace("-", " ").title() if host.count(".") >= 2 else None
+
+
+class WorkdayAdapter(Adapter):
+    name = "workday"
+    hosts = ("myworkdayjobs.com", "myworkdaysite.com")
+
+    def detect(self, url: str, doc: Document) -> bool:
+        return self.host_matches(url) or bool(doc.root.xpath("//a[@data-automation-id='jobTitle']"))
+
+    def parse(self, url: str, doc: Document) -> List[ParsedJob]:
+        company = doc.site_name or (tenant(url) if self.host_matches(url) else None)
+        jobs = []
+        for link in doc.root.xpath("//a[@data-automation-id='jobTitle'][@href]"):
+            # Title link and its metadata share the closest list item
+            item = first(link.xpath("ancestor::li[1]"), [link.getparent()])
+            locations = item.xpath(".//*[@data-automation-id='locations']")
+            location = first(locations[0].xpath(".//dd") if locations else [], locations)
+            jobs.append(
+                ParsedJob(
+                    url=absolute(url, link.get("href")),
+                    title=text(link),
+                    company=company,
+                    location=text(location) or None,
+                    source=self.name,
+                )
+            )
+        return dedupe(jobs)
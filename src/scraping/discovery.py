@@ -1,7 +1,8 @@
 import re
 from typing import List
+from urllib.parse import parse_qsl, quote, urlencode, urljoin, urlsplit, urlunsplit
 
-from bs4 import BeautifulSoup
+from src.extraction.document import Document
 
 
 JOB_LINK_PATTERNS = [
@@ -10,20 +11,54 @@ JOB_LINK_PATTERNS = [
     re.compile(r"/positions/", re.IGNORECASE),
 ]
 
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = re.compile(
+    r"^(utm_\w+|gh_src|gh_jid_src|lever-source|lever-origin|source|ref|referrer|src|fbclid|gclid)$", re.I
+)
 
-def discover_job_links(html: str, base_url: str) -> List[str]:
-    soup = BeautifulSoup(html, "lxml")
+
+# Fragment that tells apart postings listed on one page without a URL of their own
+JOB_KEY_FRAGMENT = "job="
+_NON_SLUG = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def job_key_url(page_url: str, key: str) -> str:
+    """Stable URL for a posting without its own page: ``<page>#job=<id or title slug>``."""
+    slug = _NON_SLUG.sub("-", str(key).lower()).strip("-")
+    return f"{urlsplit(page_url)._replace(fragment='').geturl()}#{JOB_KEY_FRAGMENT}{quote(slug)}"
+
+
+def is_job_key(url: str) -> bool:
+    return urlsplit(url).fragment.startswith(JOB_KEY_FRAGMENT)
+
+
+def discover_job_links(html, base_url: str) -> List[str]:
+    """Job-looking links in raw HTML or an already parsed ``Document``, normalized and deduplicated."""
     links = []
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
+    for href in Document.of(html).hrefs:
         if any(p.search(href) for p in JOB_LINK_PATTERNS):
-            links.append(_resolve(base_url, href))
+            links.append(normalize_url(_resolve(base_url, href)))
     return list(dict.fromkeys(links))
 
 
+def normalize_url(url: str) -> str:
+    """Canonical form used to deduplicate job links across sources.
+
+    Lowercases scheme and host, drops default ports, fragments (except a
+    ``job_key_url`` key), tracking parameters and trailing slashes, and sorts the
+    remaining query parameters.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = parts.hostname or ""
+    if parts.port and not ((scheme == "http" and parts.port == 80) or (scheme == "https" and parts.port == 443)):
+        host = f"{host}:{parts.port}"
+    params = parse_qsl(parts.query, keep_blank_values=True)
+    query = urlencode(sorted((k, v) for k, v in params if not TRACKING_PARAMS.match(k)))
+    path = parts.path.rstrip("/") or "/"
+    fragment = parts.fragment if parts.fragment.startswith(JOB_KEY_FRAGMENT) else ""
+    return urlunsplit((scheme, host, path, query, fragment))
+
+
 def _resolve(base: str, href: str) -> str:
-    if href.startswith("http://") or href.startswith("https://"):
-        return href
-    if href.startswith("/"):
-        return base.rstrip("/") + href
-    return base.rstrip("/") + "/" + href
+    return urljoin(base, href.strip())
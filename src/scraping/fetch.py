@@ -1,13 +1,100 @@
-from typing import Optional
+import logging
+import time
+from dataclasses import dataclass
+from typing import FrozenSet, Optional, Tuple
+from urllib.parse import urlparse
 
-from playwright.async_api import Page
+from playwright.async_api import BrowserContext, Page, Route
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from src.app.config import get_settings
 
+logger = logging.getLogger(__name__)
+
+
+def _split_csv(value: str) -> Tuple[str, ...]:
+    return tuple(part.strip().lower() for part in (value or "").split(",") if part.strip())
+
+
+def _host_matches(host: str, suffixes: Tuple[str, ...]) -> bool:
+    return any(host == s or host.endswith("." + s) for s in suffixes)
+
+
+@dataclass
+class ResourcePolicy:
+    """Request-interception rules: abort heavy resource types and tracker hosts.
+
+    ``page.content()`` only needs the document and the scripts that build it, so
+    images/fonts/media/stylesheets and analytics calls are dropped by default.
+    Documents (the page being scraped, frames) and hosts in ``allow_hosts`` are
+    always let through.
+    """
+
+    block_types: FrozenSet[str]
+    block_hosts: Tuple[str, ...]
+    allow_hosts: Tuple[str, ...]
+    blocked: int = 0
+    allowed: int = 0
+
+    @classmethod
+    def from_settings(cls) -> "ResourcePolicy":
+        settings = get_settings()
+        return cls(
+            block_types=frozenset(_split_csv(settings.playwright_block_resources)),
+            block_hosts=_split_csv(settings.playwright_block_hosts),
+            allow_hosts=_split_csv(settings.playwright_allow_hosts),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.block_types or self.block_hosts)
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type == "document":
+            return False  # never abort a navigation, even to a blocked host given as a source
+        host = (urlparse(url).hostname or "").lower()
+        if _host_matches(host, self.allow_hosts):
+            return False
+        if resource_type in self.block_types:
+            return True
+        return _host_matches(host, self.block_hosts)
+
+    async def handle(self, route: Route) -> None:
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            self.blocked += 1
+            await route.abort()
+        else:
+            self.allowed += 1
+            await route.continue_()
+
+    async def install(self, context: BrowserContext) -> None:
+        if self.enabled:
+            await context.route("**/*", self.handle)
+
+
+async def wait_for_ready(page: Page) -> None:
+    """Wait according to PLAYWRIGHT_WAIT_STRATEGY; a timed-out wait still returns what loaded."""
+    settings = get_settings()
+    strategy = settings.playwright_wait_strategy.lower()
+    try:
+        if strategy == "networkidle":
+            await page.wait_for_load_state("networkidle", timeout=settings.playwright_nav_timeout_ms)
+        elif strategy == "selector" and settings.playwright_wait_selector:
+            await page.wait_for_selector(
+                settings.playwright_wait_selector, state="attached", timeout=settings.playwright_nav_timeout_ms
+            )
+        else:
+            await page.wait_for_timeout(settings.playwright_delay_ms)
+    except PlaywrightTimeoutError:
+        logger.debug("wait strategy %s timed out on %s", strategy, page.url)
+
 
 async def fetch_page(page: Page, url: str) -> Optional[str]:
     settings = get_settings()
+    started = time.perf_counter()
     await page.goto(url, wait_until="domcontentloaded", timeout=settings.playwright_nav_timeout_ms)
-    await page.wait_for_timeout(settings.playwright_delay_ms)
+    await wait_for_ready(page)
     content = await page.content()
+    logger.debug("fetched %s in %.0f ms (%s)", url, (time.perf_counter() - started) * 1000, settings.playwright_wait_strategy)
     return content
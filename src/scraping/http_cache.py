@@ -0,0 +1,163 @@
+"""On-disk response cache with conditional-GET revalidation.
+
+Each URL maps to ``<sha256>.html`` (body) and ``<sha256>.json`` (validators, content
+hash and any results derived from that exact body). Entries expire after a TTL and
+the directory is trimmed least-recently-used first once it exceeds ``max_bytes``.
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(body: str) -> str:
+    return hashlib.sha256(body.encode("utf-8", "replace")).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    content_hash: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    stored_at: float = 0.0
+    derived: Optional[Dict[str, Any]] = None
+
+
+class HttpCache:
+    def __init__(self, directory: str, max_bytes: int, ttl_seconds: int):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+    @classmethod
+    def from_settings(cls) -> Optional["HttpCache"]:
+        settings = get_settings()
+        if not settings.http_cache_enabled:
+            return None
+        return cls(
+            settings.http_cache_dir,
+            max_bytes=settings.http_cache_max_mb * 1024 * 1024,
+            ttl_seconds=settings.http_cache_ttl_hours * 3600,
+        )
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json", self.directory / f"{digest}.html"
+
+    def _write_meta(self, path: Path, entry: CacheEntry) -> None:
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(asdict(entry)), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        meta_path, body_path = self._paths(url)
+        try:
+            entry = CacheEntry(**json.loads(meta_path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError):
+            return None
+        if not body_path.exists() or time.time() - entry.stored_at > self.ttl_seconds:
+            self._remove(meta_path, body_path)
+            return None
+        return entry
+
+    def body(self, url: str) -> Optional[str]:
+        _, body_path = self._paths(url)
+        try:
+            text = body_path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        os.utime(body_path)  # LRU order follows last use, not last write
+        return text
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CacheEntry]) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if entry and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def put(self, url: str, body: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> CacheEntry:
+        """Store a fresh body; derived results survive only if the content hash is unchanged."""
+        meta_path, body_path = self._paths(url)
+        previous = self.get(url)
+        digest = content_hash(body)
+        entry = CacheEntry(
+            url=url,
+            content_hash=digest,
+            etag=etag,
+            last_modified=last_modified,
+            stored_at=time.time(),
+            derived=previous.derived if previous and previous.content_hash == digest else None,
+        )
+        body_path.write_text(body, encoding="utf-8")
+        self._write_meta(meta_path, entry)
+        return entry
+
+    def touch(self, entry: CacheEntry) -> None:
+        """Mark an entry as revalidated (e.g. after a 304)."""
+        entry.stored_at = time.time()
+        self._write_meta(self._paths(entry.url)[0], entry)
+
+    def load_derived(self, url: str, digest: str) -> Optional[Dict[str, Any]]:
+        entry = self.get(url)
+        if entry and entry.content_hash == digest:
+            return entry.derived
+        return None
+
+    def store_derived(self, url: str, digest: str, derived: Dict[str, Any]) -> None:
+        entry = self.get(url)
+        if not entry or entry.content_hash != digest:
+            return
+        entry.derived = derived
+        self._write_meta(self._paths(url)[0], entry)
+
+    def _remove(self, *paths: Path) -> None:
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def evict(self) -> int:
+        """Drop expired entries, then least-recently-used ones until under ``max_bytes``."""
+        now = time.time()
+        removed = 0
+        files = []
+        for meta_path in self.directory.glob("*.json"):
+            body_path = meta_path.with_suffix(".html")
+            try:
+                stat = body_path.stat()
+                meta_stat = meta_path.stat()
+                stored_at = json.loads(meta_path.read_text(encoding="utf-8")).get("stored_at", 0)
+            except (OSError, ValueError):
+                self._remove(meta_path, body_path)
+                removed += 1
+                continue
+            if now - stored_at > self.ttl_seconds:
+                self._remove(meta_path, body_path)
+                removed += 1
+                continue
+            files.append((stat.st_mtime, stat.st_size + meta_stat.st_size, meta_path, body_path))
+
+        total = sum(size for _, size, _, _ in files)
+        for _, size, meta_path, body_path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            self._remove(meta_path, body_path)
+            total -= size
+            removed += 1
+        if removed:
+            logger.info(f"HTTP cache evicted {removed} entries")
+        return removed
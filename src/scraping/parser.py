@@ -1,9 +1,47 @@
+import logging
+from typing import List, Optional
+
+from src.extraction.document import Document
+from src.extraction.structured import VIA_DOM, ExtractionStats
+from src.scraping.adapters import DEFAULT_ADAPTERS, Adapter, ParsedJob
+
+logger = logging.getLogger(__name__)
+
+
 class JobParser:
-    """Placeholder parser that should extract jobs from HTML content.
-    Currently returns an empty list; extend with real parsing logic as needed.
-    Each returned job object should have 'title' and 'company' attributes for logging.
+    """Extracts jobs from an already fetched page through a registry of adapters.
+
+    Adapters are tried in order; the first one that detects the page and yields
+    jobs wins, so one listing-page fetch produces every job on it. Each returned
+    ``ParsedJob`` has ``url``, ``title``, ``company`` and ``location`` attributes.
+    ``stats`` tracks per source how often structured data (JSON-LD, embedded JSON)
+    answered without a DOM walk.
     """
 
-    def parse(self, html: str, url: str):
-        # TODO: implement real parsing logic
+    def __init__(self, adapters: Optional[List[Adapter]] = None):
+        self.adapters: List[Adapter] = list(DEFAULT_ADAPTERS if adapters is None else adapters)
+        self.stats = ExtractionStats()
+
+    def register(self, adapter: Adapter, first: bool = True) -> None:
+        """Add a site-specific adapter, ahead of the built-in ones by default."""
+        if first:
+            self.adapters.insert(0, adapter)
+        else:
+            self.adapters.append(adapter)
+
+    def parse(self, html, url: str) -> List[ParsedJob]:
+        doc = Document.of(html)
+        for adapter in self.adapters:
+            if not adapter.detect(url, doc):
+                continue
+            try:
+                jobs = adapter.parse(url, doc)
+            except Exception as e:
+                logger.warning(f"⚠️ Adapter {adapter.name} failed on {url}: {e}")
+                continue
+            if jobs:
+                self.stats.record(url, adapter.name, adapter.structured)
+                logger.debug(f"[PARSE] {adapter.name}: {len(jobs)} jobs on {url}")
+                return jobs
+        self.stats.record(url, VIA_DOM, False)
         return []
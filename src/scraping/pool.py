@@ -0,0 +1,99 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from playwright.async_api import Browser, BrowserContext, Page
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PooledPage:
+    context: BrowserContext
+    page: Page
+    uses: int = 0
+    broken: bool = False
+
+
+class PagePool:
+    """Fixed-size pool of warm browser contexts, one page each.
+
+    A slot is recycled (context closed and rebuilt) once it has served ``max_uses``
+    navigations, when its page crashed or was closed, or when a fetch on it raised.
+    """
+
+    def __init__(
+        self,
+        browser: Browser,
+        size: int,
+        max_uses: int,
+        context_options: Optional[dict] = None,
+        context_setup: Optional[Callable[[BrowserContext], Awaitable[None]]] = None,
+    ):
+        self.browser = browser
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self.context_options = context_options or {}
+        self.context_setup = context_setup
+        self._idle: asyncio.Queue[PooledPage] = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.size)
+        self._live: list[PooledPage] = []
+        self.created = 0
+        self.recycled = 0
+
+    async def _create(self) -> PooledPage:
+        context = await self.browser.new_context(**self.context_options)
+        if self.context_setup:
+            await self.context_setup(context)
+        page = await context.new_page()
+        slot = PooledPage(context=context, page=page)
+        page.on("crash", lambda _page: setattr(slot, "broken", True))
+        self._live.append(slot)
+        self.created += 1
+        return slot
+
+    async def _dispose(self, slot: PooledPage) -> None:
+        if slot in self._live:
+            self._live.remove(slot)
+        try:
+            await slot.context.close()
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("closing pooled context failed: %s", exc)
+
+    async def _healthy(self, slot: PooledPage) -> bool:
+        if slot.broken or slot.uses >= self.max_uses or slot.page.is_closed():
+            return False
+        try:
+            await slot.page.evaluate("1")
+        except Exception:  # noqa: BLE001
+            return False
+        return True
+
+    async def _checkout(self) -> PooledPage:
+        while not self._idle.empty():
+            slot = self._idle.get_nowait()
+            if await self._healthy(slot):
+                return slot
+            self.recycled += 1
+            await self._dispose(slot)
+        return await self._create()
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        async with self._slots:
+            slot = await self._checkout()
+            slot.uses += 1
+            try:
+                yield slot.page
+            except BaseException:
+                slot.broken = True
+                raise
+            finally:
+                self._idle.put_nowait(slot)
+
+    async def close(self) -> None:
+        for slot in list(self._live):
+            await self._dispose(slot)
+        self._idle = asyncio.Queue()
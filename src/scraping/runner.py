@@ -1,11 +1,18 @@
 import asyncio
+import logging
 import threading
+import time
 import traceback
-from typing import Callable, Iterable, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
 
 from playwright.async_api import Browser, Page, async_playwright
 
 from src.app.config import get_settings
+from src.scraping.fetch import ResourcePolicy, fetch_page
+from src.scraping.pool import PagePool
+
+logger = logging.getLogger(__name__)
 
 
 class BrowserManager:
@@ -15,7 +22,11 @@ class BrowserManager:
         self.settings = get_settings()
         self.playwright = None
         self.browser = None
-        
+        self.pool: Optional[PagePool] = None
+        self.policy = ResourcePolicy.from_settings()
+        self.fetch_count = 0
+        self.fetch_seconds = 0.0
+
     async def __aenter__(self):
         print(f"DEBUG: [TID: {threading.get_ident()}] BrowserManager entering context...", flush=True)
         self.playwright = await async_playwright().start()
@@ -23,39 +34,60 @@ class BrowserManager:
         print(f"DEBUG: Launching Browser (Persistent Instance)...", flush=True)
         self.browser = await browser_type.launch(headless=True)
         print("DEBUG: Browser launched successfully.", flush=True)
+        self.pool = PagePool(
+            self.browser,
+            size=self.settings.playwright_pool_size or self.settings.concurrency_global,
+            max_uses=self.settings.playwright_page_max_uses,
+            context_options=self._context_options(),
+            context_setup=self.policy.install,
+        )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         print("DEBUG: BrowserManager exiting context...", flush=True)
+        if self.pool:
+            logger.info("Page pool created=%d recycled=%d", self.pool.created, self.pool.recycled)
+            avg_ms = (self.fetch_seconds / self.fetch_count * 1000) if self.fetch_count else 0.0
+            logger.info(
+                "%d browser fetches, avg %.0f ms/page (wait=%s, blocked=%d, allowed=%d)",
+                self.fetch_count,
+                avg_ms,
+                self.settings.playwright_wait_strategy,
+                self.policy.blocked,
+                self.policy.allowed,
+            )
+            await self.pool.close()
         if self.browser:
             await self.browser.close()
         if self.playwright:
             await self.playwright.stop()
         print("DEBUG: Browser closed.", flush=True)
 
+    def _context_options(self) -> dict:
+        options: dict = {}
+        if self.settings.user_agent_override:
+            options["user_agent"] = self.settings.user_agent_override
+        return options
+
     async def fetch_html(self, url: str) -> Optional[str]:
         """
-        Fetch HTML for a single URL using the persistent browser instance.
-        Includes explicit yielding to event loop to prevent starvation.
+        Fetch HTML for a single URL on a warm page borrowed from the pool.
+        A failed navigation marks the page for recycling before it is reused.
         """
-        if not self.browser:
+        if not self.browser or not self.pool:
             raise RuntimeError("Browser not initialized. Use 'async with BrowserManager()'.")
 
         print(f"DEBUG: Fetching URL: {url}", flush=True)
-        page = await self.browser.new_page()
+        started = time.perf_counter()
         try:
-            # User requested explicit timeout check
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await page.wait_for_timeout(self.settings.playwright_delay_ms)
-            html = await page.content()
-            return html
+            async with self.pool.page() as page:
+                return await fetch_page(page, url)
         except Exception as e:
             print(f"Error scraping {url}: {e}", flush=True)
             return None
         finally:
-            await page.close()
-            # CRITICAL: Sleep to let SSE Heartbeat run - Increased to 1.5s per user request
-            await asyncio.sleep(1.5)
+            self.fetch_count += 1
+            self.fetch_seconds += time.perf_counter() - started
 
 
 
@@ -77,18 +109,58 @@ async def fetch_html(url: str) -> Optional[str]:
 
 
 def rate_limiter(delay_ms: int):
+    """Space out call *starts* by ``delay_ms``; the calls themselves may overlap."""
     lock = asyncio.Lock()
 
     async def _wrap(coro: Callable[[], asyncio.Future]):
         async with lock:
             await asyncio.sleep(delay_ms / 1000)
-            return await coro()
+        return await coro()
 
     return _wrap
 
 
+def domain_of(url: str) -> str:
+    return (urlparse(url).hostname or "").lower()
+
+
+class DomainLimiter:
+    """Per-domain concurrency cap plus a polite delay between requests to the same host.
+
+    Different domains never wait on each other; the global cap is applied separately
+    (see ``bounded_map``). Callers holding a global slot should check ``saturated``
+    first and set the work aside rather than wait here with the slot taken.
+    """
+
+    def __init__(self, per_domain: int, delay_ms: int):
+        self.per_domain = max(1, per_domain)
+        self.delay_ms = max(0, delay_ms)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._limiters: Dict[str, Callable] = {}
+
+    @classmethod
+    def from_settings(cls) -> "DomainLimiter":
+        settings = get_settings()
+        rate = settings.playwright_rate_limit_per_domain
+        delay_ms = int(1000 / rate) if rate > 0 else 0
+        return cls(settings.concurrency_per_domain, delay_ms)
+
+    def saturated(self, url: str) -> bool:
+        """True when ``run`` for this URL would have to wait for a per-domain slot."""
+        semaphore = self._semaphores.get(domain_of(url))
+        return semaphore is not None and semaphore.locked()
+
+    async def run(self, url: str, fn: Callable[[], asyncio.Future]):
+        domain = domain_of(url)
+        semaphore = self._semaphores.setdefault(domain, asyncio.Semaphore(self.per_domain))
+        limiter = self._limiters.setdefault(domain, rate_limiter(self.delay_ms))
+        async with semaphore:
+            return await limiter(fn)
+
+
 async def bounded_map(concurrency: int, items: Iterable, fn: Callable[[any], asyncio.Future]) -> List:
-    semaphore = asyncio.Semaphore(concurrency)
+    """Run ``fn`` over ``items`` with at most ``concurrency`` in flight; results keep input order."""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
     results = []
 
     async def _run(item):
@@ -96,6 +168,11 @@ async def bounded_map(concurrency: int, items: Iterable, fn: Callable[[any], asy
             return await fn(item)
 
     tasks = [asyncio.create_task(_run(item)) for item in items]
-    for t in tasks:
-        results.append(await t)
+    try:
+        for t in tasks:
+            results.append(await t)
+    finally:
+        for t in tasks:
+            if not t.done():
+                t.cancel()
     return results
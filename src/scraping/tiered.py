@@ -0,0 +1,185 @@
+"""Tiered fetching: a pooled plain-HTTP GET first, headless Chromium only when needed."""
+import asyncio
+import logging
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import httpx
+
+from src.app.config import get_settings
+from src.extraction.document import Document
+from src.extraction.structured import has_jsonld_posting, structured_jobs
+from src.scraping.discovery import discover_job_links
+from src.scraping.http_cache import HttpCache, content_hash
+from src.scraping.runner import BrowserManager, domain_of
+
+logger = logging.getLogger(__name__)
+
+TIER_HTTP = "http"
+TIER_BROWSER = "browser"
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+)
+
+# SPA mount points rendered empty on the server (React/Next/Vue/Nuxt/Angular)
+_EMPTY_APP_ROOT = re.compile(
+    r"<(div|app-root)[^>]*\bid=[\"']?(root|app|__next|__nuxt|main-app)[\"']?[^>]*>\s*</\1>", re.I
+)
+_JS_REQUIRED = re.compile(r"(enable|requires?|turn on) javascript|javascript (is )?(disabled|required)", re.I)
+
+
+def looks_usable(doc: Document, url: str, min_text_chars: int) -> bool:
+    """True when a server-rendered page is good enough to skip the browser.
+
+    Job links and structured job data (JSON-LD ``JobPosting``, hydration state) are
+    the strongest signals; otherwise require enough visible text and no sign of a
+    client-side-only shell. Works on the ``Document`` extraction reuses.
+    """
+    if discover_job_links(doc, url) or has_jsonld_posting(doc) or structured_jobs(doc)[0]:
+        return True
+    text = doc.text()
+    if len(text) < min_text_chars or _JS_REQUIRED.search(text[:2000]):
+        return False
+    return not _EMPTY_APP_ROOT.search(doc.html)
+
+
+@dataclass
+class FetchResult:
+    url: str
+    html: Optional[str]
+    tier: Optional[str] = None
+    status: Optional[int] = None
+    content_hash: Optional[str] = None
+    not_modified: bool = False  # body identical to the cached copy (304 or same hash)
+    document: Optional[Document] = None  # parsed by the HTTP tier's usability check
+
+
+class TieredFetcher:
+    """Fetch via a shared ``httpx.AsyncClient`` and fall back to ``BrowserManager``.
+
+    ``preferred`` maps domain -> tier from earlier runs; domains known to need the
+    browser skip the HTTP attempt. Chromium is launched lazily on first fallback, so
+    runs over purely static sites never start it. Tiers decided during this run are
+    exposed via ``learned`` for persistence.
+
+    With an ``HttpCache`` the HTTP tier sends If-None-Match / If-Modified-Since and
+    every tier reports whether the body changed since the cached copy.
+    """
+
+    def __init__(self, preferred: Optional[Dict[str, str]] = None, cache: Optional[HttpCache] = None):
+        self.settings = get_settings()
+        self.cache = cache
+        self.preferred: Dict[str, str] = dict(preferred or {})
+        self.learned: Dict[str, str] = {}
+        self.counts: Counter = Counter()
+        self.client: Optional[httpx.AsyncClient] = None
+        self._browser: Optional[BrowserManager] = None
+        self._browser_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        workers = max(1, self.settings.concurrency_global)
+        self.client = httpx.AsyncClient(
+            follow_redirects=True,
+            timeout=self.settings.fetch_http_timeout_seconds,
+            limits=httpx.Limits(max_connections=workers * 2, max_keepalive_connections=workers),
+            headers={
+                "User-Agent": self.settings.user_agent_override or DEFAULT_USER_AGENT,
+                "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+            },
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.client:
+            await self.client.aclose()
+        if self._browser:
+            await self._browser.__aexit__(exc_type, exc_val, exc_tb)
+        if self.cache:
+            await asyncio.to_thread(self.cache.evict)
+        logger.info(f"Fetch tiers used: {dict(self.counts)}")
+
+    async def _browser_manager(self) -> BrowserManager:
+        async with self._browser_lock:
+            if self._browser is None:
+                browser = BrowserManager()
+                await browser.__aenter__()
+                self._browser = browser
+        return self._browser
+
+    def _remember(self, domain: str, tier: str) -> None:
+        self.counts[tier] += 1
+        if self.preferred.get(domain) != tier:
+            self.learned[domain] = tier
+        self.preferred[domain] = tier
+
+    async def _from_cache(self, url: str, tier: str, status: Optional[int] = None) -> Optional[FetchResult]:
+        entry = await asyncio.to_thread(self.cache.get, url)
+        if not entry:
+            return None
+        body = await asyncio.to_thread(self.cache.body, url)
+        if body is None:
+            return None
+        if status == 304:
+            await asyncio.to_thread(self.cache.touch, entry)
+        return FetchResult(url, body, tier, status, content_hash=entry.content_hash, not_modified=True)
+
+    async def _store(self, result: FetchResult, etag: Optional[str] = None, last_modified: Optional[str] = None) -> FetchResult:
+        if not self.cache:
+            result.content_hash = content_hash(result.html)
+            return result
+        previous = await asyncio.to_thread(self.cache.get, result.url)
+        entry = await asyncio.to_thread(self.cache.put, result.url, result.html, etag, last_modified)
+        result.content_hash = entry.content_hash
+        result.not_modified = bool(previous and previous.content_hash == entry.content_hash)
+        return result
+
+    async def _fetch_http(self, url: str) -> FetchResult:
+        """HTTP tier; ``html`` is ``None`` unless the page is usable without a browser."""
+        entry = await asyncio.to_thread(self.cache.get, url) if self.cache else None
+        try:
+            resp = await self.client.get(url, headers=HttpCache.conditional_headers(entry))
+        except httpx.HTTPError as exc:
+            logger.debug("HTTP tier failed for %s: %s", url, exc)
+            return FetchResult(url=url, html=None)
+        if resp.status_code == 304 and entry:
+            cached = await self._from_cache(url, TIER_HTTP, status=304)
+            if cached:
+                self.counts["not_modified"] += 1
+                return cached
+        content_type = resp.headers.get("content-type", "")
+        if resp.status_code >= 400 or "html" not in content_type.lower():
+            return FetchResult(url=url, html=None, status=resp.status_code)
+        doc = await asyncio.to_thread(Document, resp.text)
+        if not await asyncio.to_thread(looks_usable, doc, url, self.settings.fetch_min_text_chars):
+            # Not cached: the browser fallback stores the rendered page, and its derived
+            # results, under this URL instead
+            return FetchResult(url=url, html=None, status=resp.status_code)
+        result = FetchResult(url=url, html=resp.text, tier=TIER_HTTP, status=resp.status_code, document=doc)
+        return await self._store(result, resp.headers.get("etag"), resp.headers.get("last-modified"))
+
+    async def fetch(self, url: str, fresh: bool = False) -> FetchResult:
+        """Fetch ``url``; ``fresh=True`` serves a cached copy without touching the network."""
+        domain = domain_of(url)
+        if fresh and self.cache:
+            cached = await self._from_cache(url, self.preferred.get(domain, TIER_HTTP))
+            if cached:
+                self.counts["fresh"] += 1
+                return cached
+
+        if self.settings.fetch_http_first and self.preferred.get(domain) != TIER_BROWSER:
+            result = await self._fetch_http(url)
+            if result.html:
+                self._remember(domain, TIER_HTTP)
+                return result
+
+        browser = await self._browser_manager()
+        html = await browser.fetch_html(url)
+        if not html:
+            self.counts["failed"] += 1
+            return FetchResult(url=url, html=None)
+        self._remember(domain, TIER_BROWSER)
+        return await self._store(FetchResult(url=url, html=html, tier=TIER_BROWSER))
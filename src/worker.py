@@ -0,0 +1,138 @@
+"""Pipeline worker processes that drain the DB-backed run queue.
+
+Usage:
+    python -m src.worker --role fetch       # fetch + extract, checkpoint "fetched"
+    python -m src.worker --role classify    # classify + filter + store + send
+    python -m src.worker --role all         # both, in one process
+
+With ``WORKER_MODE=workers`` the API process only queues runs and reports their
+progress; any number of workers per role can run next to it (tasks are claimed
+with a lease, see ``CrawlTaskRepository.claim``). Fetch workers own Chromium and
+never load the model; classify workers own the model and never fetch.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import signal
+import time
+from typing import Optional
+
+from src.app.config import get_settings
+from src.app.service.pipeline import CLAIMABLE, Pipeline, worker_id
+from src.app.service.run_manager import RunManager, RunSink
+from src.db.repository import CrawlTaskRepository, FetchProfileRepository, RunRepository
+from src.db.session import dispose_engines, init_db, run_db
+from src.events.publisher import EventPublisher
+from src.nlp.batching import get_micro_batcher
+from src.nlp.executor import get_inference_executor
+from src.outbound.dispatcher import close_dispatchers
+from src.scraping.http_cache import HttpCache
+from src.scraping.tiered import TieredFetcher
+
+logger = logging.getLogger(__name__)
+
+# A worker keeps one fetcher (and HTTP cache) for its lifetime; the cache is trimmed this
+# often while it runs and once more on shutdown
+CACHE_EVICT_SECONDS = 3600
+
+ROLE_STATES = {
+    "fetch": (CrawlTaskRepository.PENDING, CrawlTaskRepository.FAILED),
+    "classify": (CrawlTaskRepository.FETCHED, CrawlTaskRepository.CLASSIFIED),
+    "all": CLAIMABLE,
+}
+
+
+class Worker:
+    def __init__(self, role: str):
+        self.role = role
+        self.states = ROLE_STATES[role]
+        self.id = f"{role}@{worker_id()}"
+        # Progress rows and outbound attempts go to the DB; the API streams them
+        self.manager = RunManager(EventPublisher())
+        self.pipeline = Pipeline(self.manager)
+        self.stopping = asyncio.Event()
+        self.fetcher: Optional[TieredFetcher] = None
+        self._evicted_at = time.monotonic()
+
+    async def run_once(self) -> int:
+        """Process one batch of every run with claimable work; returns the number of runs touched."""
+        settings = get_settings()
+        run_ids = await run_db(
+            lambda s: CrawlTaskRepository(s).claimable_runs(
+                self.states, settings.task_lease_seconds, settings.task_max_attempts
+            )
+        )
+        for run_id in run_ids:
+            if self.stopping.is_set():
+                break
+            try:
+                run = await run_db(lambda s: RunRepository(s).get(run_id))
+                config = json.loads(run.config_json or "{}") if run else {}
+                await self.pipeline.work(
+                    run_id,
+                    self.id,
+                    self.states,
+                    sink=RunSink(self.manager, run_id, config),
+                    incremental=config.get("incremental"),
+                    limit=settings.worker_batch_size,
+                    hand_off=self.role == "fetch",
+                    fetcher=self.fetcher,
+                )
+                await self.manager.event_writer.flush()
+            except Exception:  # noqa: BLE001 - one broken run must not take the worker down
+                logger.exception(f"❌ Worker {self.id} failed on run {run_id}")
+        return len(run_ids)
+
+    async def _evict_cache(self) -> None:
+        if self.fetcher and self.fetcher.cache and time.monotonic() - self._evicted_at >= CACHE_EVICT_SECONDS:
+            await asyncio.to_thread(self.fetcher.cache.evict)
+            self._evicted_at = time.monotonic()
+
+    async def serve(self) -> None:
+        settings = get_settings()
+        logger.info(f"👷 Worker {self.id} polling for {', '.join(self.states)} tasks")
+        while not self.stopping.is_set():
+            await self._evict_cache()
+            if not await self.run_once():
+                try:
+                    await asyncio.wait_for(self.stopping.wait(), settings.worker_poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+
+
+async def main(role: str, once: bool) -> None:
+    init_db()
+    worker = Worker(role)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        # Finish the current batch, then exit; unfinished claims are released by the pipeline
+        loop.add_signal_handler(sig, worker.stopping.set)
+    settings = get_settings()
+    preferred = await run_db(lambda s: FetchProfileRepository(s).preferred_tiers(settings.fetch_tier_ttl_days))
+    try:
+        # Entered once: the HTTP client, Chromium and the cache outlive every batch
+        async with TieredFetcher(preferred, cache=HttpCache.from_settings()) as worker.fetcher:
+            if once:
+                await worker.run_once()
+            else:
+                await worker.serve()
+    finally:
+        await worker.manager.event_writer.flush()
+        if get_micro_batcher.cache_info().currsize:
+            await get_micro_batcher().close()
+        if get_inference_executor.cache_info().currsize:
+            get_inference_executor().shutdown()
+        await close_dispatchers()
+        await dispose_engines()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--role", choices=sorted(ROLE_STATES), required=True)
+    parser.add_argument("--once", action="store_true", help="process one batch per run and exit")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s - %(message)s")
+    asyncio.run(main(args.role, args.once))
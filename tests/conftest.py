@@ -0,0 +1,14 @@
+import pytest
+from sqlmodel import Session, create_engine
+
+from src.db.session import init_db
+
+
+@pytest.fixture
+def session(tmp_path):
+    """A session on a fresh SQLite file with the app's schema and migrations."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}", connect_args={"check_same_thread": False})
+    init_db(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
@@ -0,0 +1,109 @@
+import datetime as dt
+
+from sqlmodel import select
+
+from src.db.models import CrawlTask
+from src.db.repository import CrawlTaskRepository
+
+PENDING = CrawlTaskRepository.PENDING
+
+
+def _enqueue(repo, run_id="r1", count=3, **kwargs):
+    tasks = [CrawlTask(run_id=run_id, url=f"https://example.com/{i}", ordinal=i) for i in range(count)]
+    return repo.enqueue(tasks, **kwargs)
+
+
+def _task(session, task_id) -> CrawlTask:
+    session.expire_all()
+    return session.exec(select(CrawlTask).where(CrawlTask.id == task_id)).one()
+
+
+def test_enqueue_skips_known_urls(session):
+    repo = CrawlTaskRepository(session)
+    assert len(_enqueue(repo)) == 3
+    assert _enqueue(repo, count=4)[0].url == "https://example.com/3"
+    assert repo.counts("r1") == {PENDING: 4}
+
+
+def test_claim_is_exclusive_until_the_lease_expires(session):
+    repo = CrawlTaskRepository(session)
+    _enqueue(repo)
+    first = repo.claim("r1", "w1", [PENDING], limit=2)
+    assert [t.ordinal for t in first] == [0, 1]
+    assert [t.ordinal for t in repo.claim("r1", "w2", [PENDING])] == [2]
+    assert repo.claim("r1", "w3", [PENDING]) == []
+
+    # An expired lease lets another worker take the task over
+    stale = dt.datetime.utcnow() - dt.timedelta(seconds=600)
+    task = _task(session, first[0].id)
+    task.claimed_at = stale
+    session.add(task)
+    session.commit()
+    taken = repo.claim("r1", "w3", [PENDING], lease_seconds=300)
+    assert [(t.id, t.claimed_by) for t in taken] == [(first[0].id, "w3")]
+
+
+def test_enqueue_can_hand_tasks_to_the_caller(session):
+    repo = CrawlTaskRepository(session)
+    _enqueue(repo, claimed_by="w1")
+    assert repo.claim("r1", "w2", [PENDING]) == []
+
+
+def test_advance_releases_or_keeps_the_claim(session):
+    repo = CrawlTaskRepository(session)
+    _enqueue(repo, count=2)
+    handed, kept = repo.claim("r1", "w1", [PENDING])
+
+    repo.advance(handed.id, CrawlTaskRepository.FETCHED, payload={"html": "<p>"})
+    task = _task(session, handed.id)
+    assert (task.state, task.claimed_by, task.payload_json) == ("fetched", None, '{"html": "<p>"}')
+
+    repo.advance(kept.id, CrawlTaskRepository.CLASSIFIED, payload={"jobs": []}, keep_claim=True)
+    task = _task(session, kept.id)
+    assert (task.state, task.claimed_by) == ("classified", "w1")
+    assert repo.claim("r1", "w2", [CrawlTaskRepository.CLASSIFIED]) == []
+
+    repo.advance(kept.id, CrawlTaskRepository.SENT)
+    task = _task(session, kept.id)
+    assert (task.state, task.claimed_by, task.payload_json) == ("sent", None, None)
+
+
+def test_release_counts_attempts_until_failed(session):
+    repo = CrawlTaskRepository(session)
+    _enqueue(repo, count=2)
+    for attempt in range(1, 3):
+        broken, other = repo.claim("r1", "w1", [PENDING])
+        repo.release("r1", "w1", errors={broken.id: "boom"}, max_attempts=2)
+        task = _task(session, broken.id)
+        assert (task.attempts, task.last_error, task.claimed_by) == (attempt, "boom", None)
+        # The untouched task is back in the queue without an attempt
+        assert _task(session, other.id).claimed_by is None
+        assert _task(session, other.id).attempts == 0
+
+    assert _task(session, broken.id).state == CrawlTaskRepository.FAILED
+    assert [t.id for t in repo.claim("r1", "w1", [PENDING], max_attempts=2)] == [other.id]
+    assert repo.remaining("r1", max_attempts=2) == 1
+
+
+def test_release_only_touches_the_given_worker(session):
+    repo = CrawlTaskRepository(session)
+    _enqueue(repo, count=2)
+    mine = repo.claim("r1", "w1", [PENDING], limit=1)[0]
+    theirs = repo.claim("r1", "w2", [PENDING], limit=1)[0]
+    repo.release("r1", "w1")
+    assert _task(session, mine.id).claimed_by is None
+    assert _task(session, theirs.id).claimed_by == "w2"
+
+    # Resuming a run releases every claim on it
+    repo.release("r1")
+    assert _task(session, theirs.id).claimed_by is None
+
+
+def test_remaining_ignores_sent_and_exhausted_tasks(session):
+    repo = CrawlTaskRepository(session)
+    sent, failed, _ = _enqueue(repo)
+    repo.advance(sent.id, CrawlTaskRepository.SENT)
+    for _ in range(3):
+        repo.advance(failed.id, CrawlTaskRepository.FAILED, error="gone")
+    assert repo.remaining("r1", max_attempts=3) == 1
+    assert repo.counts("r1") == {PENDING: 1, "sent": 1, "failed": 1}
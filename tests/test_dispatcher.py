@@ -0,0 +1,108 @@
+import json
+
+import httpx
+import pytest
+
+from src.app.config import Settings
+from src.outbound.base import FAILED, SENT, SendResult
+from src.outbound.dispatcher import OutboundDispatcher, idempotency_key
+from src.outbound.http_client import IDEMPOTENCY_HEADER, HttpBase44Client, retry_after_seconds
+
+JOBS = [{"url": f"https://example.com/{i}", "title": f"Job {i}"} for i in range(5)]
+
+
+class RecordingClient(HttpBase44Client):
+    """Real client over an ``httpx.MockTransport``; backoff delays are recorded, not slept."""
+
+    def __init__(self, handler, **settings):
+        super().__init__(Settings(BASE44_ENDPOINT="https://base44.test/jobs", BASE44_RETRIES=3, **settings))
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        self.delays = []
+
+    def _backoff(self, attempt, retry_after):
+        self.delays.append(retry_after)
+        return 0
+
+
+def test_idempotency_key_is_stable_per_run_and_url():
+    key = idempotency_key("r1", "https://example.com/1")
+    assert key == idempotency_key("r1", "https://example.com/1")
+    assert key != idempotency_key("r2", "https://example.com/1")
+    assert key != idempotency_key("r1", "https://example.com/2")
+
+
+def test_retry_after_parsing():
+    assert retry_after_seconds("12") == 12.0
+    assert retry_after_seconds(None) is None
+    assert retry_after_seconds("soon") is None
+    assert retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_backoff_honours_retry_after_up_to_the_cap():
+    client = HttpBase44Client(Settings(BASE44_BACKOFF_MAX_SECONDS=30, BASE44_BACKOFF_BASE_SECONDS=1))
+    assert client._backoff(0, 5) == 5
+    assert client._backoff(0, 120) == 30
+    assert 0 <= client._backoff(10, None) <= 30
+
+
+@pytest.mark.asyncio
+async def test_send_keeps_job_order_and_keys():
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers[IDEMPOTENCY_HEADER])
+        status = 422 if json.loads(request.content)["url"].endswith("/3") else 201
+        return httpx.Response(status)
+
+    dispatcher = OutboundDispatcher(RecordingClient(handler), concurrency=2)
+    results = await dispatcher.send("r1", JOBS)
+    assert [r.status for r in results] == [SENT, SENT, SENT, FAILED, SENT]
+    assert sorted(seen) == sorted(idempotency_key("r1", job["url"]) for job in JOBS)
+    await dispatcher.close()
+
+
+@pytest.mark.asyncio
+async def test_throttled_send_retries_after_the_server_delay():
+    statuses = iter([429, 503, 200])
+
+    def handler(request):
+        status = next(statuses)
+        return httpx.Response(status, headers={"Retry-After": "7"} if status == 429 else {})
+
+    client = RecordingClient(handler)
+    result = await client.send_job({"url": JOBS[0]["url"]}, "key")
+    assert (result.status, result.response_status) == (SENT, 200)
+    assert client.delays == [7.0, None]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_batches_pair_results_with_jobs():
+    bodies = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        bodies.append(body)
+        results = [{"status": 409 if job["url"].endswith("/1") else 201} for job in body["jobs"]]
+        return httpx.Response(200, json={"results": results})
+
+    client = RecordingClient(handler, BASE44_BATCH_ENDPOINT="https://base44.test/batch")
+    dispatcher = OutboundDispatcher(client, concurrency=2, batch_size=2)
+    results = await dispatcher.send("r1", JOBS)
+    assert [len(body["jobs"]) for body in bodies] == [2, 2, 1]
+    assert [r.status for r in results] == [SENT, FAILED, SENT, SENT, SENT]
+    assert results[1].response_status == 409
+    sent_keys = [job["idempotency_key"] for body in bodies for job in body["jobs"]]
+    assert sorted(sent_keys) == sorted(idempotency_key("r1", job["url"]) for job in JOBS)
+    await dispatcher.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_outcome_applies_to_all_jobs_without_per_job_results():
+    client = RecordingClient(
+        lambda request: httpx.Response(400, text="bad batch"),
+        BASE44_BATCH_ENDPOINT="https://base44.test/batch",
+    )
+    results = await client.send_batch([{"url": "a"}, {"url": "b"}], ["ka", "kb"])
+    assert results == [SendResult(FAILED, 400, "bad batch")] * 2
+    await client.close()
@@ -0,0 +1,38 @@
+from sqlmodel import select
+
+from src.db.models import Job
+from src.db.repository import JobRepository
+
+
+def test_bulk_upsert_updates_on_conflict(session):
+    repo = JobRepository(session)
+    assert repo.bulk_upsert(
+        [
+            Job(run_id="r1", url="https://example.com/1", title="Backend", passed_filter=False),
+            Job(run_id="r1", url="https://example.com/2", title="Frontend"),
+            Job(run_id="r2", url="https://example.com/1", title="Backend"),
+        ]
+    ) == 3
+    first_id = session.exec(select(Job.id).where(Job.run_id == "r1", Job.url == "https://example.com/1")).one()
+
+    # The same (run_id, url) is updated in place; jobs without a URL are skipped
+    assert repo.bulk_upsert(
+        [
+            Job(run_id="r1", url="https://example.com/1", title="Backend Engineer", score=0.8, passed_filter=True),
+            Job(run_id="r1", url="", title="No link"),
+        ]
+    ) == 1
+    session.expire_all()
+    jobs = session.exec(select(Job).order_by(Job.run_id, Job.url)).all()
+    assert len(jobs) == 3
+    updated = jobs[0]
+    assert (updated.id, updated.title, updated.score, updated.passed_filter) == (first_id, "Backend Engineer", 0.8, True)
+    assert [job.title for job in repo.list_passed("r1")] == ["Backend Engineer"]
+    assert jobs[2].title == "Backend"  # other run untouched
+
+
+def test_bulk_upsert_without_commit_leaves_it_to_the_caller(session):
+    repo = JobRepository(session)
+    repo.bulk_upsert([Job(run_id="r1", url="https://example.com/1")], commit=False)
+    session.rollback()
+    assert session.exec(select(Job)).all() == []